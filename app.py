@@ -1,8 +1,16 @@
-from flask import Flask, request, jsonify, abort, send_from_directory
+from flask import Flask, Response, request, abort, send_from_directory
+from collections import OrderedDict
 from pathlib import Path
-import json
+import gzip
+import hashlib
+import os
+import threading
+import time
 
 from build_bill_web import DATA_DIR, WEB_DIR  # WEB_DIR points to data/web
+from build_vote_web import WEB_INDEX_PATH  # data/web/_index.json
+import jsonio
+from json_stream import load_section
 
 ROOT = Path(__file__).resolve().parent
 
@@ -11,22 +19,121 @@ app = Flask(__name__, static_folder=str(ROOT), static_url_path="")
 
 # --- helper: find an existing graph file in data/web ------------------------
 
-def find_graph_file(chamber: str, roll: str) -> Path | None:
+# How often (seconds) to stat _index.json for a rebuild; lookups in between
+# never touch the filesystem.
+INDEX_CHECK_SECONDS = 2.0
+
+
+def _number(value) -> int:
+    digits = "".join(ch for ch in str(value or "") if ch.isdigit())
+    return int(digits) if digits else 0
+
+
+def _session_num(session) -> int:
+    """1 or 2 for "1st"/"2nd" or a year ("2025" -> 1), 0 when unknown."""
+    num = _number(session)
+    # GovTrack-only graphs carry the calendar year as their session
+    return (num - 1789) % 2 + 1 if num >= 1789 else num
+
+
+def _graph_rank(congress, session) -> tuple:
+    """Sort key for graphs of one roll: newest congress, then session, first."""
+    return (_number(congress), _session_num(session))
+
+
+def _rank_matches(rank: tuple, congress: str, session: str) -> bool:
+    return (not congress or rank[0] == _number(congress)) and (not session or rank[1] == _session_num(session))
+
+
+class GraphIndex:
+    """
+    In-memory copy of data/web/_index.json (written by build_vote_web.py):
+    (chamber, roll) -> graph paths, newest congress/session first, and
+    vote id -> path. Reloaded when the file's mtime changes.
+    """
+
+    def __init__(self, path: Path):
+        self.path = path
+        self._lock = threading.Lock()
+        self._mtime = None
+        self._checked = 0.0
+        self._by_roll = {}
+        self._by_id = {}
+
+    def _load(self) -> None:
+        by_roll = {}
+        by_id = {}
+        for vote_id, g in (load_section(self.path, "graphs") or {}).items():
+            path = WEB_DIR / g["path"]
+            by_id[vote_id] = path
+            if g.get("chamber") and g.get("roll") is not None:
+                key = (g["chamber"], str(g["roll"]))
+                by_roll.setdefault(key, []).append((_graph_rank(g.get("congress"), g.get("session")), path))
+        for entries in by_roll.values():
+            entries.sort(key=lambda e: e[0], reverse=True)
+        self._by_roll, self._by_id = by_roll, by_id
+
+    def refresh(self) -> bool:
+        """Reload if the index changed; False when there is no index file."""
+        now = time.monotonic()
+        with self._lock:
+            if self._mtime is not None and now - self._checked < INDEX_CHECK_SECONDS:
+                return True
+            self._checked = now
+            try:
+                mtime = self.path.stat().st_mtime_ns
+            except OSError:
+                self._mtime = None
+                return False
+            if mtime != self._mtime:
+                try:
+                    self._load()
+                except (OSError, ValueError, KeyError):
+                    return self._mtime is not None
+                self._mtime = mtime
+            return True
+
+    def by_roll(self, chamber: str, roll: str, congress: str = "", session: str = "") -> Path | None:
+        for rank, path in self._by_roll.get((chamber, roll), ()):
+            if _rank_matches(rank, congress, session):
+                return path
+        return None
+
+    def by_id(self, vote_id: str) -> Path | None:
+        return self._by_id.get(vote_id)
+
+
+graph_index = GraphIndex(WEB_INDEX_PATH)
+
+
+def find_graph_file(chamber: str, roll: str, congress: str = "", session: str = "") -> Path | None:
     """
     Matches the files you already have, e.g.:
 
         data/web/H-119-1st-293.json
         data/web/S-119-1st-42.json
 
+    Looked up in the graph index. Falls back to globbing data/web when no
+    index has been built yet or the index has no entry for the roll; either
+    way only graphs matching congress/session (when given) are considered
+    and the newest congress/session wins:
+
     For chamber=house, roll=293 -> look for H-*-293.json
     For chamber=senate, roll=10 -> look for S-*-10.json
     """
     chamber = (chamber or "").lower().strip()
     roll = str(roll).strip()
+    congress = str(congress or "").strip()
+    session = str(session or "").strip()
 
     if not roll:
         return None
 
+    if graph_index.refresh():
+        path = graph_index.by_roll(chamber, roll, congress, session)
+        if path is not None:
+            return path
+
     if chamber == "house":
         prefix = "H-"
     elif chamber == "senate":
@@ -34,9 +141,124 @@ def find_graph_file(chamber: str, roll: str) -> Path | None:
     else:
         return None
 
-    pattern = f"{prefix}*-{roll}.json"
-    candidates = sorted(WEB_DIR.glob(pattern))
-    return candidates[0] if candidates else None
+    best = None
+    for path in WEB_DIR.glob(f"{prefix}*-{roll}.json"):
+        # H-<congress>-<session>-<roll>.json
+        _chamber, congress_part, *session_parts, _roll = path.stem.split("-")
+        rank = _graph_rank(congress_part, "-".join(session_parts))
+        if _rank_matches(rank, congress, session) and (best is None or rank > best[0]):
+            best = (rank, path)
+    return best[1] if best else None
+
+
+def find_graph_by_id(vote_id: str) -> Path | None:
+    """data/web/<vote id>.json, from the index or, if it is missing or stale, the file itself."""
+    if graph_index.refresh():
+        path = graph_index.by_id(vote_id)
+        if path is not None:
+            return path
+    if "/" in vote_id or "\\" in vote_id or vote_id.startswith("."):
+        return None
+    path = WEB_DIR / f"{vote_id}.json"
+    return path if path.is_file() else None
+
+
+# --- response body cache ------------------------------------------------------
+
+GRAPH_CACHE_ENTRIES = int(os.environ.get("CAPITOL_GRAPH_CACHE_ENTRIES") or 512)
+GRAPH_CACHE_BYTES = int(os.environ.get("CAPITOL_GRAPH_CACHE_MB") or 64) * 1024 * 1024
+GRAPH_CACHE_CONTROL = "public, max-age=60"
+
+
+class CachedBody:
+    __slots__ = ("body", "gz", "etag")
+
+    def __init__(self, body: bytes):
+        self.body = body
+        self.gz = gzip.compress(body, 6)
+        self.etag = hashlib.sha256(body).hexdigest()[:32]
+
+    @property
+    def size(self) -> int:
+        return len(self.body) + len(self.gz)
+
+
+class BodyCache:
+    """
+    Bounded LRU of serialized (and pre-gzipped) graph bodies keyed by
+    (path, mtime_ns), so a rebuilt graph is never served stale.
+    """
+
+    def __init__(self, max_entries: int = GRAPH_CACHE_ENTRIES, max_bytes: int = GRAPH_CACHE_BYTES):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._items: "OrderedDict[tuple, CachedBody]" = OrderedDict()
+        self._bytes = 0
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: tuple) -> CachedBody | None:
+        with self._lock:
+            item = self._items.get(key)
+            if item is None:
+                self.misses += 1
+                return None
+            self._items.move_to_end(key)
+            self.hits += 1
+            return item
+
+    def put(self, key: tuple, item: CachedBody) -> None:
+        if self.max_entries <= 0 or item.size > self.max_bytes:
+            return
+        with self._lock:
+            old = self._items.pop(key, None)
+            if old is not None:
+                self._bytes -= old.size
+            self._items[key] = item
+            self._bytes += item.size
+            while self._items and (len(self._items) > self.max_entries or self._bytes > self.max_bytes):
+                _key, dropped = self._items.popitem(last=False)
+                self._bytes -= dropped.size
+
+
+body_cache = BodyCache()
+
+
+def load_graph_body(path: Path) -> CachedBody:
+    """Serialized graph for `path`, from the cache or parsed once from disk."""
+    try:
+        mtime = path.stat().st_mtime_ns
+    except OSError:
+        abort(404, "Issue web is still building from public sources. Check back soon.")
+    key = (str(path), mtime)
+    item = body_cache.get(key)
+    if item is None:
+        try:
+            graph = jsonio.load_file(path)
+        except jsonio.JSONDecodeError:
+            abort(500, "Issue web JSON is invalid")
+        item = CachedBody(jsonio.dumpb(graph))
+        body_cache.put(key, item)
+    return item
+
+
+def graph_response(item: CachedBody) -> Response:
+    """200/304 for a cached body, gzipped when the client accepts it."""
+    use_gzip = request.accept_encodings["gzip"] > 0  # honors q-values, so "gzip;q=0" opts out
+    etag = f"{item.etag}-gz" if use_gzip else item.etag
+    headers = {"Cache-Control": GRAPH_CACHE_CONTROL, "Vary": "Accept-Encoding"}
+
+    if etag in request.if_none_match:
+        resp = Response(status=304, headers=headers)
+        resp.set_etag(etag)
+        return resp
+
+    resp = Response(item.gz if use_gzip else item.body, mimetype="application/json", headers=headers)
+    if use_gzip:
+        resp.headers["Content-Encoding"] = "gzip"
+    resp.set_etag(etag)
+    return resp
 
 
 # --- THIS IS YOUR "API" (no folder needed) ----------------------------------
@@ -45,26 +267,29 @@ def find_graph_file(chamber: str, roll: str) -> Path | None:
 def api_bill_web():
     # votes.html / issue-web.js send these query params:
     #   /api/bill-web?bill=H.Res.+878&chamber=house&roll=293
+    # optionally narrowed with &congress=119&session=1st, or by &vote=H-119-1st-293
     bill = (request.args.get("bill") or "").strip()      # not used yet, but we grab it
     chamber = (request.args.get("chamber") or "").strip()
     roll = (request.args.get("roll") or "").strip()
+    vote_id = (request.args.get("vote") or "").strip()
 
-    if not chamber or not roll:
-        abort(400, "Missing chamber or roll")
-
-    path = find_graph_file(chamber, roll)
+    if vote_id:
+        path = find_graph_by_id(vote_id)
+    else:
+        if not chamber or not roll:
+            abort(400, "Missing chamber or roll")
+        path = find_graph_file(
+            chamber,
+            roll,
+            request.args.get("congress") or "",
+            request.args.get("session") or "",
+        )
     if not path:
         # No JSON built yet for this vote -> front end shows
         # "Issue web is still building from public sources. Check back soon."
         abort(404, "Issue web is still building from public sources. Check back soon.")
 
-    try:
-        with path.open("r", encoding="utf-8") as f:
-            graph = json.load(f)
-    except json.JSONDecodeError:
-        abort(500, "Issue web JSON is invalid")
-
-    return jsonify(graph)
+    return graph_response(load_graph_body(path))
 
 
 # Optional: hitting http://127.0.0.1:5000/ goes straight to votes.html
@@ -74,4 +299,5 @@ def index():
 
 
 if __name__ == "__main__":
+    # Dev server only; run `python serve.py` for production.
     app.run(host="0.0.0.0", port=5000, debug=True)
@@ -1,12 +1,15 @@
 #!/usr/bin/env python
-import json
 import os
 import sys
 from pathlib import Path
 
+import jsonio
+from state_store import StateStore
+
 ROOT = Path(__file__).resolve().parent
 DATA_DIR = ROOT / "data"
 MASTER_STATE = DATA_DIR / "master_state.json"
+MASTER_DB = DATA_DIR / "master_state.db"
 WEB_DIR = DATA_DIR / "web"
 WEB_DIR.mkdir(exist_ok=True)
 
@@ -22,8 +25,11 @@ This will write:
 # --------- helpers ---------
 
 def load_master_state():
-    with MASTER_STATE.open("r", encoding="utf-8") as f:
-        return json.load(f)
+    # Prefer the SQLite store (indexed lookups) over parsing the whole JSON;
+    # the caller closes it.
+    if MASTER_DB.exists():
+        return StateStore(MASTER_DB)
+    return jsonio.load_file(MASTER_STATE)
 
 
 def make_node(id_, type_, label, url=None, meta=None):
@@ -53,8 +59,10 @@ def get_bill(state, bill_key):
     # TODO: adapt this to your actual structure
     # Example assumption:
     # state["bills"] is a dict keyed by bill_id like "hr1808-117"
-    bills = state.get("bills", {})
-    bill = bills.get(bill_key)
+    if isinstance(state, StateStore):
+        bill = state.get_bill(bill_key)
+    else:
+        bill = state.get("bills", {}).get(bill_key)
     if not bill:
         raise SystemExit(f"Bill {bill_key!r} not found in master_state")
     return bill
@@ -65,8 +73,14 @@ def get_vote(state, vote_key):
     vote_key example: 'house-117-rc410'
     """
     # TODO: adapt to your structure
-    votes = state.get("votes", {})
-    vote = votes.get(vote_key)
+    if isinstance(state, StateStore):
+        vote = state.get_vote(vote_key)
+        chamber, _, rest = vote_key.partition("-")
+        congress, _, roll = rest.partition("-rc")
+        if not vote and congress.isdigit() and roll.isdigit():
+            vote = state.find_roll(chamber, int(congress), int(roll))
+    else:
+        vote = state.get("votes", {}).get(vote_key)
     if not vote:
         raise SystemExit(f"Vote {vote_key!r} not found in master_state")
     return vote
@@ -75,6 +89,8 @@ def get_vote(state, vote_key):
 def get_member(state, bioguide):
     # TODO: adapt to your members index
     # Example: state["members"][bioguide]
+    if isinstance(state, StateStore):
+        return (state.get_meta("members") or {}).get(bioguide)
     members = state.get("members", {})
     return members.get(bioguide)
 
@@ -302,11 +318,14 @@ def main(argv=None):
     vote_id = f"house-{parts[1]}-{roll}"  # house-117-rc410  (adjust if needed)
 
     state = load_master_state()
-    graph = build_graph_for_bill(state, graph_id, bill_id, vote_id=vote_id)
+    try:
+        graph = build_graph_for_bill(state, graph_id, bill_id, vote_id=vote_id)
+    finally:
+        if isinstance(state, StateStore):
+            state.close()
 
     out_path = WEB_DIR / f"{graph_id}.json"
-    with out_path.open("w", encoding="utf-8") as f:
-        json.dump(graph, f, indent=2, sort_keys=False)
+    jsonio.dump_file(out_path, graph, indent=2)
 
     print(f"Wrote {out_path}")
 
@@ -2,12 +2,13 @@
 """
 build_master_data.py
 
-Aggregates vote and league data into data/master_state.json.
+Aggregates vote and league data into data/master_state.db (see
+state_store.py) and exports data/master_state.json for the static site.
 
 Updated (2025-11):
 - Uses OFFICIAL XML sources for roll-call votes:
     * House: clerk.house.gov XML
-    * Senate: senate.gov LIS XML (stubbed for now, shape is ready)
+    * Senate: senate.gov LIS XML (vote menu + per-vote XML)
 - Falls back to GovTrack if the official source fails or returns nothing.
 - NO LONGER depends on the Congress.gov votes API (it has been flaky/404).
 
@@ -17,15 +18,25 @@ we can mix data from multiple sources (.gov > .edu > .org > everything else).
 
 from __future__ import annotations
 
-import json
+import heapq
 import os
 import sys
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass, asdict
+from functools import lru_cache
+from itertools import count, repeat
 from datetime import date, datetime, timedelta
+from operator import itemgetter
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 
-import requests
+import http_client
+import json_stream
+import jsonio
+import raw_cache
+import vote_archive
+from state_store import StateStore, vote_sort_date
 
 # NEW: official votes helpers (House/Senate XML)
 from official_votes import fetch_house_votes_official, fetch_senate_votes_official
@@ -38,14 +49,20 @@ from official_votes import fetch_house_votes_official, fetch_senate_votes_offici
 ROOT_DIR = Path(__file__).resolve().parent
 DATA_DIR = ROOT_DIR / "data"
 MASTER_STATE_PATH = DATA_DIR / "master_state.json"
+MASTER_STATE_PRETTY_PATH = DATA_DIR / "master_state.pretty.json"
+MASTER_DB_PATH = DATA_DIR / "master_state.db"
+VOTES_ARCHIVE_DIR = DATA_DIR / "votes"  # full history, see vote_archive.py
 
 GOVTRACK_BASE = "https://www.govtrack.us/api/v2"
 
 DEFAULT_LOOKBACK_DAYS = 7
-VOTE_CAP_PER_CHAMBER = 200  # hard cap so we don't hammer APIs
+VOTE_CAP_PER_CHAMBER = 200  # per-run fetch cap (live/update) and master_state.json size
 
 HISTORICAL_START = date(2023, 1, 1)
 
+CHAMBERS = ("house", "senate")
+SOURCES_PER_CHAMBER = 2  # official XML + GovTrack
+
 
 # --------------------------
 # Utilities
@@ -90,8 +107,7 @@ def load_existing_state() -> Dict[str, Any]:
     """Load master_state.json if it exists, otherwise return a basic skeleton."""
     if MASTER_STATE_PATH.exists():
         try:
-            with MASTER_STATE_PATH.open("r", encoding="utf-8") as f:
-                return json.load(f)
+            return jsonio.load_file(MASTER_STATE_PATH)
         except Exception:
             # If it's corrupt, fall back to skeleton but don't blow up the run.
             pass
@@ -113,12 +129,29 @@ def load_existing_state() -> Dict[str, Any]:
     }
 
 
-def save_state(state: Dict[str, Any]) -> None:
-    DATA_DIR.mkdir(parents=True, exist_ok=True)
-    tmp = MASTER_STATE_PATH.with_suffix(".tmp")
-    with tmp.open("w", encoding="utf-8") as f:
-        json.dump(state, f, indent=2, sort_keys=False)
-    tmp.replace(MASTER_STATE_PATH)
+def open_store() -> StateStore:
+    """
+    Open data/master_state.db, seeding it from an existing master_state.json
+    the first time so nothing already published is lost.
+    """
+    store = StateStore(MASTER_DB_PATH)
+    if store.is_empty() and MASTER_STATE_PATH.exists():
+        print(f"Importing {MASTER_STATE_PATH} into {MASTER_DB_PATH}")
+        store.import_state(load_existing_state())
+    return store
+
+
+def save_state(state: Dict[str, Any], pretty: bool = False, gzip_copy: bool = False) -> None:
+    """
+    Stream master_state.json compactly, section by section (see
+    json_stream.py); vote lists may be iterators straight off the store.
+    gzip_copy also writes master_state.json.gz in the same pass. With
+    pretty=True an indented copy is also written to master_state.pretty.json
+    for debugging.
+    """
+    json_stream.write_json(MASTER_STATE_PATH, state, gzip_copy=gzip_copy)
+    if pretty:
+        jsonio.dump_file(MASTER_STATE_PRETTY_PATH, jsonio.load_file(MASTER_STATE_PATH), indent=2)
 
 
 def parse_args(argv: List[str]) -> Tuple[str, Optional[date], Optional[date]]:
@@ -129,6 +162,10 @@ def parse_args(argv: List[str]) -> Tuple[str, Optional[date], Optional[date]]:
       - "live"   : python build_master_data.py
       - "full"   : python build_master_data.py full
       - "update" : python build_master_data.py update
+
+    Any mode also accepts --cache-dir <dir> and --offline (see raw_cache.py),
+    --pretty to also write an indented master_state.pretty.json, and --gzip to
+    also write master_state.json.gz.
     """
     today = date.today()
 
@@ -144,9 +181,9 @@ def parse_args(argv: List[str]) -> Tuple[str, Optional[date], Optional[date]]:
         return "full", HISTORICAL_START, today
     if mode == "update":
         # Update from last stored date (or lookback) through today
-        st = load_existing_state()
-        last_house_to = st.get("votes", {}).get("house", {}).get("toDate")
-        last_senate_to = st.get("votes", {}).get("senate", {}).get("toDate")
+        with open_store() as store:
+            last_house_to = store.get_window("house")[1]
+            last_senate_to = store.get_window("senate")[1]
 
         def parse_iso(d: Any) -> Optional[date]:
             try:
@@ -194,12 +231,6 @@ class SourceStatus:
             self.lastSuccess = self.lastAttempt
 
 
-def ensure_source_meta(state: Dict[str, Any]) -> Dict[str, Any]:
-    meta = state.setdefault("sourceMeta", {})
-    votes_meta = meta.setdefault("votes", {})
-    return votes_meta
-
-
 # --------------------------
 # GovTrack fetcher (fallback)
 # --------------------------
@@ -213,20 +244,21 @@ def fetch_govtrack_votes(
     GovTrack's API does not require a key. We ask for votes in the given
     chamber ordered by -created and then trim to the requested date window.
     """
-    url = f"{GOVTRACK_BASE}/vote"
-    params = {
-        "chamber": chamber,
-        "order_by": "-created",
-        "limit": cap,
-    }
+    url = f"{GOVTRACK_BASE}/vote?chamber={chamber}&order_by=-created&limit={cap}"
 
-    resp = requests.get(url, params=params, timeout=20)
-    if resp.status_code != 200:
-        raise RuntimeError(
-            f"GovTrack votes failed: {resp.status_code} {resp.text[:200]}"
-        )
+    def download(headers: Dict[str, str]):
+        resp = http_client.get_client().get(url, timeout=20, headers=headers)
+        if resp.status_code not in (200, 304):
+            raise RuntimeError(
+                f"GovTrack votes failed: {resp.status_code} {resp.text[:200]}"
+            )
+        return resp.status_code, resp.content, resp.headers
+
+    body = raw_cache.cached_get(url, download)
+    if body is None:
+        raise RuntimeError("GovTrack votes unavailable (offline and not cached)")
 
-    data = resp.json()
+    data = jsonio.loads(body)
     objects = data.get("objects") or data.get("results") or []
 
     normalized: List[Dict[str, Any]] = []
@@ -253,13 +285,16 @@ def fetch_govtrack_votes(
         vote = {
             "id": obj.get("id"),
             "chamber": obj.get("chamber") or chamber,
+            "congress": obj.get("congress"),
+            "session": str(obj["session"]) if obj.get("session") is not None else None,
+            "rollNumber": obj.get("number"),
             "source": "govtrack.us",
             "sourceUrl": source_url,
             "description": desc,
             "question": obj.get("question"),
             "result": result,
             "created": created,
-            "raw": obj,
+            "raw": obj,  # kept in the store's raw_payloads side table, not exported
             "sources": [
                 {
                     "domain": "govtrack.us",
@@ -279,55 +314,330 @@ def fetch_govtrack_votes(
 # Aggregation logic
 # --------------------------
 
+_SESSION_NUMBERS = {"1st": 1, "2nd": 2, "3rd": 3, "1": 1, "2": 2, "3": 3}
+# GovTrack labels sessions by year ("2025"): odd years are a congress's 1st.
+_SESSION_NUMBERS.update({str(y): (y - 1789) % 2 + 1 for y in range(1789, 2200)})
+_CHAMBER_NAMES = frozenset(("house", "senate"))
+
+
+def vote_roll_key(vote: Dict[str, Any]) -> Tuple[Any, ...]:
+    """
+    (chamber, congress, session number, roll) — the same roll call from any
+    source — or ("id", id) when the vote doesn't say which roll it is.
+    GovTrack's year sessions ("2025") map to the session that year falls in.
+    """
+    chamber = vote.get("chamber")
+    congress = vote.get("congress")
+    roll = vote.get("rollNumber")
+    session = _SESSION_NUMBERS.get(vote.get("session"))  # type: ignore[arg-type]
+    if chamber in _CHAMBER_NAMES and type(congress) is int and type(roll) is int and session:
+        return (chamber, congress, session, roll)
+    # loosely typed records: "House", "119", " 1st"
+    try:
+        congress, roll = int(congress), int(roll)  # type: ignore[arg-type]
+    except (TypeError, ValueError):
+        return ("id", str(vote.get("id")))
+    session = _SESSION_NUMBERS.get(str(vote.get("session") or "").strip())
+    if session is None:
+        return ("id", str(vote.get("id")))
+    return (str(chamber or "").lower(), congress, session, roll)
+
+
+def source_rank(vote: Dict[str, Any]) -> int:
+    """Lower wins: official XML (clerk.house.gov / senate.gov) over GovTrack."""
+    return 1 if vote.get("source") == "govtrack.us" else 0
+
+
+def roll_key_text(key: Tuple[Any, ...]) -> str:
+    """vote_roll_key as stored in the vote_keys table: "house/119/1/262" or "id:<id>"."""
+    return f"id:{key[1]}" if key[0] == "id" else "/".join(str(k) for k in key)
+
+
+_EMPTY = (None, "", [], {})
+# Fields that identify a record's own source; never copied between sources.
+_SOURCE_FIELDS = ("id", "source", "sourceUrl", "sources", "sourceRank", "aliases")
+
+
+def _unique_sources(sources: Iterable[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    seen = set()
+    unique = []
+    for src in sources:
+        if src.get("url") not in seen:
+            seen.add(src.get("url"))
+            unique.append(src)
+    return unique
+
+
+@lru_cache(maxsize=256)
+def _host_rank(host: str) -> int:
+    return rank_source_domain(f"https://{host}/") if host else 0
+
+
+def _source_entry(url: str) -> Dict[str, Any]:
+    # urlparse is the slow part of reconciling thousands of votes; the host
+    # is all that's needed here.
+    host = url.partition("//")[2].partition("/")[0].rpartition("@")[2].partition(":")[0].lower()
+    return {"domain": host, "url": url, "rank": _host_rank(host)}
+
+
+def vote_sources(vote: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """
+    Every source a vote cites as {"domain", "url", "rank"} (plus "kind" for
+    the official {"houseXml": url} form): its sourceRank list, then its
+    `sources` dict or list, then sourceUrl, each url once.
+    """
+    out: List[Dict[str, Any]] = [dict(src) for src in vote.get("sourceRank") or [] if isinstance(src, dict)]
+    raw = vote.get("sources")
+    if isinstance(raw, dict):
+        for kind, url in raw.items():
+            if url:
+                out.append(dict(_source_entry(url), kind=kind))
+    elif isinstance(raw, list):
+        out.extend(dict(src) for src in raw if isinstance(src, dict))
+    url = vote.get("sourceUrl")
+    if url:
+        out.append(_source_entry(url))
+    return _unique_sources(out)
+
+
+def reconcile_records(records: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    One record for a roll from its per-source records, best first: the best
+    record's fields (its `sources` keep their shape), gaps filled from the
+    others in order, every source of every record in `sourceRank` (highest
+    rank_source_domain first) and the other records' ids in `aliases`.
+    """
+    merged = dict(records[0])
+    aliases = [str(a) for a in merged.get("aliases") or []]
+    for other in records[1:]:
+        for k, val in other.items():
+            if k not in _SOURCE_FIELDS and merged.get(k) in _EMPTY and val not in _EMPTY:
+                merged[k] = val
+        aliases.extend(str(a) for a in [other.get("id")] + list(other.get("aliases") or []))
+
+    ranked = _unique_sources(src for r in records for src in vote_sources(r))
+    ranked.sort(key=lambda src: src.get("rank") or 0, reverse=True)
+    merged["sourceRank"] = ranked
+    own = str(merged.get("id"))
+    aliases = [a for a in dict.fromkeys(aliases) if a not in ("None", own)]
+    if aliases:
+        merged["aliases"] = aliases
+    return merged
+
+
+def _day_before(sort_date: str) -> str:
+    try:
+        return (date.fromisoformat(sort_date[:10]) - timedelta(days=1)).isoformat()
+    except ValueError:
+        return ""
+
+
+def merge_vote_runs(
+    runs: Iterable[Iterable[Dict[str, Any]]],
+    max_count: Optional[int] = None,
+) -> List[Dict[str, Any]]:
+    """
+    Merge runs of votes, each newest first by vote_sort_date (as the
+    fetchers and the store return them), into one newest-first list trimmed
+    to max_count.
+
+    The runs are k-way merged lazily with heapq.merge, and each record's
+    sort key and roll key are computed once, as it is read. Records for the
+    same roll are reconciled into one (reconcile_records): the official
+    record leads over GovTrack's, and between records from the same kind of
+    source a later run leads; the roll is placed by its leading record.
+    With max_count, reading stops once max_count rolls have been seen and
+    the merge is a day older than the last of them (sources date a roll
+    hours, not days, apart), so only the head of each run is touched.
+    """
+    # (sort date, -position, run) orders every record without comparing dicts
+    streams = [zip(map(vote_sort_date, run), count(0, -1), repeat(i), run) for i, run in enumerate(runs)]
+    groups: Dict[Tuple[Any, ...], Any] = {}  # roll key -> (date, run, vote), or a list of them
+    order: List[Tuple[Any, ...]] = []
+    stop_before: Optional[str] = None
+    for sort_date, _pos, i, v in heapq.merge(*streams, reverse=True):
+        if v.get("id") is None:
+            continue
+        if stop_before is not None and sort_date < stop_before:
+            break
+        key = vote_roll_key(v)
+        group = groups.get(key)
+        if group is None:
+            groups[key] = (sort_date, i, v)
+            order.append(key)
+            if stop_before is None and max_count is not None and len(order) >= max_count:
+                stop_before = _day_before(sort_date)
+        elif type(group) is tuple:
+            groups[key] = [group, (sort_date, i, v)]
+        else:
+            group.append((sort_date, i, v))
+
+    merged: List[Tuple[str, Dict[str, Any]]] = []
+    for key in order:
+        group = groups[key]
+        if type(group) is tuple:
+            merged.append((group[0], group[2]))
+            continue
+        group.sort(key=lambda rec: source_rank(rec[2]) * 1_000_000 - rec[1])  # lower leads
+        lead_date, _i, lead = group[0]
+        # another copy of the lead record (e.g. stored and refetched) adds nothing
+        rest = [v for _date, _i, v in group[1:] if v.get("id") != lead.get("id")]
+        merged.append((lead_date, reconcile_records([lead] + rest) if rest else lead))
+    merged.sort(key=itemgetter(0), reverse=True)
+    if max_count is not None:
+        del merged[max_count:]
+    return [v for _date, v in merged]
+
+
+def reconcile_with_store(store: StateStore, votes: List[Dict[str, Any]]) -> Tuple[List[Dict[str, Any]], Dict[str, str]]:
+    """
+    Match freshly merged votes against what the store already holds for the
+    same roll, via the vote_keys map (one primary-key lookup per vote rather
+    than a scan). Returns (records to upsert, {retired id: surviving id})
+    and records the roll keys of every returned record.
+    """
+    lookups = {}
+    for v in votes:
+        lookups[str(v["id"])] = (roll_key_text(vote_roll_key(v)), f"id:{v['id']}")
+    known = store.get_vote_keys(k for pair in lookups.values() for k in pair)
+
+    out: List[Dict[str, Any]] = []
+    retired: Dict[str, str] = {}
+    links: Dict[str, str] = {}
+    for v in votes:
+        vid = str(v["id"])
+        roll_text, alias = lookups[vid]
+        stored_id = known.get(roll_text) or known.get(alias)
+        if stored_id:
+            # even under the same id, keep what other sources added earlier
+            stored = store.get_vote(stored_id)
+            if stored is not None:
+                ranked = sorted([v, stored], key=source_rank)  # stable: fresh record first on ties
+                v = reconcile_records(ranked)
+                vid = str(v["id"])
+                if vid != stored_id:
+                    retired[stored_id] = vid
+        if not roll_text.startswith("id:"):
+            links[roll_text] = vid
+        for a in v.get("aliases") or []:
+            # a GovTrack record merged into this one may be stored on its own
+            retired.setdefault(a, vid)
+        out.append(v)
+    store.set_vote_keys(links)
+    return out, retired
+
+
+RECONCILED_META_KEY = "_reconciledAt"
+
+
+def reconcile_store(store: StateStore) -> int:
+    """
+    One-time pass for stores written before reconciliation, where each roll
+    could be stored twice (official id and GovTrack id): merge the pairs and
+    build the vote_keys map. Official records whose `sources` were saved as
+    a list get their {"houseXml": url} dict back, the list going to
+    sourceRank. Completion is recorded in meta, so later runs skip it.
+    Returns rows retired.
+    """
+    if store.get_meta(RECONCILED_META_KEY):
+        return 0
+    runs: Dict[str, List[Dict[str, Any]]] = {}
+    for v in store.iter_votes():
+        if v.get("rollNumber") is None and v.get("source") == "govtrack.us":
+            raw = store.get_raw(v["id"]) or {}
+            v["congress"] = raw.get("congress")
+            v["session"] = str(raw["session"]) if raw.get("session") is not None else None
+            v["rollNumber"] = raw.get("number")
+        sources = v.get("sources")
+        if isinstance(sources, list) and any(isinstance(src, dict) and src.get("kind") for src in sources):
+            v["sourceRank"] = sources
+            v["sources"] = {src["kind"]: src["url"] for src in sources if isinstance(src, dict) and src.get("kind")}
+        runs.setdefault(v.get("chamber"), []).append(v)  # each chamber's votes come newest first
+    retired_rows = 0
+    if runs:
+        merged, retired = reconcile_with_store(store, merge_vote_runs(runs.values()))
+        store.upsert_votes(merged)
+        retired_rows = store.retire_votes(retired)
+    store.set_meta(RECONCILED_META_KEY, utc_now_iso())
+    return retired_rows
+
+
 def merge_votes(
     existing: List[Dict[str, Any]],
     new_votes: List[Dict[str, Any]],
-    max_count: int,
+    max_count: Optional[int] = None,
 ) -> List[Dict[str, Any]]:
     """
-    Merge existing + new votes, de-duplicating by 'id' and trimming to max_count.
+    Merge existing + new votes (new wins over old for the same roll),
+    trimming to max_count (None keeps everything). See merge_vote_runs.
     """
-    by_id: Dict[Any, Dict[str, Any]] = {}
+    return merge_vote_runs([existing, new_votes], max_count)
 
-    for v in existing:
-        vid = v.get("id")
-        if vid is None:
-            continue
-        by_id[vid] = v
 
-    for v in new_votes:
-        vid = v.get("id")
-        if vid is None:
-            continue
-        # New wins over old
-        by_id[vid] = v
+def fetch_official_votes(
+    chamber: str, from_date: date, to_date: date, cap: Optional[int]
+) -> List[Dict[str, Any]]:
+    print(f"Fetching {chamber} votes from official XML source...")
+    if chamber == "house":
+        return fetch_house_votes_official(from_date, to_date, cap)
+    return fetch_senate_votes_official(from_date, to_date, cap)
+
+
+def fetch_fallback_votes(
+    chamber: str, from_date: date, to_date: date, cap: Optional[int]
+) -> List[Dict[str, Any]]:
+    print(f"Fetching {chamber} votes from GovTrack (fallback)...")
+    # GovTrack is only asked for one page of newest votes.
+    return fetch_govtrack_votes(chamber, from_date, to_date, VOTE_CAP_PER_CHAMBER)
+
 
-    merged = list(by_id.values())
-    merged.sort(key=lambda v: v.get("created") or v.get("date") or "", reverse=True)
-    return merged[:max_count]
+def fetch_cap(mode: str) -> Optional[int]:
+    """Votes per chamber the fetchers may return: the whole window in full mode."""
+    return None if mode == "full" else VOTE_CAP_PER_CHAMBER
+
+
+def start_vote_fetches(
+    pool: ThreadPoolExecutor,
+    chamber: str,
+    from_date: date,
+    to_date: date,
+    cap: Optional[int] = VOTE_CAP_PER_CHAMBER,
+) -> Dict[str, Future]:
+    """
+    Submit the official and GovTrack fetches for one chamber to `pool`.
+    cap=None (full mode) lets the official fetchers return the whole window.
+    """
+    args = (chamber, from_date, to_date, cap)
+    return {
+        "official": pool.submit(fetch_official_votes, *args),
+        "govtrack": pool.submit(fetch_fallback_votes, *args),
+    }
 
 
 def update_votes_for_chamber(
-    state: Dict[str, Any],
+    store: StateStore,
     chamber: str,
     from_date: date,
     to_date: date,
     mode: str,
+    fetches: Optional[Dict[str, Future]] = None,
 ) -> None:
     """
     Update votes for a single chamber with multi-source logic.
 
-    Order of attempts:
+    Sources (fetched concurrently; see start_vote_fetches):
       1. Official XML (Clerk for House, Senate LIS for Senate)
       2. GovTrack fallback
-      3. If all fail -> preserve existing data in state
-    """
-    votes_section = state.setdefault("votes", {}).setdefault(
-        chamber, {"fromDate": None, "toDate": None, "count": 0, "votes": []}
-    )
-    existing_votes: List[Dict[str, Any]] = votes_section.get("votes") or []
+      3. If all fail -> preserve existing data in the store
 
-    meta = ensure_source_meta(state)
+    Waits for every source, records each one's SourceStatus, then upserts the
+    new votes row by row; votes already stored are untouched. Store writes
+    stay on the calling thread.
+    """
+    if fetches is None:
+        with ThreadPoolExecutor(max_workers=SOURCES_PER_CHAMBER) as pool:
+            fetches = start_vote_fetches(pool, chamber, from_date, to_date, fetch_cap(mode))
+            return update_votes_for_chamber(store, chamber, from_date, to_date, mode, fetches)
 
     if chamber == "house":
         official_status_key = "house.clerk"
@@ -354,48 +664,43 @@ def update_votes_for_chamber(
         priority=60,
     )
 
-    official_status = meta.setdefault(official_status_key, asdict(official_source))
-    govtrack_status = meta.setdefault(govtrack_status_key, asdict(govtrack_source))
+    official_status = store.get_source_status(official_status_key) or asdict(official_source)
+    govtrack_status = store.get_source_status(govtrack_status_key) or asdict(govtrack_source)
 
-    # Helper to update SourceStatus dicts in-place
-    def mark_status(d: Dict[str, Any], status: str, success: bool) -> None:
+    # Helper to update a SourceStatus dict and write its row back
+    def mark_status(key: str, d: Dict[str, Any], status: str, success: bool) -> None:
         ss = SourceStatus(**d)
         ss.mark_attempt(status=status, success=success)
         d.clear()
         d.update(asdict(ss))
+        store.put_source_status(key, d)
 
-    new_votes: List[Dict[str, Any]] = []
+    runs: List[List[Dict[str, Any]]] = []
     any_success = False
 
     # 1) Official XML
     try:
-        print(f"Fetching {chamber} votes from official XML source...")
-        if chamber == "house":
-            off_votes = fetch_house_votes_official(from_date, to_date, VOTE_CAP_PER_CHAMBER)
-        else:
-            off_votes = fetch_senate_votes_official(from_date, to_date, VOTE_CAP_PER_CHAMBER)
-
+        off_votes = fetches["official"].result()
         if off_votes:
             any_success = True
-        mark_status(official_status, "ok", bool(off_votes))
-        new_votes.extend(off_votes)
+        mark_status(official_status_key, official_status, "ok", bool(off_votes))
+        runs.append(off_votes)
     except Exception as exc:
         msg = f"error: {exc}"
         print(f"[{chamber}] Official XML fetch failed: {msg}")
-        mark_status(official_status, msg[:120], False)
+        mark_status(official_status_key, official_status, msg[:120], False)
 
     # 2) GovTrack fallback
     try:
-        print(f"Fetching {chamber} votes from GovTrack (fallback)...")
-        gt_votes = fetch_govtrack_votes(chamber, from_date, to_date, VOTE_CAP_PER_CHAMBER)
+        gt_votes = fetches["govtrack"].result()
         if gt_votes:
             any_success = True
-        mark_status(govtrack_status, "ok", bool(gt_votes))
-        new_votes.extend(gt_votes)
+        mark_status(govtrack_status_key, govtrack_status, "ok", bool(gt_votes))
+        runs.append(gt_votes)
     except Exception as exc:
         msg = f"error: {exc}"
         print(f"[{chamber}] GovTrack fetch failed: {msg}")
-        mark_status(govtrack_status, msg[:120], False)
+        mark_status(govtrack_status_key, govtrack_status, msg[:120], False)
 
     if not any_success:
         # Preserve existing data and just bump dates so the front-end
@@ -404,24 +709,50 @@ def update_votes_for_chamber(
             f"WARNING: All vote sources failed for {chamber}; "
             "preserving existing votes."
         )
-        votes_section["fromDate"] = from_date.isoformat()
-        votes_section["toDate"] = to_date.isoformat()
-        votes_section["count"] = len(existing_votes)
-        votes_section["votes"] = existing_votes
+        store.set_window(chamber, from_date.isoformat(), to_date.isoformat())
         return
 
-    merged = merge_votes(existing_votes, new_votes, VOTE_CAP_PER_CHAMBER)
-    votes_section["fromDate"] = from_date.isoformat()
-    votes_section["toDate"] = to_date.isoformat()
-    votes_section["count"] = len(merged)
-    votes_section["votes"] = merged
+    votes, retired = reconcile_with_store(store, merge_vote_runs(runs))
+    written = store.upsert_votes(votes)
+    merged_away = store.retire_votes(retired)
+    store.set_window(chamber, from_date.isoformat(), to_date.isoformat())
+    print(
+        f"[{chamber}] upserted {written} votes, merged away {merged_away} duplicates "
+        f"({store.count_votes(chamber)} stored)"
+    )
 
 
 # --------------------------
 # Entry point
 # --------------------------
 
+def pop_cache_flags(argv: List[str]) -> List[str]:
+    """
+    Strip --cache-dir <dir> / --offline from argv and configure the shared
+    raw download cache. Returns the remaining argv for parse_args().
+    """
+    rest: List[str] = []
+    cache_dir: Optional[str] = None
+    offline = False
+    it = iter(argv)
+    for arg in it:
+        if arg == "--offline":
+            offline = True
+        elif arg == "--cache-dir":
+            cache_dir = next(it, None)
+        elif arg.startswith("--cache-dir="):
+            cache_dir = arg.split("=", 1)[1]
+        else:
+            rest.append(arg)
+    raw_cache.configure(cache_dir, offline=offline)
+    return rest
+
+
 def main(argv: List[str]) -> int:
+    argv = pop_cache_flags(argv)
+    pretty = "--pretty" in argv
+    gzip_copy = "--gzip" in argv
+    argv = [a for a in argv if a not in ("--pretty", "--gzip")]
     mode, from_date, to_date = parse_args(argv)
     assert from_date is not None and to_date is not None
 
@@ -432,17 +763,38 @@ def main(argv: List[str]) -> int:
     print("Primary sources: Clerk (House XML), Senate LIS (XML)")
     print(f"Fallback: GovTrack ({GOVTRACK_BASE}/vote)")
 
-    state = load_existing_state()
-    state["generatedAt"] = utc_now_iso()
-    state.setdefault("params", {})["lookbackDays"] = (to_date - from_date).days
-    state["params"]["voteCapPerChamber"] = VOTE_CAP_PER_CHAMBER
-
-    # Update both chambers
-    for chamber in ("house", "senate"):
-        update_votes_for_chamber(state, chamber, from_date, to_date, mode)
-
-    save_state(state)
-    print(f"\nMaster state written to {MASTER_STATE_PATH}")
+    with open_store() as store:
+        merged_away = reconcile_store(store)
+        if merged_away:
+            print(f"Reconciled stored votes: merged away {merged_away} cross-source duplicates")
+        store.set_meta("generatedAt", utc_now_iso())
+        params = store.get_meta("params", {})
+        params["lookbackDays"] = (to_date - from_date).days
+        params["voteCapPerChamber"] = VOTE_CAP_PER_CHAMBER
+        store.set_meta("params", params)
+
+        # Both chambers x both sources run at once, so a run takes about as
+        # long as the slowest single source.
+        t0 = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=len(CHAMBERS) * SOURCES_PER_CHAMBER) as pool:
+            fetches = {c: start_vote_fetches(pool, c, from_date, to_date, fetch_cap(mode)) for c in CHAMBERS}
+            for chamber in CHAMBERS:
+                update_votes_for_chamber(store, chamber, from_date, to_date, mode, fetches[chamber])
+        print(f"Fetched all sources in {time.perf_counter() - t0:.1f}s")
+
+        save_state(store.export_document(vote_limit=VOTE_CAP_PER_CHAMBER), pretty=pretty, gzip_copy=gzip_copy)
+        archive = vote_archive.write_archive(
+            store.iter_votes(),
+            VOTES_ARCHIVE_DIR,
+            generated_at=store.get_meta("generatedAt"),
+            retired=store.retired_vote_ids(),
+        )
+    print(f"\nMaster state written to {MASTER_DB_PATH} and {MASTER_STATE_PATH}")
+    print(
+        f"Vote archive {VOTES_ARCHIVE_DIR}: {archive['votes']} votes, "
+        f"{archive['written']} partitions written, {archive['unchanged']} unchanged"
+    )
+    print(http_client.get_client().report())
     return 0
 
 
@@ -9,41 +9,80 @@ Usage:
     # Build webs for ALL votes in master_state.json:
     python build_vote_web.py ALL
 
-Reads data/master_state.json, finds vote(s), and writes graph/spiderweb
-JSON files to data/web/<voteId>.json that the front-end can later use to
-render a node-link view.
+Reads data/master_state.db (falling back to data/master_state.json), finds
+vote(s), and writes graph/spiderweb JSON files to data/web/<voteId>.json that
+the front-end can later use to render a node-link view.
+
+ALL mode hashes each vote and skips graphs whose vote is unchanged since the
+last build, builds the rest on a worker pool, and writes each file atomically.
+
+data/web/_index.json records every graph written:
+  "graphs": {voteId: {"path", "hash", "chamber", "congress", "session", "roll"}}
+  "byRoll": {"house/119/1st/293": "H-119-1st-293.json", ...}
+app.py loads it once (reloading when it changes) instead of globbing data/web.
 """
 
+import hashlib
 import json
+import os
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+import json_stream
+import jsonio
+from state_store import StateStore
+
 ROOT = Path(__file__).resolve().parent
 DATA_DIR = ROOT / "data"
 MASTER_STATE_PATH = DATA_DIR / "master_state.json"
+MASTER_DB_PATH = DATA_DIR / "master_state.db"
 WEB_DIR = DATA_DIR / "web"
+WEB_INDEX_PATH = WEB_DIR / "_index.json"
+
+# Bump when build_graph's output changes so every graph is rebuilt once.
+GRAPH_VERSION = 1
+WORKERS = min(8, (os.cpu_count() or 1) + 4)
 
 
 def load_state():
+    """
+    The SQLite state store when it exists (the caller closes it), else the
+    parsed master_state.json.
+    """
+    if MASTER_DB_PATH.exists():
+        return StateStore(MASTER_DB_PATH)
     if not MASTER_STATE_PATH.exists():
         print(f"ERROR: {MASTER_STATE_PATH} does not exist.")
         sys.exit(1)
-    with MASTER_STATE_PATH.open("r", encoding="utf-8") as f:
-        return json.load(f)
+    return jsonio.load_file(MASTER_STATE_PATH)
 
 
 def get_all_votes(state):
+    if isinstance(state, StateStore):
+        return list(state.iter_votes())
     votes_root = state.get("votes", {})
     house_votes = votes_root.get("house", {}).get("votes", [])
     senate_votes = votes_root.get("senate", {}).get("votes", [])
     return house_votes + senate_votes
 
 
+_vote_indexes = {}
+
+
+def vote_index(state):
+    """{str(vote id): vote} for a JSON state, built once per loaded state."""
+    cached = _vote_indexes.get(id(state))
+    if cached is None or cached[0] is not state:
+        cached = (state, {str(v.get("id")): v for v in get_all_votes(state)})
+        _vote_indexes[id(state)] = cached
+    return cached[1]
+
+
 def find_vote(state, vote_id):
-    for v in get_all_votes(state):
-        if v.get("id") == vote_id:
-            return v
-    return None
+    if isinstance(state, StateStore):
+        return state.get_vote(vote_id)
+    return vote_index(state).get(str(vote_id))
 
 
 def build_graph(vote):
@@ -132,20 +171,125 @@ def build_graph(vote):
     return graph
 
 
-def write_graph(vote):
+def vote_hash(vote):
+    """
+    Content hash of the vote a graph is built from (plus GRAPH_VERSION).
+    Deliberately stdlib json, so the hash doesn't change with the jsonio
+    backend installed.
+    """
+    payload = json.dumps(vote, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(f"{GRAPH_VERSION}:{payload}".encode("utf-8")).hexdigest()
+
+
+def graph_entry(vote, h):
+    """Index record for a vote's graph: path, hash and roll coordinates."""
+    vote_id = str(vote.get("id"))
+    parts = vote_id.split("-")  # H-119-1st-293
+    from_id = len(parts) == 4 and parts[0] in ("H", "S")
+    chamber = vote.get("chamber") or ({"H": "house", "S": "senate"}.get(parts[0]) if from_id else None)
+    congress = vote.get("congress") or (int(parts[1]) if from_id and parts[1].isdigit() else None)
+    session = vote.get("session") or (parts[2] if from_id else None)
+    roll = vote.get("rollNumber") or (int(parts[3]) if from_id and parts[3].isdigit() else None)
+    return {
+        "path": f"{vote_id}.json",
+        "hash": h,
+        "chamber": chamber,
+        "congress": congress,
+        "session": session,
+        "roll": roll,
+    }
+
+
+def roll_key(chamber, congress, session, roll):
+    return f"{chamber}/{congress}/{session}/{roll}"
+
+
+def load_web_index():
+    try:
+        return jsonio.load_file(WEB_INDEX_PATH)
+    except (OSError, ValueError):
+        return {"version": 1, "graphs": {}}
+
+
+def save_web_index(index):
+    graphs = index.setdefault("graphs", {})
+    index["byRoll"] = {
+        roll_key(g["chamber"], g["congress"], g["session"], g["roll"]): g["path"]
+        for g in graphs.values()
+        if g.get("chamber") and g.get("roll") is not None
+    }
+    index["graphs"] = dict(sorted(graphs.items()))
+    index["byRoll"] = dict(sorted(index["byRoll"].items()))
+    # streamed with a section index so app.py can read just "graphs"
+    json_stream.write_json(WEB_INDEX_PATH, dict(sorted(index.items())), index_depth=1)
+
+
+def write_graph(vote, known_hash=None, verbose=True):
+    """
+    Build and atomically write one vote's graph. Returns (status, vote_id,
+    hash) with status "built", "skipped" (hash matches known_hash and the
+    file exists) or "failed".
+    """
     vote_id = vote.get("id")
     if not vote_id:
         print("Skipping vote with no id:", vote)
-        return
-
-    graph = build_graph(vote)
+        return "failed", None, None
 
-    WEB_DIR.mkdir(parents=True, exist_ok=True)
+    h = vote_hash(vote)
     out_path = WEB_DIR / f"{vote_id}.json"
-    with out_path.open("w", encoding="utf-8") as f:
-        json.dump(graph, f, indent=2)
+    if known_hash == h and out_path.exists():
+        return "skipped", vote_id, h
 
-    print(f"Wrote {out_path}")
+    try:
+        graph = build_graph(vote)
+        WEB_DIR.mkdir(parents=True, exist_ok=True)
+        jsonio.dump_file(out_path, graph)
+    except Exception as exc:
+        print(f"ERROR building web for {vote_id!r}: {exc}")
+        return "failed", vote_id, None
+
+    if verbose:
+        print(f"Wrote {out_path}")
+    return "built", vote_id, h
+
+
+def build_all(votes, workers=WORKERS, retired=()):
+    """
+    Build every vote's graph, skipping unchanged ones. Graphs for the ids in
+    `retired` (votes reconciliation merged into another record, e.g. a
+    GovTrack copy of an official roll) are deleted. Returns status counts.
+    """
+    index = load_web_index()
+    graphs = index.setdefault("graphs", {})
+    counts = {"built": 0, "skipped": 0, "failed": 0, "pruned": 0}
+    dirty = False
+
+    def one(vote):
+        known = graphs.get(str(vote.get("id")), {}).get("hash")
+        return write_graph(vote, known_hash=known, verbose=False)
+
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        for vote, (status, vote_id, h) in zip(votes, pool.map(one, votes)):
+            counts[status] += 1
+            if status == "failed":
+                continue
+            entry = graph_entry(vote, h)
+            if graphs.get(str(vote_id)) != entry:
+                graphs[str(vote_id)] = entry
+                dirty = True
+
+    current = {str(v.get("id")) for v in votes}
+    for vote_id in {str(vid) for vid in retired} - current:
+        entry = graphs.pop(vote_id, None)
+        path = WEB_DIR / (entry["path"] if entry else f"{vote_id}.json")
+        if entry or path.exists():
+            path.unlink(missing_ok=True)
+            counts["pruned"] += 1
+            dirty = True
+
+    if dirty:
+        save_web_index(index)
+    return counts
 
 
 def main(argv):
@@ -157,26 +301,47 @@ def main(argv):
 
     arg = argv[1]
     state = load_state()
+    try:
+        run(arg, state)
+    finally:
+        if isinstance(state, StateStore):
+            state.close()
+
 
+def run(arg, state):
+    # The store is only read on this thread; build_all's workers get plain
+    # vote dicts, never the SQLite connection.
     if arg.upper() == "ALL":
         votes = get_all_votes(state)
         if not votes:
-            print("No votes found in master_state.json")
+            print("No votes found in master state")
             sys.exit(1)
         print(f"Building webs for {len(votes)} votes...")
-        for v in votes:
-            write_graph(v)
-        print("Done.")
+        # Only the store knows which ids were merged away; master_state.json
+        # holds just the newest votes, so nothing is pruned without it.
+        retired = state.retired_vote_ids() if isinstance(state, StateStore) else ()
+        counts = build_all(votes, retired=retired)
+        print(
+            f"Done. built={counts['built']} skipped={counts['skipped']} "
+            f"failed={counts['failed']} pruned={counts['pruned']}"
+        )
+        if counts["failed"]:
+            sys.exit(1)
         return
 
     # Single vote mode
     vote_id = arg
     vote = find_vote(state, vote_id)
     if not vote:
-        print(f"ERROR: vote id {vote_id!r} not found in master_state.json")
+        print(f"ERROR: vote id {vote_id!r} not found in master state")
         sys.exit(1)
 
-    write_graph(vote)
+    status, vote_id, h = write_graph(vote)
+    if status == "failed":
+        sys.exit(1)
+    index = load_web_index()
+    index.setdefault("graphs", {})[str(vote_id)] = graph_entry(vote, h)
+    save_web_index(index)
 
 
 if __name__ == "__main__":
@@ -14,7 +14,8 @@ Checks:
 
 from pathlib import Path
 from typing import Tuple, List
-import json
+
+import jsonio
 
 PROJECT_ROOT = Path(__file__).parent
 
@@ -260,8 +261,7 @@ def scan_vote_jsons() -> Tuple[bool, List[str]]:
 
     for path in json_files:
         try:
-            with path.open("r", encoding="utf-8") as f:
-                data = json.load(f)
+            data = jsonio.load_file(path)
         except Exception as e:
             problems.append(f"{path.name}: JSON parse error ({e})")
             continue
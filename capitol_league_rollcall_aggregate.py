@@ -6,19 +6,37 @@ Outputs CSV: bioguide,total_votes,missed_votes
 Usage examples:
   python capitol_league_rollcall_aggregate.py --house-years 1990-2025 --congress 101-118 -o votes_missed.csv
   python capitol_league_rollcall_aggregate.py --house-years 2023-2025 --congress 118-118 -o votes_118.csv
+  python capitol_league_rollcall_aggregate.py --workers 8 --rps 10 -o votes_missed.csv
+  python capitol_league_rollcall_aggregate.py --incremental -o votes_missed.csv
+  python capitol_league_rollcall_aggregate.py --house-years 1990-2025 --congress 101-118 --parse-workers 8
 
 Notes:
 - Keys are official Bioguide IDs. Map to GovTrack IDs later if needed.
 - "Missed" == position in {"Not Voting", "Absent"} (case-insensitive).
 - Script is resilient to XML schema differences and skips malformed files.
+- Downloads run on a small thread pool (--workers) under a per-host request
+  rate limit (--rps); results are still yielded in roll order.
+- Raw XML is kept in a local cache (raw_cache.py, --cache-dir); finalized
+  rolls are never downloaded twice and --offline needs no network at all.
+- Per-year / per-session counts, the last roll folded in and any rolls that
+  failed to download are saved to --state; --incremental retries the failed
+  rolls, fetches only rolls after that mark and writes the same CSV a full
+  rebuild would.
+- --parse-workers N parses on a process pool fed by the fetch threads;
+  workers return partial counters that are merged per partition.
+- --matrix-dir keeps every member's position on every roll (vote_matrix.py)
+  so later KPIs don't need another download + parse.
 """
 
 import argparse
 import csv
+import io
 import sys
-import time
-from collections import defaultdict
-from typing import Dict, Iterable, Optional, Tuple
+from collections import defaultdict, deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from itertools import count
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
 from xml.etree import ElementTree as ET
 
 try:
@@ -27,12 +45,23 @@ except Exception as e:
     print("This script requires the 'requests' package. Install with: pip install requests", file=sys.stderr)
     raise
 
+import http_client
+import jsonio
+import raw_cache
+from http_client import HostRateLimiter
+
 HOUSE_URL = "https://clerk.house.gov/evs/{year}/roll{num:03d}.xml"
 SENATE_MENU_URL = "https://www.senate.gov/legislative/LIS/roll_call_lists/vote_menu_{congress}_{session}.xml"
-SENATE_VOTE_URL = "https://www.senate.gov/legislative/LIS/roll_call_votes/vote{congress}_{session}/vote_{congress}_{session}_{num:05d}.xml"
+SENATE_VOTE_URL = "https://www.senate.gov/legislative/LIS/roll_call_votes/vote{congress}{session}/vote_{congress}_{session}_{num:05d}.xml"
 
 MISS_TOKENS = {"not voting", "absent"}
 
+DEFAULT_WORKERS = 4
+DEFAULT_RPS = 8.0  # roughly the old fixed 0.12s pacing, but per host
+HOUSE_MAX_GAP = 25  # stop a House year after this many consecutive missing rolls
+DEFAULT_PARSE_QUEUE = 16  # parse batches in flight when --parse-workers > 1
+PARSE_BATCH = 16  # XML files per process-pool task
+
 def parse_range(s: str) -> Tuple[int, int]:
     if "-" in s:
         a, b = s.split("-", 1)
@@ -40,19 +69,58 @@ def parse_range(s: str) -> Tuple[int, int]:
     v = int(s)
     return v, v
 
-def http_get(url: str, timeout: float = 15.0) -> Optional[requests.Response]:
-    for attempt in range(3):
+def http_get(url: str, timeout: float = 15.0, limiter: Optional[HostRateLimiter] = None) -> Optional[bytes]:
+    """
+    Return the body of url, or None. Finalized rolls come from the raw cache;
+    the Senate vote menus are revalidated with a conditional request. Requests
+    go through the shared pooled client (http_client.py), which retries.
+    """
+    def download(headers: Dict[str, str]):
         try:
-            r = requests.get(url, timeout=timeout)
-            if r.status_code == 200 and r.content:
-                return r
-            if r.status_code in (404, 410):
-                return None
-            # throttle on non-200
-            time.sleep(0.5 * (attempt + 1))
+            r = http_client.get_client().get(url, headers=headers, timeout=timeout, limiter=limiter)
         except requests.RequestException:
-            time.sleep(0.5 * (attempt + 1))
-    return None
+            return None, None, {}
+        if r.status_code == 200 and r.content:
+            return r.status_code, r.content, r.headers
+        return r.status_code, None, r.headers
+
+    return raw_cache.cached_get(url, download)
+
+def fetch_in_order(
+    urls: Iterable[str],
+    workers: int = DEFAULT_WORKERS,
+    limiter: Optional[HostRateLimiter] = None,
+) -> Iterator[Tuple[str, Optional[bytes]]]:
+    """
+    Fetch urls on a bounded thread pool and yield (url, content-or-None) in the
+    same order as the input. At most 2 * workers requests are in flight, so the
+    input may be an unbounded generator; when the consumer stops iterating,
+    pending requests are cancelled.
+    """
+    def fetch(url: str) -> Optional[bytes]:
+        return http_get(url, limiter=limiter)
+
+    if workers <= 1:
+        for url in urls:
+            yield url, fetch(url)
+        return
+
+    pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="rollcall-fetch")
+    pending = deque()
+    it = iter(urls)
+    try:
+        for url in it:
+            pending.append((url, pool.submit(fetch, url)))
+            if len(pending) >= 2 * workers:
+                break
+        while pending:
+            url, fut = pending.popleft()
+            nxt = next(it, None)
+            if nxt is not None:
+                pending.append((nxt, pool.submit(fetch, nxt)))
+            yield url, fut.result()
+    finally:
+        pool.shutdown(wait=False, cancel_futures=True)
 
 def find_text(elem: ET.Element, path_variants: Iterable[str]) -> Optional[str]:
     for p in path_variants:
@@ -114,71 +182,220 @@ def extract_vote_from_house_recorded_vote(rv: ET.Element) -> Optional[str]:
     v = find_text(rv, ("./vote",))
     return v
 
-def parse_house_vote_xml(xml_bytes: bytes, totals: Dict[str, int], missed: Dict[str, int]) -> None:
+HOUSE_ID_ATTRS = ("name-id", "bioguide_id", "bioguide", "bioguide-id")
+SENATE_ID_TAGS = ("bioguide_id", "bioguide", "bioguide-id")
+SENATE_VOTE_TAGS = ("vote_cast", "vote", "position")
+
+def _first_text(children: Dict[str, ET.Element], tags: Iterable[str]) -> Optional[str]:
+    # Same precedence as find_text(): first element per tag, first non-empty tag wins.
+    for tag in tags:
+        el = children.get(tag)
+        if el is not None and el.text is not None:
+            t = el.text.strip()
+            if t:
+                return t
+    return None
+
+MONTHS = {m: i for i, m in enumerate(
+    ("jan", "feb", "mar", "apr", "may", "jun", "jul", "aug", "sep", "oct", "nov", "dec"), start=1)}
+
+def roll_date_iso(text: Optional[str]) -> Optional[str]:
+    """
+    House action-date ("17-Jul-2025") or Senate vote_date ("July 17, 2025,
+    11:43 AM") -> "2025-07-17". Returns None if unrecognized.
+    """
+    if not text:
+        return None
+    t = text.strip()
+    parts = t.split("-")
     try:
-        root = ET.fromstring(xml_bytes)
-    except ET.ParseError:
-        return
-    # Try both common paths
-    recorded_votes = list(root.findall(".//recorded-vote"))
-    if not recorded_votes:
-        # Some older files use <record-vote>
-        recorded_votes = list(root.findall(".//record-vote"))
-    for rv in recorded_votes:
-        gid = extract_bioguide_from_house_recorded_vote(rv)
+        if len(parts) == 3 and parts[1][:3].lower() in MONTHS:
+            return f"{int(parts[2]):04d}-{MONTHS[parts[1][:3].lower()]:02d}-{int(parts[0]):02d}"
+        words = t.replace(",", " ").split()
+        if len(words) >= 3 and words[0][:3].lower() in MONTHS:
+            return f"{int(words[2]):04d}-{MONTHS[words[0][:3].lower()]:02d}-{int(words[1]):02d}"
+    except ValueError:
+        return None
+    return None
+
+def iter_house_positions(xml_bytes: bytes, info: Optional[Dict[str, Any]] = None) -> Iterator[Tuple[str, Optional[str]]]:
+    """
+    Stream (bioguide, position) records out of a House roll-call XML with
+    iterparse, clearing each <recorded-vote> once read so memory stays flat.
+    Picks <legislator name-id> and <vote> in one pass over the children and
+    only falls back to extract_bioguide_from_house_recorded_vote() for odd
+    files. Older <record-vote> files are handled the same way (they are only
+    used when a file has no <recorded-vote> at all, as before).
+
+    If `info` is given it is filled with "date" (ISO action-date) and
+    "parties" (bioguide -> party attribute) for the vote matrix.
+
+    Raises ET.ParseError on malformed XML.
+    """
+    older = []
+    seen_recorded = False
+    parties = info.setdefault("parties", {}) if info is not None else None
+    for _event, el in ET.iterparse(io.BytesIO(xml_bytes), events=("end",)):
+        tag = el.tag
+        if tag != "recorded-vote" and tag != "record-vote":
+            if tag == "action-date" and info is not None:
+                info["date"] = roll_date_iso(el.text)
+            continue
+        leg = vote = None
+        for child in el:
+            if child.tag == "legislator":
+                if leg is None:
+                    leg = child
+            elif child.tag == "vote":
+                if vote is None:
+                    vote = child
+        gid = get_attr_any(leg, HOUSE_ID_ATTRS) if leg is not None else None
+        if not gid:
+            gid = extract_bioguide_from_house_recorded_vote(el)
+        text = vote.text.strip() or None if vote is not None and vote.text is not None else None
+        if parties is not None and gid and leg is not None and leg.get("party"):
+            parties[gid] = leg.get("party")
+        el.clear()
         if not gid:
             continue
-        vote_text = extract_vote_from_house_recorded_vote(rv)
+        if tag == "recorded-vote":
+            seen_recorded = True
+            yield gid, text
+        elif not seen_recorded:
+            older.append((gid, text))
+    if not seen_recorded:
+        yield from older
+
+def iter_senate_positions(xml_bytes: bytes, info: Optional[Dict[str, Any]] = None) -> Iterator[Tuple[str, Optional[str]]]:
+    """Streaming counterpart of iter_house_positions for LIS <member> records."""
+    parties = info.setdefault("parties", {}) if info is not None else None
+    for _event, el in ET.iterparse(io.BytesIO(xml_bytes), events=("end",)):
+        if el.tag != "member":
+            if el.tag == "vote_date" and info is not None and "date" not in info:
+                info["date"] = roll_date_iso(el.text)
+            continue
+        children: Dict[str, ET.Element] = {}
+        for child in el:
+            children.setdefault(child.tag, child)
+        gid = _first_text(children, SENATE_ID_TAGS)
+        if not gid:
+            # Try attributes as backup
+            gid = get_attr_any(el, SENATE_ID_TAGS)
+        vote = _first_text(children, SENATE_VOTE_TAGS)
+        if parties is not None and gid:
+            party = _first_text(children, ("party",))
+            if party:
+                parties[gid] = party
+        el.clear()
+        if gid:
+            yield gid, vote
+
+def count_positions(chamber: str, records: Iterable[Tuple[str, Optional[str]]], totals: Dict[str, int], missed: Dict[str, int]) -> None:
+    miss_tokens = MISS_TOKENS if chamber == "house" else MISS_TOKENS | {"present not voting"}
+    for gid, vote_text in records:
         totals[gid] += 1
-        if normalize_vote_text(vote_text) in MISS_TOKENS:
+        if normalize_vote_text(vote_text) in miss_tokens:
             missed[gid] += 1
 
-def iter_house(year_start: int, year_end: int) -> Iterable[Tuple[int, bytes]]:
+def read_roll(chamber: str, xml_bytes: bytes, info: Optional[Dict[str, Any]] = None) -> Optional[List[Tuple[str, Optional[str]]]]:
+    """All (bioguide, position) records of one roll, or None if the XML is malformed."""
+    positions = iter_house_positions if chamber == "house" else iter_senate_positions
+    try:
+        # Materialize first so a file that breaks half-way counts for nothing.
+        return list(positions(xml_bytes, info))
+    except ET.ParseError:
+        return None
+
+def parse_house_vote_xml(xml_bytes: bytes, totals: Dict[str, int], missed: Dict[str, int]) -> None:
+    records = read_roll("house", xml_bytes)
+    if records is not None:
+        count_positions("house", records, totals, missed)
+
+def iter_house_rolls(
+    year_start: int,
+    year_end: int,
+    workers: int = DEFAULT_WORKERS,
+    rps: float = DEFAULT_RPS,
+    start_after: Optional[Dict[int, int]] = None,
+    retry: Optional[Dict[int, Iterable[int]]] = None,
+    failed: Optional[Dict[int, List[int]]] = None,
+) -> Iterable[Tuple[int, int, bytes]]:
+    """
+    Yield (year, roll, bytes); start_after maps year -> last roll already
+    processed. Rolls in retry (year -> rolls that failed last time) are
+    fetched first. Rolls that fail before a later roll of the same year
+    succeeds are appended to failed[year]; misses past the last roll are
+    just the end of the year.
+    """
+    limiter = HostRateLimiter(rps)
+    start_after = start_after or {}
+    retry = retry or {}
     for y in range(year_start, year_end + 1):
-        consecutive_misses = 0
-        n = 1
-        while True:
-            url = HOUSE_URL.format(year=y, num=n)
-            r = http_get(url)
-            if not r:
-                consecutive_misses += 1
+        again = sorted(retry.get(y, ()))
+        urls = [HOUSE_URL.format(year=y, num=n) for n in again]
+        for num, (_url, content) in zip(again, fetch_in_order(urls, workers, limiter)):
+            if content:
+                yield (y, num, content)
+            elif failed is not None:
+                failed.setdefault(y, []).append(num)
+
+        misses: List[int] = []
+        first = start_after.get(y, 0) + 1
+        nums = count(first)
+        urls = (HOUSE_URL.format(year=y, num=n) for n in count(first))
+        for num, (_url, content) in zip(nums, fetch_in_order(urls, workers, limiter)):
+            if not content:
+                misses.append(num)
                 # stop after 25 consecutive gaps to avoid scanning the whole year if early stop
-                if consecutive_misses >= 25:
+                if len(misses) >= HOUSE_MAX_GAP:
                     break
             else:
-                consecutive_misses = 0
-                yield (y, r.content)
-            n += 1
-            time.sleep(0.12)  # polite pacing
+                if misses and failed is not None:
+                    failed.setdefault(y, []).extend(misses)
+                misses = []
+                yield (y, num, content)
 
-def parse_senate_vote_xml(xml_bytes: bytes, totals: Dict[str, int], missed: Dict[str, int]) -> None:
-    try:
-        root = ET.fromstring(xml_bytes)
-    except ET.ParseError:
-        return
+def iter_house(
+    year_start: int,
+    year_end: int,
+    workers: int = DEFAULT_WORKERS,
+    rps: float = DEFAULT_RPS,
+) -> Iterable[Tuple[int, bytes]]:
+    for y, _num, content in iter_house_rolls(year_start, year_end, workers, rps):
+        yield (y, content)
 
+def parse_senate_vote_xml(xml_bytes: bytes, totals: Dict[str, int], missed: Dict[str, int]) -> None:
     # Typical path: /roll_call_vote/members/member
-    for m in root.findall(".//member"):
-        gid = find_text(m, ("./bioguide_id", "./bioguide", "./bioguide-id"))
-        if not gid:
-            # Try attributes as backup
-            gid = get_attr_any(m, ("bioguide_id", "bioguide", "bioguide-id"))
-        if not gid:
-            continue
-        v = find_text(m, ("./vote_cast", "./vote", "./position"))
-        totals[gid] += 1
-        if normalize_vote_text(v) in MISS_TOKENS or normalize_vote_text(v) in {"present not voting"}:
-            missed[gid] += 1
+    records = read_roll("senate", xml_bytes)
+    if records is not None:
+        count_positions("senate", records, totals, missed)
 
-def iter_senate(cong_start: int, cong_end: int) -> Iterable[Tuple[str, int, bytes]]:
+def iter_senate(
+    cong_start: int,
+    cong_end: int,
+    workers: int = DEFAULT_WORKERS,
+    rps: float = DEFAULT_RPS,
+    start_after: Optional[Dict[str, int]] = None,
+    retry: Optional[Dict[str, Iterable[int]]] = None,
+    failed: Optional[Dict[str, List[int]]] = None,
+) -> Iterable[Tuple[str, int, bytes]]:
+    """
+    Yield (cong_sess, num, bytes); start_after maps "119_1" -> last vote
+    already processed. Votes in retry ("119_1" -> votes that failed last
+    time) are fetched again; listed votes that fail are appended to
+    failed[cong_sess].
+    """
+    limiter = HostRateLimiter(rps)
+    start_after = start_after or {}
+    retry = retry or {}
     for c in range(cong_start, cong_end + 1):
         for s in (1, 2):
             menu_url = SENATE_MENU_URL.format(congress=c, session=s)
-            menu = http_get(menu_url)
+            menu = http_get(menu_url, limiter=limiter)
             if not menu:
                 continue
             try:
-                menu_root = ET.fromstring(menu.content)
+                menu_root = ET.fromstring(menu)
             except ET.ParseError:
                 continue
             # In menu, votes listed with <vote_number> elements
@@ -192,34 +409,208 @@ def iter_senate(cong_start: int, cong_end: int) -> Iterable[Tuple[str, int, byte
                 # fallback: try to infer count up to 1000
                 vote_nums = list(range(1, 1001))
 
-            for num in sorted(set(vote_nums)):
-                vote_url = SENATE_VOTE_URL.format(congress=c, session=s, num=num)
-                r = http_get(vote_url)
-                if not r:
+            mark = start_after.get(f"{c}_{s}", 0)
+            nums = sorted({n for n in vote_nums if n > mark} | set(retry.get(f"{c}_{s}", ())))
+            urls = [SENATE_VOTE_URL.format(congress=c, session=s, num=num) for num in nums]
+            for num, (_url, content) in zip(nums, fetch_in_order(urls, workers, limiter)):
+                if not content:
+                    if failed is not None:
+                        failed.setdefault(f"{c}_{s}", []).append(num)
                     continue
-                yield (f"{c}_{s}", num, r.content)
-                time.sleep(0.12)
+                yield (f"{c}_{s}", num, content)
+
+def new_partition() -> Dict[str, Any]:
+    return {"mark": 0, "failed": set(), "totals": defaultdict(int), "missed": defaultdict(int)}
+
+def load_partitions(path: Path) -> Dict[str, Dict[str, Any]]:
+    """
+    Load per-partition aggregates ("house:2025", "senate:119_1"), each with
+    its high-water mark (last roll folded in) and the rolls below the mark
+    that failed to download. Missing/corrupt -> empty.
+    """
+    try:
+        raw = jsonio.load_file(path)
+    except (OSError, ValueError):
+        return {}
+    parts: Dict[str, Dict[str, Any]] = {}
+    for key, p in (raw.get("partitions") or {}).items():
+        part = new_partition()
+        part["mark"] = int(p.get("mark") or 0)
+        part["failed"].update(int(n) for n in p.get("failed") or ())
+        part["totals"].update(p.get("totals") or {})
+        part["missed"].update(p.get("missed") or {})
+        parts[key] = part
+    return parts
+
+def save_partitions(path: Path, parts: Dict[str, Dict[str, Any]]) -> None:
+    out = {
+        "version": 1,
+        "partitions": {
+            key: {"mark": p["mark"], "failed": sorted(p["failed"]), "totals": dict(sorted(p["totals"].items())), "missed": dict(sorted(p["missed"].items()))}
+            for key, p in sorted(parts.items())
+        },
+    }
+    jsonio.dump_file(path, out)
+
+def parse_batch(
+    key: str,
+    chamber: str,
+    items: List[Tuple[int, bytes]],
+    want_rows: bool = False,
+) -> Tuple[Dict[str, int], Dict[str, int], List[tuple]]:
+    """
+    Parse a batch of one partition's (roll, xml) into partial counters and,
+    if want_rows, (roll_id, date, positions, parties) rows for the vote matrix.
+    Runs in the process pool when --parse-workers > 1.
+    """
+    totals: Dict[str, int] = defaultdict(int)
+    missed: Dict[str, int] = defaultdict(int)
+    rows: List[tuple] = []
+    for num, xml_bytes in items:
+        info: Dict[str, Any] = {}
+        records = read_roll(chamber, xml_bytes, info if want_rows else None)
+        if records is None:
+            continue
+        count_positions(chamber, records, totals, missed)
+        if want_rows:
+            rows.append((f"{key}:{num}", info.get("date"), records, info.get("parties", {})))
+    return dict(totals), dict(missed), rows
+
+def merge_counts(part: Dict[str, Any], totals: Dict[str, int], missed: Dict[str, int]) -> None:
+    for gid, n in totals.items():
+        part["totals"][gid] += n
+    for gid, n in missed.items():
+        part["missed"][gid] += n
+
+def fold_rolls(
+    parts: Dict[str, Dict[str, Any]],
+    rolls: Iterable[Tuple[str, str, int, bytes]],
+    parse_workers: int = 0,
+    queue_size: int = DEFAULT_PARSE_QUEUE,
+    batch_size: int = PARSE_BATCH,
+    matrix_rows: Optional[List[tuple]] = None,
+) -> None:
+    """
+    Fold (partition_key, chamber, roll, xml_bytes) into parts, advancing each
+    partition's mark and clearing the roll from its failed set. With parse_workers > 1 the XML is parsed on a process
+    pool in batches; at most queue_size batches are outstanding, so the fetch
+    stage is throttled instead of buffering a whole backfill in memory.
+    Matrix rows are collected into matrix_rows when it is given.
+    """
+    want_rows = matrix_rows is not None
+
+    def merge(key: str, result) -> None:
+        totals, missed, rows = result
+        merge_counts(parts[key], totals, missed)
+        if want_rows:
+            matrix_rows.extend(rows)
+
+    if parse_workers <= 1:
+        for key, chamber, num, xml_bytes in rolls:
+            merge(key, parse_batch(key, chamber, [(num, xml_bytes)], want_rows))
+            parts[key]["mark"] = max(parts[key]["mark"], num)
+            parts[key]["failed"].discard(num)
+        return
+
+    pending: deque = deque()
+    batches: Dict[Tuple[str, str], List[Tuple[int, bytes]]] = {}
+    with ProcessPoolExecutor(max_workers=parse_workers) as pool:
+        def submit(key: str, chamber: str) -> None:
+            items = batches.pop((key, chamber))
+            pending.append((key, pool.submit(parse_batch, key, chamber, items, want_rows)))
+            while len(pending) >= queue_size:
+                done_key, fut = pending.popleft()
+                merge(done_key, fut.result())
+
+        for key, chamber, num, xml_bytes in rolls:
+            batches.setdefault((key, chamber), []).append((num, xml_bytes))
+            parts[key]["mark"] = max(parts[key]["mark"], num)
+            parts[key]["failed"].discard(num)
+            if len(batches[(key, chamber)]) >= batch_size:
+                submit(key, chamber)
+        for key, chamber in list(batches):
+            submit(key, chamber)
+        while pending:
+            done_key, fut = pending.popleft()
+            merge(done_key, fut.result())
 
 def main():
     ap = argparse.ArgumentParser(description="Aggregate per-member votes and missed votes from official House and Senate feeds.")
     ap.add_argument("--house-years", default="2023-2025", help="Year range for House EVS, e.g., 1990-2025 or single year 2024")
     ap.add_argument("--congress", default="118-118", help="Congress range for Senate, e.g., 101-118")
     ap.add_argument("-o", "--output", default="votes_missed.csv", help="Output CSV path")
+    ap.add_argument("--workers", type=int, default=DEFAULT_WORKERS, help="Concurrent downloads (1 = sequential)")
+    ap.add_argument("--rps", type=float, default=DEFAULT_RPS, help="Max requests per second per host (0 = unlimited)")
+    ap.add_argument("--incremental", action="store_true", help="Only fetch rolls after the marks saved in --state")
+    ap.add_argument("--state", default=None, help="Aggregate state file (default: <output>.state.json)")
+    ap.add_argument("--parse-workers", type=int, default=0, help="Parser processes (0/1 = parse inline)")
+    ap.add_argument("--queue-size", type=int, default=DEFAULT_PARSE_QUEUE, help="Max parse batches in flight")
+    ap.add_argument("--matrix-dir", default=None, help="Also write the per-member position matrix here (needs numpy)")
+    raw_cache.add_cache_arguments(ap)
     args = ap.parse_args()
+    raw_cache.configure(args.cache_dir, offline=args.offline)
+    http_client.configure(max_per_host=max(args.workers, http_client.DEFAULT_MAX_PER_HOST))
 
     y0, y1 = parse_range(args.house_years)
     c0, c1 = parse_range(args.congress)
 
-    totals: Dict[str, int] = defaultdict(int)
-    missed: Dict[str, int] = defaultdict(int)
+    state_path = Path(args.state) if args.state else Path(args.output).with_suffix(".state.json")
+    parts = load_partitions(state_path) if args.incremental else {}
+    house_keys = {y: f"house:{y}" for y in range(y0, y1 + 1)}
+    senate_keys = {f"{c}_{s}": f"senate:{c}_{s}" for c in range(c0, c1 + 1) for s in (1, 2)}
+    for key in list(house_keys.values()) + list(senate_keys.values()):
+        parts.setdefault(key, new_partition())
+
+    house_marks = {y: parts[k]["mark"] for y, k in house_keys.items()}
+    senate_marks = {cs: parts[k]["mark"] for cs, k in senate_keys.items()}
+    # Rolls that failed below a mark are retried first; the mark alone would
+    # skip them forever.
+    house_retry = {y: sorted(parts[k]["failed"]) for y, k in house_keys.items()}
+    senate_retry = {cs: sorted(parts[k]["failed"]) for cs, k in senate_keys.items()}
+    house_failed: Dict[int, List[int]] = {}
+    senate_failed: Dict[str, List[int]] = {}
+
+    def rolls() -> Iterator[Tuple[str, str, int, bytes]]:
+        # House
+        for year, num, xml_bytes in iter_house_rolls(
+            y0, y1, args.workers, args.rps, start_after=house_marks, retry=house_retry, failed=house_failed
+        ):
+            yield house_keys[year], "house", num, xml_bytes
+        # Senate
+        for cong_sess, num, xml_bytes in iter_senate(
+            c0, c1, args.workers, args.rps, start_after=senate_marks, retry=senate_retry, failed=senate_failed
+        ):
+            yield senate_keys[cong_sess], "senate", num, xml_bytes
 
-    # House
-    for _year, xml_bytes in iter_house(y0, y1):
-        parse_house_vote_xml(xml_bytes, totals, missed)
+    matrix_rows: Optional[List[tuple]] = [] if args.matrix_dir else None
+    fold_rolls(parts, rolls(), args.parse_workers, max(1, args.queue_size), matrix_rows=matrix_rows)
+    for year, nums in house_failed.items():
+        parts[house_keys[year]]["failed"].update(nums)
+    for cong_sess, nums in senate_failed.items():
+        parts[senate_keys[cong_sess]]["failed"].update(nums)
+    n_failed = sum(len(parts[k]["failed"]) for k in list(house_keys.values()) + list(senate_keys.values()))
+    if n_failed:
+        print(f"{n_failed} roll(s) failed to download; --incremental retries them from {state_path}")
 
-    # Senate
-    for _cong_sess, _num, xml_bytes in iter_senate(c0, c1):
-        parse_senate_vote_xml(xml_bytes, totals, missed)
+    if args.matrix_dir:
+        import vote_matrix
+
+        matrix = vote_matrix.VoteMatrix.load(Path(args.matrix_dir)) if args.incremental else vote_matrix.VoteMatrix.empty()
+        matrix = matrix.append(vote_matrix.RollRow(*row) for row in matrix_rows)
+        matrix.save(Path(args.matrix_dir))
+        print(f"Wrote vote matrix {args.matrix_dir}: {matrix.shape[0]} rolls x {matrix.shape[1]} members")
+
+    save_partitions(state_path, parts)
+
+    # Sum only the partitions in the requested range, so the CSV matches a
+    # full rebuild even if the state holds other years/congresses.
+    totals: Dict[str, int] = defaultdict(int)
+    missed: Dict[str, int] = defaultdict(int)
+    for key in list(house_keys.values()) + list(senate_keys.values()):
+        for gid, n in parts[key]["totals"].items():
+            totals[gid] += n
+        for gid, n in parts[key]["missed"].items():
+            missed[gid] += n
 
     # Write CSV
     with open(args.output, "w", newline="", encoding="utf-8") as f:
@@ -229,6 +620,7 @@ def main():
             w.writerow([gid, totals[gid], missed.get(gid, 0)])
 
     print(f"Wrote {args.output}. Rows: {len(totals)}")
+    print(http_client.get_client().report())
 
 if __name__ == "__main__":
     main()
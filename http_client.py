@@ -0,0 +1,241 @@
+"""
+http_client.py
+
+Shared HTTP client for every fetcher (capitol_league_rollcall_aggregate,
+official_votes, build_master_data's GovTrack fetch).
+
+- One requests.Session per host, so connections are pooled and kept alive
+  instead of a new TCP+TLS handshake per XML file.
+- At most `max_per_host` requests in flight per host, plus an optional
+  per-host request rate (HostRateLimiter).
+- Retries connection errors, 429 and 5xx with jittered exponential backoff,
+  honoring Retry-After when the server sends it.
+- stats() reports connections opened vs reused so the saving is measurable.
+- CAPITOL_HTTP_REMAP="host=base,..." sends requests for a host to another
+  base URL (`*` matches every host), e.g. to replay against
+  scripts/fake_sources.py. Callers and the raw cache still see the original URL.
+"""
+
+from __future__ import annotations
+
+import email.utils
+import os
+import random
+import threading
+import time
+from typing import Dict, Mapping, Optional
+from urllib.parse import urlparse, urlsplit, urlunsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+
+USER_AGENT = "CapitolLeague/1.0 (+https://example.com)"
+
+DEFAULT_MAX_PER_HOST = int(os.environ.get("CAPITOL_HTTP_MAX_PER_HOST") or 8)
+DEFAULT_ATTEMPTS = 3
+BACKOFF_BASE = 0.5  # seconds; doubles each attempt
+BACKOFF_CAP = 30.0
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+
+
+def parse_remap(value: Optional[str]) -> Dict[str, str]:
+    """"clerk.house.gov=http://127.0.0.1:8765,*=http://..." -> {host: base}."""
+    remap: Dict[str, str] = {}
+    for item in (value or "").split(","):
+        host, sep, base = item.strip().partition("=")
+        if sep and host.strip() and base.strip():
+            remap[host.strip()] = base.strip().rstrip("/")
+    return remap
+
+
+def remap_url(url: str, remap: Mapping[str, str]) -> str:
+    """url with its scheme and host replaced per `remap`; path and query kept."""
+    if not remap:
+        return url
+    parts = urlsplit(url)
+    base = remap.get(parts.netloc) or remap.get("*")
+    if not base:
+        return url
+    target = urlsplit(base)
+    return urlunsplit((target.scheme, target.netloc, target.path + parts.path, parts.query, parts.fragment))
+
+
+class HostRateLimiter:
+    """
+    Spaces request starts so that each host sees at most `rps` requests per
+    second, no matter how many worker threads are fetching. rps <= 0 disables it.
+    """
+
+    def __init__(self, rps: float = 0.0):
+        self.interval = 1.0 / rps if rps and rps > 0 else 0.0
+        self._lock = threading.Lock()
+        self._next_slot: Dict[str, float] = {}
+
+    def wait(self, url: str) -> None:
+        if not self.interval:
+            return
+        host = urlparse(url).netloc
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot.get(host, now))
+            self._next_slot[host] = slot + self.interval
+        if slot > now:
+            time.sleep(slot - now)
+
+
+def retry_after_seconds(value: Optional[str]) -> Optional[float]:
+    """Parse a Retry-After header (delta-seconds or HTTP-date)."""
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        when = email.utils.parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, when.timestamp() - time.time())
+
+
+class HttpClient:
+    def __init__(
+        self,
+        max_per_host: int = DEFAULT_MAX_PER_HOST,
+        rps: float = 0.0,
+        attempts: int = DEFAULT_ATTEMPTS,
+        remap: Optional[Mapping[str, str]] = None,
+    ):
+        self.max_per_host = max_per_host
+        self.attempts = attempts
+        self.limiter = HostRateLimiter(rps)
+        self._lock = threading.Lock()
+        self._sessions: Dict[str, requests.Session] = {}
+        self._slots: Dict[str, threading.BoundedSemaphore] = {}
+        self.remap = dict(parse_remap(os.environ.get("CAPITOL_HTTP_REMAP")) if remap is None else remap)
+        self.requests_sent = 0
+        self.retries = 0
+        self.bytes_received = 0
+
+    def _host_state(self, host: str):
+        with self._lock:
+            session = self._sessions.get(host)
+            if session is None:
+                session = requests.Session()
+                session.headers["User-Agent"] = USER_AGENT
+                adapter = HTTPAdapter(pool_connections=1, pool_maxsize=self.max_per_host, max_retries=0)
+                session.mount("http://", adapter)
+                session.mount("https://", adapter)
+                self._sessions[host] = session
+                self._slots[host] = threading.BoundedSemaphore(self.max_per_host)
+            return session, self._slots[host]
+
+    def _backoff(self, attempt: int, resp: Optional[requests.Response]) -> None:
+        delay = retry_after_seconds(resp.headers.get("Retry-After")) if resp is not None else None
+        if delay is None:
+            delay = min(BACKOFF_CAP, BACKOFF_BASE * (2 ** attempt)) * random.uniform(0.5, 1.5)
+        time.sleep(min(delay, BACKOFF_CAP))
+
+    def get(
+        self,
+        url: str,
+        params: Optional[Mapping[str, object]] = None,
+        headers: Optional[Mapping[str, str]] = None,
+        timeout: float = 20.0,
+        limiter: Optional[HostRateLimiter] = None,
+    ) -> requests.Response:
+        """
+        GET url through the host's pooled session. Returns the final response
+        (which may still be an error status); raises the last
+        requests.RequestException if every attempt failed to connect.
+        """
+        # Session, slot and rate limit belong to the original host, so a
+        # remapped replay paces and pools requests exactly like production.
+        session, slot = self._host_state(urlparse(url).netloc)
+        target = remap_url(url, self.remap)
+        limiter = limiter or self.limiter
+        last_exc: Optional[requests.RequestException] = None
+        resp: Optional[requests.Response] = None
+        for attempt in range(self.attempts):
+            if attempt:
+                with self._lock:
+                    self.retries += 1
+                self._backoff(attempt - 1, resp)
+            limiter.wait(url)
+            try:
+                with slot:
+                    with self._lock:
+                        self.requests_sent += 1
+                    resp = session.get(target, params=params, headers=headers, timeout=timeout)
+            except requests.RequestException as exc:
+                last_exc = exc
+                resp = None
+                continue
+            with self._lock:
+                self.bytes_received += len(resp.content)
+            if resp.status_code not in RETRY_STATUSES:
+                return resp
+        if resp is not None:
+            return resp
+        assert last_exc is not None
+        raise last_exc
+
+    def stats(self) -> Dict[str, int]:
+        opened = 0
+        pooled_requests = 0
+        with self._lock:
+            sessions = list(self._sessions.values())
+        for session in sessions:
+            for adapter in set(session.adapters.values()):
+                pools = adapter.poolmanager.pools
+                for key in list(pools.keys()):
+                    pool = pools.get(key)
+                    if pool is None:
+                        continue
+                    opened += pool.num_connections
+                    pooled_requests += pool.num_requests
+        return {
+            "hosts": len(sessions),
+            "requests": self.requests_sent,
+            "retries": self.retries,
+            "bytesReceived": self.bytes_received,
+            "connectionsOpened": opened,
+            "connectionsReused": max(0, pooled_requests - opened),
+        }
+
+    def report(self) -> str:
+        s = self.stats()
+        return (
+            f"[http] {s['requests']} requests to {s['hosts']} host(s), "
+            f"{s['retries']} retries, {s['bytesReceived']} bytes, connections opened={s['connectionsOpened']} "
+            f"reused={s['connectionsReused']}"
+        )
+
+    def close(self) -> None:
+        with self._lock:
+            for session in self._sessions.values():
+                session.close()
+            self._sessions.clear()
+            self._slots.clear()
+
+
+_client: Optional[HttpClient] = None
+_client_lock = threading.Lock()
+
+
+def get_client() -> HttpClient:
+    """The process-wide client shared by all fetchers."""
+    global _client
+    with _client_lock:
+        if _client is None:
+            _client = HttpClient()
+        return _client
+
+
+def configure(max_per_host: int = DEFAULT_MAX_PER_HOST, rps: float = 0.0, attempts: int = DEFAULT_ATTEMPTS) -> HttpClient:
+    """Replace the shared client (e.g. from a script's --workers / --rps)."""
+    global _client
+    with _client_lock:
+        if _client is not None:
+            _client.close()
+        _client = HttpClient(max_per_host=max_per_host, rps=rps, attempts=attempts)
+        return _client
@@ -0,0 +1,215 @@
+"""
+json_stream.py
+
+Streaming JSON writer for the big build outputs (master_state.json,
+data/web/_index.json). Instead of building the whole document and handing it
+to one json.dump, write_json() walks it section by section:
+
+  - dict values are written key by key, recursing into nested dicts
+  - iterators / generators are written as arrays one item at a time, so a
+    section like votes.house.votes can come straight from a database cursor
+  - everything else (lists, strings, numbers) is encoded in one piece
+
+Values are encoded with jsonio. Output is compact, written to a temp file
+and renamed into place (the same atomic guarantee save_state always had),
+optionally with a gzip copy (`<name>.gz`) produced in the same pass.
+
+Next to the file, `<name>.idx` records the byte range of every section down
+to `index_depth` keys deep (3 by default), e.g.
+
+  {"version": 1, "size": 81234, "mtime": 1752761000000000000,
+   "sections": {"votes": [40, 80000], "votes.house": [49, 41000],
+   "votes.house.votes": [97, 40999], ...}}
+
+so load_section(path, "votes.house") seeks to that range and decodes just
+that value. Without a usable index it falls back to parsing the whole file.
+
+The index is written after the data file is renamed into place, so a reader
+can briefly see a new file next to the previous run's index. The index
+records the file's size and mtime; load_section only trusts it when both
+match (the `.gz` copy is checked through the plain file) and otherwise, or
+when a range doesn't decode, parses the whole file instead.
+"""
+
+from __future__ import annotations
+
+import gzip
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+import jsonio
+
+INDEX_VERSION = 1
+INDEX_DEPTH = 3
+FLUSH_BYTES = 256 * 1024
+
+def index_path(path: Path) -> Path:
+    path = Path(path)
+    return path.with_name(f"{path.name}.idx")
+
+
+def _is_stream(value: Any) -> bool:
+    return hasattr(value, "__next__") or (
+        isinstance(value, Iterable) and not isinstance(value, (str, bytes, dict, list, tuple))
+    )
+
+
+class _Sink:
+    """Buffers encoded chunks, counts bytes, fans out to one or more files."""
+
+    def __init__(self, files: List[Any]):
+        self.files = files
+        self.pos = 0
+        self._buf: List[bytes] = []
+        self._buffered = 0
+
+    def write(self, data: bytes) -> None:
+        self._buf.append(data)
+        self._buffered += len(data)
+        self.pos += len(data)
+        if self._buffered >= FLUSH_BYTES:
+            self.flush()
+
+    def flush(self) -> None:
+        if not self._buf:
+            return
+        data = b"".join(self._buf)
+        for f in self.files:
+            f.write(data)
+        self._buf = []
+        self._buffered = 0
+
+
+def _write_value(
+    sink: _Sink, value: Any, name: str, depth: int, max_depth: int, sections: Dict[str, List[int]]
+) -> None:
+    start = sink.pos
+    if isinstance(value, dict):
+        sink.write(b"{")
+        first = True
+        for key, item in value.items():
+            if not first:
+                sink.write(b",")
+            first = False
+            sink.write(jsonio.dumpb(str(key)) + b":")
+            child = f"{name}.{key}" if name else str(key)
+            _write_value(sink, item, child, depth + 1, max_depth, sections)
+        sink.write(b"}")
+    elif _is_stream(value):
+        sink.write(b"[")
+        first = True
+        for item in value:
+            if not first:
+                sink.write(b",")
+            first = False
+            sink.write(jsonio.dumpb(item))
+        sink.write(b"]")
+    else:
+        sink.write(jsonio.dumpb(value))
+    if name and depth <= max_depth:
+        sections[name] = [start, sink.pos]
+
+
+def write_json(
+    path: Path, doc: Dict[str, Any], gzip_copy: bool = False, index_depth: int = INDEX_DEPTH
+) -> Dict[str, List[int]]:
+    """
+    Stream `doc` to `path` (and `path`.gz when gzip_copy) atomically, then
+    write the section index (sections up to `index_depth` keys deep).
+    Returns the section offsets.
+    """
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    targets: List[Tuple[Path, Path]] = [(path, path.with_name(f".{path.name}.tmp"))]
+    if gzip_copy:
+        gz = path.with_name(f"{path.name}.gz")
+        targets.append((gz, gz.with_name(f".{gz.name}.tmp")))
+
+    sections: Dict[str, List[int]] = {}
+    handles: List[Any] = []
+    ok = False
+    try:
+        handles = [tmp.open("wb") for _final, tmp in targets]
+        files = list(handles[:1])
+        if gzip_copy:
+            files.append(gzip.GzipFile(fileobj=handles[1], mode="wb", compresslevel=6, mtime=0))
+        sink = _Sink(files)
+        _write_value(sink, doc, "", 0, index_depth, sections)
+        sink.flush()
+        for f in files[1:]:
+            f.close()
+        ok = True
+    finally:
+        for h in handles:
+            h.close()
+        if not ok:
+            for _final, tmp in targets:
+                tmp.unlink(missing_ok=True)
+
+    for final, tmp in targets:
+        tmp.replace(final)
+    index = {"version": INDEX_VERSION, "size": sink.pos, "mtime": path.stat().st_mtime_ns, "sections": sections}
+    jsonio.dump_file(index_path(path), index)
+    return sections
+
+
+def _load_index(path: Path) -> Optional[Dict[str, Any]]:
+    try:
+        index = jsonio.load_file(index_path(path))
+    except (OSError, ValueError):
+        return None
+    if index.get("version") != INDEX_VERSION:
+        return None
+    return index
+
+
+def _index_fresh(plain: Path, index: Dict[str, Any]) -> bool:
+    """False when `plain` was rewritten after the index (or is gone)."""
+    try:
+        st = plain.stat()
+    except OSError:
+        return False
+    return st.st_size == index.get("size") and index.get("mtime") in (None, st.st_mtime_ns)
+
+
+def _walk(doc: Any, section: str) -> Any:
+    for key in section.split("."):
+        if not isinstance(doc, dict) or key not in doc:
+            raise KeyError(section)
+        doc = doc[key]
+    return doc
+
+
+def load_section(path: Path, section: str) -> Any:
+    """
+    One dotted section of a file written by write_json ("votes.house",
+    "graphs"), reading only its byte range. Works on the `.gz` copy too.
+    Raises KeyError when the section doesn't exist.
+    """
+    path = Path(path)
+    compressed = path.suffix == ".gz"
+    plain = path.with_suffix("") if compressed else path
+    index = _load_index(plain)
+    opener = gzip.open if compressed else open
+
+    if index is not None and _index_fresh(plain, index):
+        sections = index.get("sections", {})
+        if section in sections:
+            start, end = sections[section]
+            with opener(path, "rb") as f:
+                f.seek(start)
+                data = f.read(end - start)
+            try:
+                return jsonio.loads(data)
+            except ValueError:
+                pass  # index out of date; parse the whole file below
+        else:
+            # deeper than the index: decode the nearest indexed ancestor
+            parts = section.split(".")
+            for n in range(len(parts) - 1, 0, -1):
+                parent = ".".join(parts[:n])
+                if parent in sections:
+                    return _walk(load_section(path, parent), ".".join(parts[n:]))
+
+    with opener(path, "rb") as f:
+        return _walk(jsonio.loads(f.read()), section)
@@ -0,0 +1,147 @@
+"""
+jsonio.py
+
+One place for JSON (de)serialization. Uses orjson when it is installed, then
+ujson, then the stdlib json module, so the build scripts and app.py get a
+native parser where available and still run everywhere.
+
+  loads(data)            str, bytes, bytearray or memoryview -> object
+  dumps(obj, ...)        -> str
+  dumpb(obj, ...)        -> UTF-8 bytes
+  load(fp) / dump(obj, fp, ...)
+                         text or binary file objects
+  load_file(path) / dump_file(path, obj, ...)
+                         whole files; dump_file writes a temp file and renames
+
+Output is UTF-8 (non-ASCII characters are not \\u-escaped) and compact unless
+indent is given. `default` is called for objects the backend can't encode,
+as in json.dumps. Decode errors are ValueError subclasses with every
+backend; JSONDecodeError is exported for except clauses.
+"""
+
+from __future__ import annotations
+
+import io
+import json
+from pathlib import Path
+from typing import Any, Callable, Optional
+
+try:
+    import orjson  # type: ignore
+except Exception:
+    orjson = None
+
+try:
+    import ujson  # type: ignore
+except Exception:
+    ujson = None
+
+if orjson is not None:
+    BACKEND = "orjson"
+elif ujson is not None:
+    BACKEND = "ujson"
+else:
+    BACKEND = "json"
+
+JSONDecodeError = ValueError
+
+
+def loads(data: Any) -> Any:
+    if isinstance(data, memoryview):
+        data = data.tobytes()
+    if orjson is not None:
+        return orjson.loads(data)
+    if ujson is not None:
+        return ujson.loads(data)
+    if isinstance(data, (bytes, bytearray)):
+        data = bytes(data).decode("utf-8")
+    return json.loads(data)
+
+
+def _fallback_dumps(obj: Any, indent: Optional[int], sort_keys: bool, default: Optional[Callable]) -> str:
+    if ujson is not None and default is None:
+        try:
+            return ujson.dumps(
+                obj, indent=indent or 0, sort_keys=sort_keys, ensure_ascii=False, escape_forward_slashes=False
+            )
+        except (TypeError, OverflowError):
+            pass
+    separators = None if indent else (",", ":")
+    return json.dumps(
+        obj, indent=indent, separators=separators, sort_keys=sort_keys, default=default, ensure_ascii=False
+    )
+
+
+def _orjson_dumps(obj: Any, indent: Optional[int], sort_keys: bool, default: Optional[Callable]) -> Optional[bytes]:
+    """orjson's encoding, or None when orjson is missing or can't encode obj."""
+    if orjson is None or indent not in (None, 2):
+        return None
+    option = orjson.OPT_NON_STR_KEYS
+    if indent:
+        option |= orjson.OPT_INDENT_2
+    if sort_keys:
+        option |= orjson.OPT_SORT_KEYS
+    try:
+        return orjson.dumps(obj, default=default, option=option)
+    except TypeError:
+        return None  # e.g. ints beyond 64 bits; the fallback handles those
+
+
+def dumpb(
+    obj: Any, indent: Optional[int] = None, sort_keys: bool = False, default: Optional[Callable] = None
+) -> bytes:
+    data = _orjson_dumps(obj, indent, sort_keys, default)
+    if data is not None:
+        return data
+    return _fallback_dumps(obj, indent, sort_keys, default).encode("utf-8")
+
+
+def dumps(
+    obj: Any, indent: Optional[int] = None, sort_keys: bool = False, default: Optional[Callable] = None
+) -> str:
+    data = _orjson_dumps(obj, indent, sort_keys, default)
+    if data is not None:
+        return data.decode("utf-8")
+    return _fallback_dumps(obj, indent, sort_keys, default)
+
+
+def _is_text(fp: Any) -> bool:
+    return isinstance(fp, io.TextIOBase) or "b" not in getattr(fp, "mode", "b")
+
+
+def load(fp: Any) -> Any:
+    return loads(fp.read())
+
+
+def dump(obj: Any, fp: Any, indent: Optional[int] = None, sort_keys: bool = False, default: Optional[Callable] = None) -> None:
+    if _is_text(fp):
+        fp.write(dumps(obj, indent=indent, sort_keys=sort_keys, default=default))
+    else:
+        fp.write(dumpb(obj, indent=indent, sort_keys=sort_keys, default=default))
+
+
+def load_file(path: Path) -> Any:
+    with open(path, "rb") as f:
+        return loads(f.read())
+
+
+def dump_file(
+    path: Path,
+    obj: Any,
+    indent: Optional[int] = None,
+    sort_keys: bool = False,
+    default: Optional[Callable] = None,
+    atomic: bool = True,
+) -> None:
+    path = Path(path)
+    data = dumpb(obj, indent=indent, sort_keys=sort_keys, default=default)
+    if not atomic:
+        path.write_bytes(data)
+        return
+    tmp = path.with_name(f".{path.name}.tmp")
+    try:
+        tmp.write_bytes(data)
+        tmp.replace(path)
+    except BaseException:
+        tmp.unlink(missing_ok=True)
+        raise
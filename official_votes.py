@@ -5,49 +5,209 @@ Official roll-call vote helpers for Capitol League.
 
 House:
   - Uses Clerk of the House rollcall XML.
+  - Keeps a persisted roll -> date index (house_roll_dates.json in the raw
+    cache directory), learned from the ROLL_*.asp range pages and from parsed
+    XML, so rolls outside the requested window are never downloaded.
 Senate:
-  - Stubbed to return [] for now; shape matches House results so we can
-    plug it into master_state and the spiderweb later.
+  - Uses the LIS vote_menu_{congress}_{session}.xml list and per-vote XML.
+    Menu dates pick the in-window votes before any vote XML is downloaded;
+    those are fetched concurrently under a per-host rate limit. Results have
+    the same shape as the House ones, with "S-..." ids.
 """
 
 import re
 import datetime as dt
-from typing import List, Dict, Any, Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Dict, Any, Optional, Tuple
 
-import requests
 import xml.etree.ElementTree as ET
 
+import http_client
+import jsonio
+import raw_cache
+
 HOUSE_INDEX_URL = "https://clerk.house.gov/evs/{year}/index.asp"
 HOUSE_ROLL_RANGE_URL = "https://clerk.house.gov/evs/{year}/ROLL_{start}.asp"
 HOUSE_ROLL_XML_URL = "https://clerk.house.gov/evs/{year}/roll{roll:03d}.xml"
 
+HOUSE_ROLL_INDEX_FILE = "house_roll_dates.json"
+ROLLS_PER_RANGE_PAGE = 100
+
+_MONTHS = {m: i for i, m in enumerate(
+    ("jan", "feb", "mar", "apr", "may", "jun", "jul", "aug", "sep", "oct", "nov", "dec"), start=1)}
+
 SENATE_MENU_URL = "https://www.senate.gov/legislative/LIS/roll_call_lists/vote_menu_{congress}_{session}.xml"
 SENATE_VOTE_XML_URL = "https://www.senate.gov/legislative/LIS/roll_call_votes/vote{congress}{session}/vote_{congress}_{session}_{roll:05d}.xml"
 
-
-def _safe_get(url: str, timeout: int = 30) -> Optional[str]:
+SENATE_WORKERS = 4
+SENATE_RPS = 4.0  # per-host request rate for vote XML downloads
+
+SENATE_PARTY_NAMES = {"R": "Republican", "D": "Democratic", "I": "Independent", "ID": "Independent"}
+SENATE_POSITION_KEYS = {
+    "yea": "yea",
+    "guilty": "yea",
+    "nay": "nay",
+    "not guilty": "nay",
+    "present": "present",
+    "not voting": "notVoting",
+}
+SENATE_DOC_TYPES = {
+    "s": "senate-bill",
+    "hr": "house-bill",
+    "sres": "senate-resolution",
+    "hres": "house-resolution",
+    "sjres": "senate-joint-resolution",
+    "hjres": "house-joint-resolution",
+    "sconres": "senate-concurrent-resolution",
+    "hconres": "house-concurrent-resolution",
+}
+
+
+def _download(url: str, timeout: int, limiter: Optional[http_client.HostRateLimiter] = None):
+    def download(validators: Dict[str, str]):
+        try:
+            resp = http_client.get_client().get(
+                url,
+                timeout=timeout,
+                limiter=limiter,
+                headers={
+                    "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
+                    **validators,
+                },
+            )
+        except Exception as exc:
+            print(f"[official_votes] ERROR fetching {url}: {exc}")
+            return None, None, {}
+
+        print(f"[official_votes] GET {url} -> {resp.status_code}")
+        return resp.status_code, resp.content if resp.ok else None, resp.headers
+
+    return download
+
+
+def _safe_get(
+    url: str, timeout: int = 30, limiter: Optional[http_client.HostRateLimiter] = None
+) -> Optional[str]:
     """
     Simple GET with a friendly User-Agent and debug logging.
     Returns response.text on 200, otherwise None.
+
+    Goes through the shared raw cache (raw_cache.py), so finalized roll XML
+    is only downloaded once and offline runs never hit the network; real
+    requests use the pooled keep-alive client in http_client.py.
     """
+    text, _changed = _conditional_get(url, timeout, limiter)
+    return text
+
+
+def _conditional_get(
+    url: str, timeout: int = 30, limiter: Optional[http_client.HostRateLimiter] = None
+) -> Tuple[Optional[str], bool]:
+    """
+    Like _safe_get, but also reports whether the page changed since the last
+    run (False on a 304 or identical content), so callers can reuse what they
+    parsed out of it last time via raw_cache meta.
+    """
+    body, changed = raw_cache.conditional_get(url, _download(url, timeout, limiter))
+    if body is None:
+        return None, False
+    return body.decode("utf-8", errors="replace"), changed
+
+
+def _clerk_date(text: Optional[str], year: Optional[int] = None) -> Optional[dt.date]:
+    """
+    Parse Clerk dates: action-date "17-Jul-2025", range-page "17-Jul" (needs
+    `year`), or ISO "2025-07-17". Returns None if unrecognized.
+    """
+    if not text:
+        return None
+    t = text.strip()
     try:
-        resp = requests.get(
-            url,
-            timeout=timeout,
-            headers={
-                "User-Agent": "CapitolLeague/1.0 (+https://example.com)",
-                "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
-            },
-        )
-    except Exception as exc:
-        print(f"[official_votes] ERROR fetching {url}: {exc}")
+        return dt.date.fromisoformat(t[:10])
+    except ValueError:
+        pass
+    parts = t.split("-")
+    try:
+        month = _MONTHS.get(parts[1][:3].lower()) if len(parts) >= 2 else None
+        if month is None:
+            return None
+        y = int(parts[2]) if len(parts) >= 3 else year
+        return dt.date(y, month, int(parts[0])) if y else None
+    except (ValueError, IndexError):
         return None
 
-    print(f"[official_votes] GET {url} -> {resp.status_code}")
-    if not resp.ok:
-        return None
 
-    return resp.text
+_RANGE_ROW_RE = re.compile(r"<tr", re.IGNORECASE)
+_RANGE_ROLL_RE = re.compile(r"rollnumber=(\d+)", re.IGNORECASE)
+_RANGE_DATE_RE = re.compile(r">\s*(\d{1,2}-[A-Za-z]{3})\s*<")
+
+
+def _parse_range_page(html: str, year: int) -> Tuple[List[int], Dict[int, str]]:
+    """
+    Roll numbers linked from a ROLL_*.asp page, plus the date shown next to
+    each one ("17-Jul") where the row has it.
+    """
+    rolls: List[int] = []
+    dates: Dict[int, str] = {}
+    for row in _RANGE_ROW_RE.split(html):
+        m = _RANGE_ROLL_RE.search(row)
+        if not m:
+            continue
+        roll = int(m.group(1))
+        rolls.append(roll)
+        dm = _RANGE_DATE_RE.search(row, m.end())
+        d = _clerk_date(dm.group(1), year) if dm else None
+        if d is not None:
+            dates[roll] = d.isoformat()
+    if not rolls:
+        # Not a table layout we know; grab any "rollnumber=###" we see.
+        rolls = [int(r) for r in _RANGE_ROLL_RE.findall(html)]
+    return rolls, dates
+
+
+class HouseRollIndex:
+    """
+    Persisted {year: {roll: "yyyy-mm-dd"}} map, stored next to the raw cache
+    so CI restores it together with the cached pages.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.years: Dict[str, Dict[str, str]] = {}
+        self.dirty = False
+        try:
+            self.years = jsonio.load_file(path).get("years", {})
+        except (OSError, ValueError):
+            self.years = {}
+
+    @classmethod
+    def for_cache(cls, cache: "raw_cache.RawCache") -> "HouseRollIndex":
+        return cls(cache.root / HOUSE_ROLL_INDEX_FILE)
+
+    def get(self, year: int, roll: int) -> Optional[dt.date]:
+        d = self.years.get(str(year), {}).get(str(roll))
+        return dt.date.fromisoformat(d) if d else None
+
+    def put(self, year: int, roll: int, date: str) -> None:
+        rolls = self.years.setdefault(str(year), {})
+        if rolls.get(str(roll)) != date:
+            rolls[str(roll)] = date
+            self.dirty = True
+
+    def range_bounds(self, year: int, start: int) -> Optional[Tuple[dt.date, dt.date]]:
+        """(oldest, newest) known date of the rolls on the ROLL_{start}.asp page."""
+        rolls = self.years.get(str(year), {})
+        dates = [rolls[str(r)] for r in range(start, start + ROLLS_PER_RANGE_PAGE) if str(r) in rolls]
+        if not dates:
+            return None
+        return dt.date.fromisoformat(min(dates)), dt.date.fromisoformat(max(dates))
+
+    def save(self) -> None:
+        if not self.dirty:
+            return
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        jsonio.dump_file(self.path, {"version": 1, "years": self.years})
+        self.dirty = False
 
 
 def _parse_house_vote_xml(xml_text: str, xml_url: str) -> Optional[Dict[str, Any]]:
@@ -77,7 +237,6 @@ def _parse_house_vote_xml(xml_text: str, xml_url: str) -> Optional[Dict[str, Any
     vote_type = get("vote-type")
     vote_result = get("vote-result")
     action_date = get("action-date")
-    action_time = get("action-time")
     vote_desc = get("vote-desc")
 
     totals_by_vote: Dict[str, int] = {}
@@ -140,15 +299,13 @@ def _parse_house_vote_xml(xml_text: str, xml_url: str) -> Optional[Dict[str, Any
 
     vote_id = f"H-{congress}-{session}-{rollcall}" if congress and session and rollcall else None
 
+    # action-date is "17-Jul-2025"; action-time carries 24h time in time-etz.
     iso_datetime = None
-    if action_date:
-        try:
-            if action_time:
-                iso_datetime = f"{action_date}T{action_time}"
-            else:
-                iso_datetime = f"{action_date}T00:00:00"
-        except Exception:
-            iso_datetime = action_date
+    action_day = _clerk_date(action_date)
+    if action_day is not None:
+        time_el = metadata.find("action-time")
+        etz = time_el.get("time-etz") if time_el is not None else None
+        iso_datetime = f"{action_day.isoformat()}T{etz or '00:00'}:00"
 
     return {
         "id": vote_id,
@@ -177,53 +334,99 @@ def _parse_house_vote_xml(xml_text: str, xml_url: str) -> Optional[Dict[str, Any
 def fetch_house_votes_official(
     from_date: dt.date,
     to_date: dt.date,
-    vote_cap: int = 200,
+    vote_cap: Optional[int] = 200,
 ) -> List[Dict[str, Any]]:
     """
     Fetch House roll-call votes between from_date and to_date (inclusive)
     using the Clerk's XML feeds.
+
+    index.asp and the ROLL_*.asp range pages are fetched conditionally; when
+    one is unchanged its previously parsed links are reused. Rolls are walked
+    newest first and checked against the roll -> date index before any XML is
+    downloaded: newer-than-window rolls are skipped, and the year's scan stops
+    at the first roll older than from_date. Range pages whose rolls are all
+    known to be out of the window are not fetched at all.
     """
     results: List[Dict[str, Any]] = []
+    cache = raw_cache.get_cache()
+    index = HouseRollIndex.for_cache(cache)
+
+    def done() -> List[Dict[str, Any]]:
+        index.save()
+        return sorted(
+            results,
+            key=lambda v: (v.get("date") or "", v.get("rollNumber") or 0),
+            reverse=True,
+        )
 
     years = range(from_date.year, to_date.year + 1)
     for year in years:
         index_url = HOUSE_INDEX_URL.format(year=year)
-        html = _safe_get(index_url)
+        html, changed = _conditional_get(index_url)
         if not html:
             print(f"[official_votes] No HTML for index {index_url}, skipping year {year}")
             continue
 
         # ROLL_*.asp pages (e.g. ROLL_200.asp, ROLL_100.asp)
-        range_starts = {int(m) for m in re.findall(r"ROLL_(\d+)\.asp", html)}
+        meta = cache.get_meta(index_url)
+        if not changed and meta and "rangeStarts" in meta:
+            range_starts = set(meta["rangeStarts"])
+        else:
+            range_starts = {int(m) for m in re.findall(r"ROLL_(\d+)\.asp", html)}
+            cache.set_meta(index_url, {"rangeStarts": sorted(range_starts)})
         if not range_starts:
             print(f"[official_votes] No ROLL_*.asp links found in {index_url}, using default 1")
             range_starts = {1}
 
         seen_rolls = set()
+        newest_start = max(range_starts)
+        past_window = False
 
         for start in sorted(range_starts, reverse=True):
+            # Older range pages are full and never change, so their known dates
+            # decide whether the page is worth opening. The newest page always
+            # gets a (conditional) fetch to discover new rolls.
+            bounds = index.range_bounds(year, start) if start != newest_start else None
+            if bounds is not None:
+                oldest, newest = bounds
+                if newest < from_date:
+                    break
+                if oldest > to_date:
+                    continue
+
             roll_url = HOUSE_ROLL_RANGE_URL.format(year=year, start=start)
-            roll_html = _safe_get(roll_url)
+            roll_html, changed = _conditional_get(roll_url)
             if not roll_html:
                 print(f"[official_votes] No HTML for roll range {roll_url}, skipping")
                 continue
 
-            # SUPER SIMPLE: grab any "rollnumber=###" we see, ignore &year noise.
-            # This avoids having to guess how &amp; is encoded.
-            matches = re.findall(r"rollnumber=(\d+)", roll_html, flags=re.IGNORECASE)
+            meta = cache.get_meta(roll_url)
+            if not changed and meta and "rolls" in meta:
+                # Unchanged since last run: reuse the roll list, no re-scan.
+                matches = [int(r) for r in meta["rolls"]]
+            else:
+                matches, page_dates = _parse_range_page(roll_html, year)
+                for roll, d in page_dates.items():
+                    index.put(year, roll, d)
+                cache.set_meta(roll_url, {"rolls": matches})
 
             if not matches:
                 print(f"[official_votes] No rollnumber=... links found in {roll_url}")
-                # Uncomment to debug a slice of HTML:
-                # print(roll_html[:500])
                 continue
 
-            for roll_str in matches:
-                roll = int(roll_str)
+            for roll in sorted(set(matches), reverse=True):
                 if roll in seen_rolls:
                     continue
                 seen_rolls.add(roll)
 
+                known = index.get(year, roll)
+                if known is not None:
+                    if known > to_date:
+                        continue
+                    if known < from_date:
+                        past_window = True
+                        break
+
                 xml_url = HOUSE_ROLL_XML_URL.format(year=year, roll=roll)
                 xml_text = _safe_get(xml_url)
                 if not xml_text:
@@ -234,43 +437,272 @@ def fetch_house_votes_official(
                 if not vote:
                     continue
 
-                v_date_str = (vote.get("date") or "").split("T", 1)[0]
-                try:
-                    v_date = dt.date.fromisoformat(v_date_str)
-                except Exception:
-                    v_date = None
-
+                v_date = _clerk_date(vote.get("date"))
                 if v_date is not None:
-                    if v_date < from_date or v_date > to_date:
+                    index.put(year, roll, v_date.isoformat())
+                    if v_date > to_date:
                         continue
+                    if v_date < from_date:
+                        past_window = True
+                        break
 
                 results.append(vote)
-                if len(results) >= vote_cap:
+                if vote_cap is not None and len(results) >= vote_cap:
                     print(f"[official_votes] Reached vote_cap={vote_cap}, stopping House fetch")
-                    return sorted(
-                        results,
-                        key=lambda v: (v.get("date") or "", v.get("rollNumber") or 0),
-                        reverse=True,
-                    )
+                    return done()
+
+            if past_window:
+                break
 
     print(f"[official_votes] Finished House fetch with {len(results)} votes")
-    return sorted(
-        results,
-        key=lambda v: (v.get("date") or "", v.get("rollNumber") or 0),
-        reverse=True,
-    )
+    return done()
+
+
+def _ordinal(n: int) -> str:
+    return f"{n}{'th' if 10 <= n % 100 <= 20 else {1: 'st', 2: 'nd', 3: 'rd'}.get(n % 10, 'th')}"
+
+
+def _senate_congresses(from_date: dt.date, to_date: dt.date) -> List[int]:
+    """
+    Congresses whose sessions can hold votes in the window, oldest first. A
+    congress's last session can run into early January of the next odd
+    year, so a window starting in January of an odd year includes the
+    previous congress too.
+    """
+    first = (from_date.year - 1789) // 2 + 1
+    if from_date.year % 2 and from_date.month == 1:
+        first -= 1
+    return list(range(first, (to_date.year - 1789) // 2 + 2))
+
+
+def _senate_menu(congress: int, session: int) -> Optional[Tuple[int, List[Tuple[int, Optional[str]]]]]:
+    """
+    (congress year, listed votes) from the vote menu of one congress/session,
+    or None when there is no such menu (an unparsable one lists no votes,
+    so later sessions are still probed). The parsed menu is reused from raw
+    cache meta while the page is unchanged.
+    """
+    cache = raw_cache.get_cache()
+    menu_url = SENATE_MENU_URL.format(congress=congress, session=session)
+    menu_xml, changed = _conditional_get(menu_url)
+    if not menu_xml:
+        return None
+    meta = cache.get_meta(menu_url)
+    if not changed and meta and "votes" in meta and "year" in meta:
+        return meta["year"], [(n, d) for n, d in meta["votes"]]
+    year = 1789 + (congress - 1) * 2 + (session - 1)
+    try:
+        year, listed = _parse_senate_menu(menu_xml, year)
+    except ET.ParseError as exc:
+        print(f"[official_votes] XML parse error for {menu_url}: {exc}")
+        return year, []
+    cache.set_meta(menu_url, {"year": year, "votes": listed})
+    return year, listed
+
+
+def _senate_sessions(from_date: dt.date, to_date: dt.date) -> List[Tuple[int, int, List[Tuple[int, Optional[str]]]]]:
+    """
+    (congress, session, listed votes) for every session whose vote menu
+    overlaps the window, newest first.
+
+    Sessions are read off the LIS menus rather than computed from the year:
+    each congress is probed from its 1st session up, stopping at the first
+    missing menu, and a session is kept when its <congress_year> (or the
+    January carryover into the year after) falls in the window. That covers
+    sessions that spill into January and the rare 3rd session.
+    """
+    out = []
+    for congress in _senate_congresses(from_date, to_date):
+        for session in (1, 2, 3):
+            menu = _senate_menu(congress, session)
+            if menu is None:
+                if session < 3:
+                    print(f"[official_votes] No vote menu for Senate {congress}-{session}, "
+                          f"skipping the rest of the {_ordinal(congress)} Congress")
+                break
+            year, listed = menu
+            if not listed:
+                print(f"[official_votes] Vote menu for Senate {congress}-{session} lists no votes")
+            if from_date.year <= year + 1 and year <= to_date.year:
+                out.append((congress, session, listed))
+    return out[::-1]
+
+
+def _senate_vote_datetime(text: Optional[str]) -> Optional[str]:
+    """LIS vote_date "July 17, 2025,  11:43 AM" -> "2025-07-17T11:43:00"."""
+    if not text:
+        return None
+    m = re.match(r"\s*([A-Za-z]+)\s+(\d{1,2}),\s*(\d{4})(?:,\s*(\d{1,2}):(\d{2})\s*([AP]M))?", text)
+    if not m:
+        return None
+    month = _MONTHS.get(m.group(1)[:3].lower())
+    if month is None:
+        return None
+    day = dt.date(int(m.group(3)), month, int(m.group(2)))
+    if not m.group(4):
+        return f"{day.isoformat()}T00:00:00"
+    hour = int(m.group(4)) % 12 + (12 if m.group(6) == "PM" else 0)
+    return f"{day.isoformat()}T{hour:02d}:{m.group(5)}:00"
+
+
+def _parse_senate_menu(xml_text: str, year: int) -> Tuple[int, List[Tuple[int, Optional[str]]]]:
+    """
+    The menu's <congress_year> (default `year`) and (vote number, ISO date or
+    None) for every vote it lists.
+    """
+    root = ET.fromstring(xml_text)
+    year = int(root.findtext("congress_year") or year)
+    out = []
+    for v in root.iter("vote"):
+        num = (v.findtext("vote_number") or "").strip()
+        if not num.isdigit():
+            continue
+        d = _clerk_date(v.findtext("vote_date"), year)
+        out.append((int(num), d.isoformat() if d else None))
+    return year, out
+
+
+def _parse_senate_vote_xml(xml_text: str, xml_url: str) -> Optional[Dict[str, Any]]:
+    """
+    Parse a single Senate LIS roll_call_vote XML into the same compact dict
+    _parse_house_vote_xml produces.
+    """
+    try:
+        root = ET.fromstring(xml_text)
+    except ET.ParseError as exc:
+        print(f"[official_votes] XML parse error for {xml_url}: {exc}")
+        return None
+
+    def get(tag: str) -> Optional[str]:
+        text = root.findtext(tag)
+        return text.strip() if text and text.strip() else None
+
+    congress = get("congress")
+    session = get("session")
+    vote_number = get("vote_number")
+    if not (congress and congress.isdigit() and session and session.isdigit() and vote_number and vote_number.isdigit()):
+        print(f"[official_votes] Missing congress/session/vote_number in {xml_url}")
+        return None
+    session_label = _ordinal(int(session))
+    roll = int(vote_number)
+
+    count = root.find("count")
+
+    def count_of(tag: str) -> int:
+        text = count.findtext(tag) if count is not None else None
+        return int(text) if text and text.strip().isdigit() else 0
+
+    totals = {
+        "yea": count_of("yeas"),
+        "nay": count_of("nays"),
+        "present": count_of("present"),
+        "notVoting": count_of("absent"),
+    }
+
+    by_party_map: Dict[str, Dict[str, Any]] = {}
+    for m in root.iter("member"):
+        code = (m.findtext("party") or "").strip()
+        party = SENATE_PARTY_NAMES.get(code, code or "Unknown")
+        key = SENATE_POSITION_KEYS.get((m.findtext("vote_cast") or "").strip().lower())
+        entry = by_party_map.setdefault(
+            party, {"party": party, "yea": 0, "nay": 0, "present": 0, "notVoting": 0}
+        )
+        if key:
+            entry[key] += 1
+    by_party = sorted(by_party_map.values(), key=lambda e: e["party"])
+
+    bill_code = None
+    congress_gov_url = None
+    doc = root.find("document")
+    if doc is not None:
+        doc_type = (doc.findtext("document_type") or "").strip()
+        doc_number = (doc.findtext("document_number") or "").strip()
+        bill_code = (doc.findtext("document_name") or "").strip() or (
+            f"{doc_type} {doc_number}".strip() or None
+        )
+        bill_type_lower = SENATE_DOC_TYPES.get(re.sub(r"[^a-z]", "", doc_type.lower()))
+        doc_congress = (doc.findtext("document_congress") or congress).strip()
+        if bill_type_lower and doc_number.isdigit() and doc_congress.isdigit():
+            congress_gov_url = (
+                f"https://www.congress.gov/bill/{int(doc_congress)}th-congress/"
+                f"{bill_type_lower}/{int(doc_number)}"
+            )
+
+    return {
+        "id": f"S-{congress}-{session_label}-{roll}",
+        "chamber": "senate",
+        "congress": int(congress),
+        "session": session_label,
+        "rollNumber": roll,
+        "date": _senate_vote_datetime(get("vote_date")),
+        "bill": {
+            "code": bill_code,
+            "legisNumRaw": bill_code,
+            "congressGovUrl": congress_gov_url,
+        },
+        "question": get("vote_question_text") or get("question"),
+        "description": get("vote_title") or get("vote_document_text"),
+        "voteType": get("majority_requirement"),
+        "result": get("vote_result"),
+        "totals": totals,
+        "totalsByParty": by_party,
+        "sources": {
+            "senateXml": xml_url,
+        },
+    }
 
 
 def fetch_senate_votes_official(
     from_date: dt.date,
     to_date: dt.date,
-    vote_cap: int = 200,
+    vote_cap: Optional[int] = 200,
+    workers: int = SENATE_WORKERS,
+    rps: float = SENATE_RPS,
 ) -> List[Dict[str, Any]]:
     """
-    Placeholder: Senate LIS XML support.
-
-    For now this returns an empty list so we don't break anything.
-    Later we can wire it to the vote_menu_{congress}_{session}.xml feeds.
+    Fetch Senate roll-call votes between from_date and to_date (inclusive)
+    from the LIS XML feeds.
+
+    The vote menu for each congress/session in the window is fetched
+    conditionally (its parsed vote list is reused when unchanged); only votes
+    whose menu date is in the window are downloaded, newest first, up to
+    vote_cap (None = no cap), on `workers` threads limited to `rps` requests
+    per second.
     """
-    print("[official_votes] Senate fetch stubbed out (returns []) for now.")
-    return []
+    wanted: List[Tuple[str, int]] = []  # (xml url, roll), newest first
+
+    for congress, session, listed in _senate_sessions(from_date, to_date):
+        for num, d in sorted(listed, reverse=True):
+            if d is not None and not (from_date.isoformat() <= d <= to_date.isoformat()):
+                continue
+            url = SENATE_VOTE_XML_URL.format(congress=congress, session=session, roll=num)
+            wanted.append((url, num))
+    wanted = wanted[:vote_cap]
+
+    limiter = http_client.HostRateLimiter(rps)
+
+    def fetch_one(item: Tuple[str, int]) -> Optional[Dict[str, Any]]:
+        url, num = item
+        xml_text = _safe_get(url, limiter=limiter)
+        if not xml_text:
+            print(f"[official_votes] No XML for {url}, skipping vote {num}")
+            return None
+        return _parse_senate_vote_xml(xml_text, url)
+
+    results: List[Dict[str, Any]] = []
+    with ThreadPoolExecutor(max_workers=max(1, workers)) as pool:
+        for vote in pool.map(fetch_one, wanted):
+            if not vote:
+                continue
+            # Menu entries without a date are checked against the vote itself.
+            v_date = (vote.get("date") or "")[:10]
+            if v_date and not (from_date.isoformat() <= v_date <= to_date.isoformat()):
+                continue
+            results.append(vote)
+
+    print(f"[official_votes] Finished Senate fetch with {len(results)} votes")
+    return sorted(
+        results,
+        key=lambda v: (v.get("date") or "", v.get("rollNumber") or 0),
+        reverse=True,
+    )
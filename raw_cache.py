@@ -0,0 +1,307 @@
+"""
+raw_cache.py
+
+On-disk cache of raw downloads (roll-call XML, vote menus, index pages) shared
+by official_votes.py, capitol_league_rollcall_aggregate.py and
+build_master_data.py.
+
+Layout:
+  <cache_dir>/index.json          url -> {key, size, stored, used, status,
+                                          digest, etag, lastModified, meta}
+  <cache_dir>/ab/abcdef....z      zlib-compressed body, key = sha256(url)
+
+Finalized roll calls (rollNNN.xml, vote_CCC_S_NNNNN.xml) never change, so
+they are served straight from the cache. Mutable pages (index.asp,
+ROLL_*.asp, vote menus, GovTrack listings) are revalidated with
+If-None-Match / If-Modified-Since; a 304 is answered from the cached copy.
+The cache is trimmed least-recently-used first once it grows past max_bytes.
+"""
+
+from __future__ import annotations
+
+import atexit
+import hashlib
+import os
+import re
+import threading
+import time
+import zlib
+from pathlib import Path
+from typing import Any, Callable, Dict, Mapping, Optional, Tuple
+
+import jsonio
+
+ROOT_DIR = Path(__file__).resolve().parent
+DEFAULT_CACHE_DIR = Path(os.environ.get("CAPITOL_CACHE_DIR") or ROOT_DIR / ".cache" / "raw")
+DEFAULT_MAX_BYTES = int(os.environ.get("CAPITOL_CACHE_MAX_MB") or 512) * 1024 * 1024
+
+# 404s for immutable URLs are remembered this long (rolls past the end of a
+# year are probed on every run); offline runs always honor them. 404s in the
+# open year/congress are never remembered: the next roll there is exactly the
+# probe that --incremental runs need to see the moment it is published.
+MISSING_TTL_SECONDS = 6 * 3600
+
+# Flush the index after this many changes even if the process keeps running.
+FLUSH_EVERY = 200
+
+IMMUTABLE_URL_PATTERNS = (
+    re.compile(r"/evs/(?P<year>\d{4})/roll\d+\.xml$", re.IGNORECASE),
+    re.compile(r"/roll_call_votes/vote\d+/vote_(?P<congress>\d+)_\d_\d+\.xml$", re.IGNORECASE),
+)
+
+
+def is_immutable(url: str) -> bool:
+    """True for finalized roll-call XML, which never changes once published."""
+    return any(p.search(url) for p in IMMUTABLE_URL_PATTERNS)
+
+
+def is_open(url: str) -> bool:
+    """
+    True for roll-call XML of the current year (House) or congress (Senate),
+    where new rolls still appear. January counts toward the previous year
+    too, since a session can run into the first days of the next year.
+    """
+    today = time.localtime()
+    year = today.tm_year - (1 if today.tm_mon == 1 else 0)
+    for p in IMMUTABLE_URL_PATTERNS:
+        m = p.search(url)
+        if m is None:
+            continue
+        if "year" in p.groupindex:
+            return int(m.group("year")) >= year
+        return int(m.group("congress")) >= (year - 1789) // 2 + 1
+    return False
+
+
+class RawCache:
+    def __init__(self, root: Path, max_bytes: int = DEFAULT_MAX_BYTES, offline: bool = False):
+        self.root = Path(root)
+        self.max_bytes = max_bytes
+        self.offline = offline
+        self.index_path = self.root / "index.json"
+        self._lock = threading.Lock()
+        self._dirty = 0
+        self.entries: Dict[str, Dict[str, Any]] = {}
+        if self.index_path.exists():
+            try:
+                self.entries = jsonio.load_file(self.index_path).get("entries", {})
+            except Exception:
+                # A broken index just means a cold cache.
+                self.entries = {}
+        self._total = sum(e.get("size", 0) for e in self.entries.values())
+
+    @staticmethod
+    def key_for(url: str) -> str:
+        return hashlib.sha256(url.encode("utf-8")).hexdigest()
+
+    def _blob_path(self, key: str) -> Path:
+        return self.root / key[:2] / f"{key}.z"
+
+    def total_bytes(self) -> int:
+        return self._total
+
+    def _set_entry(self, url: str, entry: Optional[Dict[str, Any]]) -> None:
+        # Caller holds the lock; keeps the running size total in step.
+        old = self.entries.pop(url, None)
+        if old is not None:
+            self._total -= old.get("size", 0)
+        if entry is not None:
+            self.entries[url] = entry
+            self._total += entry.get("size", 0)
+
+    def get(self, url: str) -> Optional[bytes]:
+        with self._lock:
+            entry = self.entries.get(url)
+            if not entry or entry.get("status") != 200:
+                return None
+            entry["used"] = time.time()
+            self._dirty += 1
+        try:
+            return zlib.decompress(self._blob_path(entry["key"]).read_bytes())
+        except (OSError, zlib.error):
+            with self._lock:
+                self._set_entry(url, None)
+            return None
+
+    def is_missing(self, url: str) -> bool:
+        with self._lock:
+            entry = self.entries.get(url)
+        if not entry or entry.get("status") == 200:
+            return False
+        return self.offline or time.time() - entry.get("stored", 0) < MISSING_TTL_SECONDS
+
+    def validators(self, url: str) -> Dict[str, str]:
+        """Conditional request headers for a cached mutable page."""
+        headers: Dict[str, str] = {}
+        with self._lock:
+            entry = self.entries.get(url)
+            if not entry or entry.get("status") != 200:
+                return headers
+            if entry.get("etag"):
+                headers["If-None-Match"] = entry["etag"]
+            if entry.get("lastModified"):
+                headers["If-Modified-Since"] = entry["lastModified"]
+        return headers
+
+    def digest(self, url: str) -> Optional[str]:
+        with self._lock:
+            entry = self.entries.get(url)
+            return entry.get("digest") if entry else None
+
+    def get_meta(self, url: str) -> Optional[Dict[str, Any]]:
+        """Caller-defined data derived from the cached body (e.g. parsed links)."""
+        with self._lock:
+            entry = self.entries.get(url)
+            return entry.get("meta") if entry else None
+
+    def set_meta(self, url: str, meta: Dict[str, Any]) -> None:
+        with self._lock:
+            entry = self.entries.get(url)
+            if entry is not None:
+                entry["meta"] = meta
+                self._changed()
+
+    def put(self, url: str, data: bytes, headers: Optional[Mapping[str, str]] = None) -> None:
+        key = self.key_for(url)
+        path = self._blob_path(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        blob = zlib.compress(data, 6)
+        tmp = path.with_name(f"{path.name}.{threading.get_ident()}.tmp")
+        tmp.write_bytes(blob)
+        tmp.replace(path)
+        now = time.time()
+        entry = {
+            "key": key,
+            "size": len(blob),
+            "stored": now,
+            "used": now,
+            "status": 200,
+            "digest": hashlib.sha256(data).hexdigest(),
+        }
+        if headers:
+            if headers.get("ETag"):
+                entry["etag"] = headers["ETag"]
+            if headers.get("Last-Modified"):
+                entry["lastModified"] = headers["Last-Modified"]
+        with self._lock:
+            self._set_entry(url, entry)
+            self._changed()
+
+    def put_missing(self, url: str) -> None:
+        now = time.time()
+        with self._lock:
+            self._set_entry(url, {"key": self.key_for(url), "size": 0, "stored": now, "used": now, "status": 404})
+            self._changed()
+
+    def _changed(self) -> None:
+        # Caller holds the lock.
+        self._dirty += 1
+        if self.total_bytes() > self.max_bytes:
+            self._evict()
+        if self._dirty >= FLUSH_EVERY:
+            self._write_index()
+
+    def _evict(self) -> None:
+        # Caller holds the lock. Drop least-recently-used blobs until we are
+        # back under 90% of the budget so we don't evict on every put.
+        target = int(self.max_bytes * 0.9)
+        for url, entry in sorted(self.entries.items(), key=lambda kv: kv[1].get("used", 0)):
+            if self._total <= target:
+                break
+            try:
+                self._blob_path(entry["key"]).unlink()
+            except OSError:
+                pass
+            self._set_entry(url, None)
+
+    def _write_index(self) -> None:
+        # Caller holds the lock.
+        self.root.mkdir(parents=True, exist_ok=True)
+        jsonio.dump_file(self.index_path, {"version": 1, "entries": self.entries})
+        self._dirty = 0
+
+    def flush(self) -> None:
+        with self._lock:
+            if self._dirty:
+                self._write_index()
+
+
+_cache: Optional[RawCache] = None
+
+
+def configure(
+    cache_dir: Optional[str | Path] = None,
+    offline: bool = False,
+    max_bytes: Optional[int] = None,
+) -> RawCache:
+    """(Re)create the process-wide cache. Call once from a script's main()."""
+    global _cache
+    if _cache is not None:
+        _cache.flush()
+    _cache = RawCache(Path(cache_dir) if cache_dir else DEFAULT_CACHE_DIR, max_bytes or DEFAULT_MAX_BYTES, offline)
+    return _cache
+
+
+def get_cache() -> RawCache:
+    if _cache is None:
+        configure(offline=os.environ.get("CAPITOL_OFFLINE") == "1")
+    assert _cache is not None
+    return _cache
+
+
+@atexit.register
+def _flush_on_exit() -> None:
+    if _cache is not None:
+        _cache.flush()
+
+
+# download(headers) performs the real request with the extra request headers
+# and returns (status_code, content, response_headers); (None, None, {}) means
+# the request failed outright.
+Downloader = Callable[[Dict[str, str]], Tuple[Optional[int], Optional[bytes], Mapping[str, str]]]
+
+
+def conditional_get(url: str, download: Downloader) -> Tuple[Optional[bytes], bool]:
+    """
+    Return (body, changed) for url, going to the network only when needed.
+
+    `changed` is False when the body is the same as the cached copy, either
+    because the server answered 304 or because the content digest matched,
+    so callers can skip re-processing it.
+    """
+    cache = get_cache()
+    immutable = is_immutable(url)
+    if immutable or cache.offline:
+        body = cache.get(url)
+        if body is not None:
+            return body, False
+        if cache.is_missing(url) and (cache.offline or not is_open(url)):
+            return None, False
+    if cache.offline:
+        return None, False
+
+    old_digest = cache.digest(url)
+    status, body, headers = download(cache.validators(url))
+    if status == 304:
+        cached = cache.get(url)
+        if cached is not None:
+            return cached, False
+        # Lost the blob; fetch it again unconditionally.
+        status, body, headers = download({})
+    if status == 200 and body:
+        cache.put(url, body, headers)
+        return body, cache.digest(url) != old_digest
+    if status in (404, 410) and immutable and not is_open(url):
+        cache.put_missing(url)
+    return None, False
+
+
+def cached_get(url: str, download: Downloader) -> Optional[bytes]:
+    """Like conditional_get, for callers that don't care whether it changed."""
+    return conditional_get(url, download)[0]
+
+
+def add_cache_arguments(ap) -> None:
+    """Add the shared --cache-dir / --offline switches to an argparse parser."""
+    ap.add_argument("--cache-dir", default=None, help=f"Raw download cache (default {DEFAULT_CACHE_DIR})")
+    ap.add_argument("--offline", action="store_true", help="Serve only from the cache; never touch the network")
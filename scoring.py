@@ -0,0 +1,268 @@
+#!/usr/bin/env python3
+"""
+scoring.py
+
+Weekly fantasy scoring for every member at once, mirroring the calculator in
+rules.html, computed with numpy over the vote matrix written by
+capitol_league_rollcall_aggregate.py --matrix-dir (see vote_matrix.py).
+
+Usage:
+    python scoring.py --matrix-dir data/matrix -o data/kpis.json
+    python scoring.py --matrix-dir data/matrix --key-rolls data/key_rolls.json --as-of 2025-07-17
+
+Per week and member:
+  core        +10 per vote cast (Yea or Nay)
+  missed       -5 per eligible missed roll
+  key mult     +2 per key vote cast, -2 per key vote missed
+  missed key  -15 per key vote missed (stacks with the missed penalty)
+  streaks     +20 for the first 10-consecutive-cast bundle, +15 after that
+  perfect     +25 for no misses with at least one eligible vote
+  bipartisan  +10 per vote against the party majority, capped at 60/week
+  party-line  -10 if 100% party-line with >= 6 eligible votes
+  week cap    (off by default) core capped at 200, extra casts +1 each
+
+"today" is the per-roll part (core, missed, key) of rolls on --as-of;
+"week" is the full score of the week containing it; "season" sums the weeks
+from --season-start. The output is the [{id, today, week, season}] list the
+scoreboard loaders read from data/kpis.json, ids being Bioguide ids.
+"""
+
+from __future__ import annotations
+
+import argparse
+import datetime as dt
+import sys
+from dataclasses import dataclass, asdict
+from pathlib import Path
+from typing import Any, Dict, Iterable, Optional
+
+try:
+    import numpy as np  # type: ignore
+except Exception:
+    print("scoring requires the 'numpy' package. Install with: pip install numpy", file=sys.stderr)
+    raise
+
+import jsonio
+from vote_matrix import ABSENT, NAY, NOT_VOTING, YEA, VoteMatrix
+
+ROOT_DIR = Path(__file__).resolve().parent
+# js/scoreboard*.js load this first and expect [{id, today, week, season}].
+SCOREBOARD_PATH = ROOT_DIR / "data" / "kpis.json"
+
+# 1970-01-01 was a Thursday; shifting by 3 days makes weeks start on Monday.
+_MONDAY_SHIFT = 3
+
+
+@dataclass
+class ScoringRules:
+    core_per_vote: int = 10
+    missed_penalty: int = -5
+    key_multiplier: bool = True
+    key_bonus: int = 2
+    missed_key_penalty: int = -15
+    streak_len: int = 10
+    streak_first: int = 20
+    streak_next: int = 15  # 20 when diminishing returns are off
+    perfect_pts: int = 25
+    bipartisan_pts: int = 10
+    bipartisan_week_cap: int = 60
+    bipartisan_threshold: float = 0.55
+    party_line: bool = True
+    party_line_penalty: int = -10
+    party_line_min_eligible: int = 6
+    week_cap: bool = False
+    week_cap_core: int = 200
+
+
+def week_index(dates: np.ndarray) -> np.ndarray:
+    """Monday-based week number for each datetime64[D]."""
+    return (dates.astype("datetime64[D]").astype(np.int64) + _MONDAY_SHIFT) // 7
+
+
+def week_monday(weeks: np.ndarray) -> np.ndarray:
+    """Inverse of week_index: the Monday each week number starts on."""
+    return (np.asarray(weeks) * 7 - _MONDAY_SHIFT).astype("datetime64[D]")
+
+
+def party_majority(positions: np.ndarray, parties: np.ndarray, threshold: float) -> np.ndarray:
+    """
+    [rolls x members] array holding the majority position (YEA/NAY) of each
+    member's party on each roll, or 0 where no side exceeds `threshold` of
+    the party's Yea+Nay votes.
+    """
+    labels, party_idx = np.unique(parties, return_inverse=True)
+    onehot = np.zeros((len(parties), len(labels)), dtype=np.int32)
+    onehot[np.arange(len(parties)), party_idx] = 1
+    yea = (positions == YEA).astype(np.int32) @ onehot
+    nay = (positions == NAY).astype(np.int32) @ onehot
+    cast = yea + nay
+    with np.errstate(divide="ignore", invalid="ignore"):
+        maj = np.where(yea > threshold * cast, YEA, np.where(nay > threshold * cast, NAY, 0))
+    maj[cast == 0] = 0
+    return maj[:, party_idx].astype(np.int8)
+
+
+def cast_runs(cast: np.ndarray, on_roll: np.ndarray, week_start: np.ndarray) -> np.ndarray:
+    """
+    [rolls x members] length of each member's current consecutive-cast run.
+    Runs reset on a roll the member was eligible for but didn't cast and at
+    each week boundary; rolls the member wasn't on (other chamber) are neutral.
+    """
+    c = cast.astype(np.int32)
+    cs = np.cumsum(c, axis=0)
+    base = np.zeros_like(cs)
+    reset = on_roll & ~cast
+    base[reset] = cs[reset]
+    base[week_start] = (cs - c)[week_start]
+    base = np.maximum.accumulate(base, axis=0)
+    return cs - base
+
+
+def score_matrix(
+    matrix: VoteMatrix,
+    key_rolls: Iterable[str] = (),
+    rules: Optional[ScoringRules] = None,
+) -> Dict[str, Any]:
+    """
+    Score every member for every week. Returns a dict with "weeks" (Monday
+    dates), "members", "week_scores" [weeks x members] and the per-roll
+    "roll_points" [rolls x members] / "roll_dates" used for "today".
+    """
+    rules = rules or ScoringRules()
+    dated = np.flatnonzero(~np.isnat(matrix.roll_dates))
+    order = dated[np.argsort(matrix.roll_dates[dated], kind="stable")]
+    pos = np.asarray(matrix.positions)[order]
+    dates = matrix.roll_dates[order]
+    rolls = matrix.rolls[order]
+    key = np.isin(rolls, list(key_rolls)) if key_rolls else np.zeros(len(rolls), dtype=bool)
+
+    on_roll = pos != ABSENT
+    cast = (pos == YEA) | (pos == NAY)
+    missed = pos == NOT_VOTING
+    key_cast = cast & key[:, None]
+    key_missed = missed & key[:, None]
+
+    maj = party_majority(pos, matrix.member_party, rules.bipartisan_threshold)
+    has_maj = cast & (maj != 0)
+    with_party = has_maj & (pos == maj)
+    against = has_maj & (pos != maj)
+
+    weeks = week_index(dates)
+    week_start = np.ones(len(weeks), dtype=bool)
+    week_start[1:] = weeks[1:] != weeks[:-1]
+    run = cast_runs(cast, on_roll, week_start)
+    bundle = cast & (run > 0) & (run % rules.streak_len == 0)
+
+    # Per-roll points (also what "today" reports).
+    key_mult = (key_cast.astype(np.int32) - key_missed) * rules.key_bonus if rules.key_multiplier else 0
+    roll_points = (
+        cast * rules.core_per_vote
+        + missed * rules.missed_penalty
+        + key_mult
+        + key_missed * rules.missed_key_penalty
+    )
+
+    if len(weeks) == 0:
+        empty = np.zeros((0, len(matrix.members)), dtype=np.int32)
+        return {"weeks": [], "members": matrix.members, "week_scores": empty, "roll_points": empty, "roll_dates": dates}
+
+    starts = np.flatnonzero(week_start)
+
+    def per_week(a: np.ndarray) -> np.ndarray:
+        return np.add.reduceat(a.astype(np.int32), starts, axis=0)
+
+    w_cast = per_week(cast)
+    w_missed = per_week(missed)
+    w_eligible = w_cast + w_missed
+    w_roll_pts = per_week(roll_points)
+    w_bundles = per_week(bundle)
+    w_against = per_week(against)
+    w_with = per_week(with_party)
+    w_has_maj = per_week(has_maj)
+
+    score = w_roll_pts.copy()
+    if rules.week_cap:
+        core = w_cast * rules.core_per_vote
+        capped_n = rules.week_cap_core // rules.core_per_vote
+        capped = rules.week_cap_core + np.maximum(0, w_cast - capped_n)
+        score += np.where(core > rules.week_cap_core, capped - core, 0)
+    score += np.where(w_bundles > 0, rules.streak_first + (w_bundles - 1) * rules.streak_next, 0)
+    score += np.where((w_missed == 0) & (w_eligible > 0), rules.perfect_pts, 0)
+    score += np.minimum(w_against * rules.bipartisan_pts, rules.bipartisan_week_cap)
+    if rules.party_line:
+        line = (w_has_maj > 0) & (w_with == w_has_maj) & (w_eligible >= rules.party_line_min_eligible)
+        score += np.where(line, rules.party_line_penalty, 0)
+
+    return {
+        "weeks": week_monday(weeks[starts]),
+        "members": matrix.members,
+        "week_scores": score,
+        "roll_points": roll_points,
+        "roll_dates": dates,
+    }
+
+
+def build_scoreboard(
+    matrix: VoteMatrix,
+    as_of: dt.date,
+    season_start: dt.date,
+    key_rolls: Iterable[str] = (),
+    rules: Optional[ScoringRules] = None,
+) -> Dict[str, Any]:
+    rules = rules or ScoringRules()
+    scored = score_matrix(matrix, key_rolls, rules)
+    members = [str(m) for m in scored["members"]]
+    n = len(members)
+    today = week = season = np.zeros(n, dtype=np.int64)
+
+    if len(scored["weeks"]):
+        day = np.datetime64(as_of)
+        today = scored["roll_points"][scored["roll_dates"] == day].sum(axis=0)
+        weeks = week_index(scored["weeks"])
+        this_week = week_index(np.array([day]))[0]
+        week = scored["week_scores"][weeks == this_week].sum(axis=0)
+        first_week = week_index(np.array([np.datetime64(season_start)]))[0]
+        in_season = (weeks >= first_week) & (weeks <= this_week)
+        season = scored["week_scores"][in_season].sum(axis=0)
+
+    kpis = [
+        {"id": members[i], "today": int(today[i]), "week": int(week[i]), "season": int(season[i])}
+        for i in range(n)
+    ]
+    kpis.sort(key=lambda k: (-k["season"], k["id"]))
+    return {
+        "generatedAt": dt.datetime.utcnow().isoformat(),
+        "asOf": as_of.isoformat(),
+        "seasonStart": season_start.isoformat(),
+        "rules": asdict(rules),
+        "kpis": kpis,
+    }
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description="Compute weekly fantasy scores for every member.")
+    ap.add_argument("--matrix-dir", required=True, help="Vote matrix written by the aggregator's --matrix-dir")
+    ap.add_argument("--key-rolls", default=None, help='JSON list of key roll ids, e.g. ["house:2025:262"]')
+    ap.add_argument("--as-of", default=None, help="Scoring date (default today)")
+    ap.add_argument("--season-start", default=None, help="First day of the season (default Jan 1 of --as-of)")
+    ap.add_argument("--week-cap", action="store_true", help="Cap core vote points at 200 per week")
+    ap.add_argument("-o", "--output", default=str(SCOREBOARD_PATH))
+    args = ap.parse_args()
+
+    as_of = dt.date.fromisoformat(args.as_of) if args.as_of else dt.date.today()
+    season_start = dt.date.fromisoformat(args.season_start) if args.season_start else dt.date(as_of.year, 1, 1)
+    key_rolls = []
+    if args.key_rolls:
+        key_rolls = jsonio.load_file(args.key_rolls)
+
+    matrix = VoteMatrix.load(Path(args.matrix_dir))
+    board = build_scoreboard(matrix, as_of, season_start, key_rolls, ScoringRules(week_cap=args.week_cap))
+
+    out = Path(args.output)
+    out.parent.mkdir(parents=True, exist_ok=True)
+    jsonio.dump_file(out, board["kpis"])
+    print(f"Wrote {out}: {len(board['kpis'])} members as of {board['asOf']}")
+
+
+if __name__ == "__main__":
+    main()
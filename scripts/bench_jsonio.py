@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+"""
+Benchmark: stdlib json vs jsonio (orjson / ujson when installed) on a
+synthetic master_state.json of about --mb megabytes.
+
+Usage:
+    python scripts/bench_jsonio.py --mb 50
+"""
+
+import argparse
+import json
+import pathlib
+import sys
+import tempfile
+import time
+
+ROOT = pathlib.Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+import jsonio  # noqa: E402
+from load_test_bill_web import synthetic_vote  # noqa: E402
+
+
+def synthetic_state(target_bytes: int) -> dict:
+    one = len(json.dumps(synthetic_vote(1), separators=(",", ":")))
+    n = max(1, target_bytes // one)
+    votes = {"house": [], "senate": []}
+    for roll in range(1, n + 1):
+        v = synthetic_vote(roll)
+        v["date"] = f"2025-{1 + roll % 12:02d}-{1 + roll % 28:02d}T14:02:00"
+        v["question"] = "On Motion to Suspend the Rules and Pass — “as amended”"
+        if roll % 2:
+            v["chamber"], v["id"] = "senate", f"S-119-1st-{roll}"
+        votes[v["chamber"]].append(v)
+    return {
+        "generatedAt": "2025-11-12T17:42:00Z",
+        "params": {"lookbackDays": 1000, "voteCapPerChamber": None},
+        "votes": {c: {"fromDate": "2023-01-01", "toDate": "2025-11-12", "count": len(r), "votes": r} for c, r in votes.items()},
+        "league": {},
+        "cards": {},
+    }
+
+
+def best_of(fn, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - t0)
+    return best
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--mb", type=float, default=50)
+    ap.add_argument("--repeat", type=int, default=3)
+    args = ap.parse_args()
+
+    state = synthetic_state(int(args.mb * 1024 * 1024))
+    with tempfile.TemporaryDirectory() as tmp:
+        path = pathlib.Path(tmp) / "master_state.json"
+        jsonio.dump_file(path, state)
+        size = path.stat().st_size
+        text = path.read_text(encoding="utf-8")
+        data = path.read_bytes()
+
+        def stdlib_dump_file():
+            with path.open("w", encoding="utf-8") as f:
+                json.dump(state, f, separators=(",", ":"))
+
+        def stdlib_load_file():
+            with path.open("r", encoding="utf-8") as f:
+                json.load(f)
+
+        rows = [
+            ("dumps", lambda: json.dumps(state, separators=(",", ":")), lambda: jsonio.dumpb(state)),
+            ("loads", lambda: json.loads(text), lambda: jsonio.loads(data)),
+            ("dump to file", stdlib_dump_file, lambda: jsonio.dump_file(path, state)),
+            ("load from file", stdlib_load_file, lambda: jsonio.load_file(path)),
+        ]
+        assert jsonio.load_file(path) == json.loads(json.dumps(state))
+
+        print(f"master_state {size / 1e6:.1f} MB, jsonio backend: {jsonio.BACKEND}, best of {args.repeat}")
+        print(f"{'op':<16}{'stdlib s':>10}{'jsonio s':>10}{'speedup':>9}")
+        for name, std, fast in rows:
+            a = best_of(std, args.repeat)
+            b = best_of(fast, args.repeat)
+            print(f"{name:<16}{a:>10.3f}{b:>10.3f}{a / b:>8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
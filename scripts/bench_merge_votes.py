@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+"""
+Benchmark: build_master_data.merge_votes — the old id de-dup + sort vs
+merge_vote_runs (normalized keys, roll-level de-dup, lazy heapq merge) — on
+synthetic runs totalling --votes records: an official run, a GovTrack run
+that overlaps it on --overlap of its rolls, and the previously stored votes.
+
+Both are timed at --cap (VOTE_CAP_PER_CHAMBER by default, the max_count the
+old merge_votes was always called with) and uncapped.
+
+Usage:
+    python scripts/bench_merge_votes.py --votes 100000
+    python scripts/bench_merge_votes.py --cap 500
+"""
+
+import argparse
+import pathlib
+import random
+import sys
+import time
+from datetime import datetime, timedelta
+
+ROOT = pathlib.Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+import build_master_data as bmd  # noqa: E402
+
+
+def legacy_merge(existing, new_votes, max_count=None):
+    """merge_votes before the heap merge: de-dup by id, sort everything."""
+    by_id = {}
+    for v in existing:
+        if v.get("id") is not None:
+            by_id[v["id"]] = v
+    for v in new_votes:
+        if v.get("id") is not None:
+            by_id[v["id"]] = v
+    merged = list(by_id.values())
+    merged.sort(key=lambda v: v.get("created") or v.get("date") or "", reverse=True)
+    return merged if max_count is None else merged[:max_count]
+
+
+def make_runs(total: int, overlap: float):
+    rng = random.Random(11)
+    n_official = int(total * 0.45)
+    n_existing = int(total * 0.25)
+    n_govtrack = total - n_official - n_existing
+    start = datetime(2025, 12, 31, 18, 0)
+
+    def when(i):
+        return start - timedelta(minutes=37 * i)
+
+    official, govtrack, existing = [], [], []
+    for i in range(n_official):
+        t = when(i)
+        congress, session = (t.year - 1789) // 2 + 1, ("1st", "2nd")[(t.year - 1789) % 2]
+        official.append({
+            "id": f"H-{congress}-{session}-{n_official - i}", "chamber": "house", "congress": congress,
+            "session": session, "rollNumber": n_official - i, "date": t.isoformat(), "source": "clerk.house.gov",
+        })
+    for i in range(n_govtrack):
+        shared = rng.random() < overlap and i < n_official
+        roll = n_official - i if shared else 10_000_000 + i
+        t = when(i) + timedelta(seconds=rng.randint(0, 90))
+        govtrack.append({
+            "id": 900_000 + i, "chamber": "house", "congress": (t.year - 1789) // 2 + 1, "session": str(t.year),
+            "rollNumber": roll, "created": t.isoformat() + "Z", "source": "govtrack.us",
+        })
+    govtrack.sort(key=lambda v: v["created"], reverse=True)
+    for i in range(n_existing):
+        v = dict(official[i]) if i < n_existing // 2 else {
+            "id": f"H-118-2nd-{i}", "chamber": "house", "congress": 118, "session": "2nd",
+            "rollNumber": i, "date": (when(n_official + i)).isoformat(), "source": "clerk.house.gov",
+        }
+        existing.append(v)
+    return existing, official, govtrack
+
+
+def best_of(fn, repeat=3):
+    best, out = float("inf"), None
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        out = fn()
+        best = min(best, time.perf_counter() - t0)
+    return best, out
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--votes", type=int, default=100_000)
+    ap.add_argument("--overlap", type=float, default=0.5, help="share of GovTrack rolls also in the official run")
+    ap.add_argument("--cap", type=int, default=bmd.VOTE_CAP_PER_CHAMBER)
+    args = ap.parse_args()
+
+    existing, official, govtrack = make_runs(args.votes, args.overlap)
+    print(f"{args.votes} input votes ({len(existing)} stored, {len(official)} official, {len(govtrack)} GovTrack)")
+    full = bmd.merge_vote_runs([existing, official, govtrack])
+    for cap in (args.cap, None):
+        old_s, old = best_of(lambda: legacy_merge(existing, official + govtrack, cap))
+        new_s, new = best_of(lambda: bmd.merge_vote_runs([existing, official, govtrack], cap))
+
+        rolls = [bmd.vote_roll_key(v) for v in new]
+        dupes_old = len(old) - len({bmd.vote_roll_key(v) for v in old})
+        ordered = all(bmd.vote_sort_date(a) >= bmd.vote_sort_date(b) for a, b in zip(new, new[1:]))
+        same = new == full[: len(new)]
+        gt_over_official = sum(
+            1 for v in new if v["source"] == "govtrack.us" and v["rollNumber"] < 10_000_000
+        )
+        print(f"max_count={cap}")
+        print(f"  legacy dict+sort : {old_s * 1000:8.1f} ms  {len(old)} out, {dupes_old} duplicate rolls")
+        print(
+            f"  merge_vote_runs  : {new_s * 1000:8.1f} ms  {len(new)} out, "
+            f"{len(rolls) - len(set(rolls))} duplicate rolls"
+        )
+        print(
+            f"  newest-first order: {ordered}; matches the uncapped head: {same}; "
+            f"GovTrack kept over an official record: {gt_over_official}"
+        )
+
+
+if __name__ == "__main__":
+    main()
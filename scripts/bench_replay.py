@@ -0,0 +1,152 @@
+#!/usr/bin/env python3
+"""
+Benchmark: the real fetch pipelines replayed against scripts/fake_sources.py.
+
+Runs `build_master_data.py full` and capitol_league_rollcall_aggregate.py as
+subprocesses, with CAPITOL_HTTP_REMAP sending every Clerk/LIS/GovTrack
+request to a local FakeSourceServer. Each pipeline runs from a temporary
+copy of the repo's modules (so data/ and the real raw cache are untouched),
+first with an empty raw cache (cold) and then again with the filled one
+(warm). Reports wall time, requests made by the client, what the server saw
+(requests, 304s, injected 503s and 404s) and bytes transferred.
+
+Usage:
+    python scripts/bench_replay.py --latency 0.01
+    python scripts/bench_replay.py --house-rolls 400 --senate-votes 300
+    python scripts/bench_replay.py --fixtures fixtures/ --error-rate 0.02 --gap-rate 0.01
+"""
+
+import argparse
+import datetime as dt
+import os
+import pathlib
+import re
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+
+ROOT = pathlib.Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT / "scripts"))
+
+from fake_sources import FakeSourceServer  # noqa: E402
+
+REMAP_HOSTS = ("clerk.house.gov", "www.senate.gov", "www.govtrack.us")
+HTTP_REPORT_RE = re.compile(r"\[http\] (\d+) requests to \d+ host\(s\), (\d+) retries, (\d+) bytes")
+
+
+def pipelines(work: pathlib.Path, first_year: int, last_year: int, workers: int):
+    congresses = f"{(first_year - 1789) // 2 + 1}-{(last_year - 1789) // 2 + 1}"
+    return {
+        "master full": lambda cache: ["build_master_data.py", "full", "--cache-dir", str(cache)],
+        "aggregate": lambda cache: [
+            "capitol_league_rollcall_aggregate.py",
+            "--house-years", f"{first_year}-{last_year}",
+            "--congress", congresses,
+            "-o", str(work / "votes_missed.csv"),
+            "--workers", str(workers),
+            "--cache-dir", str(cache),
+        ],
+    }
+
+
+def copy_modules(dest: pathlib.Path) -> None:
+    dest.mkdir(parents=True)
+    for path in ROOT.glob("*.py"):
+        shutil.copy2(path, dest / path.name)
+    (dest / "data").mkdir()
+
+
+def run(app_dir: pathlib.Path, argv, env, server: FakeSourceServer, log: pathlib.Path):
+    before = server.counters()
+    t0 = time.perf_counter()
+    with open(log, "w") as out:
+        proc = subprocess.run(
+            [sys.executable] + argv, cwd=app_dir, env=env, stdout=out, stderr=subprocess.STDOUT
+        )
+    secs = time.perf_counter() - t0
+    after = server.counters()
+    seen = {k: after[k] - before[k] for k in after}
+    m = HTTP_REPORT_RE.search(log.read_text(errors="replace"))
+    client = {"requests": int(m.group(1)), "retries": int(m.group(2)), "bytes": int(m.group(3))} if m else None
+    return proc.returncode, secs, seen, client
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--house-rolls", type=int, default=120, help="Roll calls per House year")
+    ap.add_argument("--senate-votes", type=int, default=80, help="Votes per Senate session")
+    ap.add_argument("--latency", type=float, default=0.005, help="Seconds added to every response")
+    ap.add_argument("--fixtures", default=None, help="Directory of recorded responses (see fake_sources.py)")
+    ap.add_argument("--error-rate", type=float, default=0.0)
+    ap.add_argument("--gap-rate", type=float, default=0.0)
+    ap.add_argument("--seed", type=int, default=0)
+    ap.add_argument("--workers", type=int, default=8, help="Aggregator --workers")
+    ap.add_argument("--only", choices=("master full", "aggregate"), default=None)
+    ap.add_argument("--keep", action="store_true", help="Keep the work directory (logs, outputs)")
+    args = ap.parse_args()
+
+    first_year, last_year = 2023, dt.date.today().year
+    work = pathlib.Path(tempfile.mkdtemp(prefix="capitol-replay-"))
+    server = FakeSourceServer(
+        latency=args.latency,
+        house_rolls_per_year=args.house_rolls,
+        senate_votes_per_session=args.senate_votes,
+        fixtures=args.fixtures,
+        error_rate=args.error_rate,
+        gap_rate=args.gap_rate,
+        seed=args.seed,
+        first_year=first_year,
+        last_year=last_year,
+    )
+    env = dict(os.environ)
+    env["CAPITOL_HTTP_REMAP"] = ",".join(f"{host}={server.base_url}" for host in REMAP_HOSTS)
+    env.pop("CAPITOL_OFFLINE", None)
+
+    results = []
+    failed = False
+    try:
+        with server:
+            for name, argv_for in pipelines(work, first_year, last_year, args.workers).items():
+                if args.only and name != args.only:
+                    continue
+                slug = name.replace(" ", "_")
+                app_dir = work / slug
+                copy_modules(app_dir)
+                cache = work / f"{slug}.cache"
+                for phase in ("cold", "warm"):
+                    log = work / f"{slug}.{phase}.log"
+                    code, secs, seen, client = run(app_dir, argv_for(cache), env, server, log)
+                    failed |= code != 0
+                    results.append((name, phase, code, secs, seen, client, log))
+    finally:
+        if not args.keep and not failed:
+            shutil.rmtree(work, ignore_errors=True)
+
+    print(
+        f"House {args.house_rolls} rolls/year, Senate {args.senate_votes} votes/session, "
+        f"{first_year}-{last_year}; latency {args.latency * 1000:.0f} ms, "
+        f"error rate {args.error_rate:g}, gap rate {args.gap_rate:g}"
+        + (f", fixtures {args.fixtures}" if args.fixtures else "")
+    )
+    print(
+        f"{'pipeline':<13}{'phase':<6}{'wall s':>8}{'client req':>11}{'retries':>8}"
+        f"{'server req':>11}{'304':>6}{'503':>6}{'404 gap':>8}{'MB sent':>9}  exit"
+    )
+    for name, phase, code, secs, seen, client, log in results:
+        req, retries = (client["requests"], client["retries"]) if client else ("?", "?")
+        print(
+            f"{name:<13}{phase:<6}{secs:>8.2f}{req:>11}{retries:>8}{seen['hits']:>11}"
+            f"{seen['notModified']:>6}{seen['errors']:>6}{seen['gaps']:>8}"
+            f"{seen['bytesSent'] / 1e6:>9.2f}  {code}"
+        )
+    if failed:
+        print(f"\nA pipeline failed; logs kept in {work}")
+        raise SystemExit(1)
+    if args.keep:
+        print(f"\nLogs and outputs in {work}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+"""
+Benchmark the roll-call downloader against the local fake Clerk/LIS server.
+
+Compares the old sequential pacing (1 worker, ~0.12s between requests) with
+the thread-pool fetcher at a few worker / rps settings, and checks that the
+aggregated totals are identical.
+
+Usage:
+    python scripts/bench_rollcall_fetch.py --latency 0.05 --house-rolls 60
+"""
+
+import argparse
+import pathlib
+import sys
+import tempfile
+import time
+from collections import defaultdict
+
+ROOT = pathlib.Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+sys.path.insert(0, str(ROOT / "scripts"))
+
+import capitol_league_rollcall_aggregate as agg  # noqa: E402
+import http_client  # noqa: E402
+import raw_cache  # noqa: E402
+from fake_sources import FakeSourceServer  # noqa: E402
+
+
+def point_at(base: str) -> None:
+    agg.HOUSE_URL = base + "/evs/{year}/roll{num:03d}.xml"
+    agg.SENATE_MENU_URL = base + "/legislative/LIS/roll_call_lists/vote_menu_{congress}_{session}.xml"
+    agg.SENATE_VOTE_URL = (
+        base + "/legislative/LIS/roll_call_votes/vote{congress}{session}/vote_{congress}_{session}_{num:05d}.xml"
+    )
+
+
+def run(server: FakeSourceServer, workers: int, rps: float, years, congresses, cache_dir: str):
+    raw_cache.configure(cache_dir)
+    client = http_client.configure(max_per_host=max(workers, http_client.DEFAULT_MAX_PER_HOST))
+    totals = defaultdict(int)
+    missed = defaultdict(int)
+    hits0 = server.hits
+    t0 = time.perf_counter()
+    for _y, xml_bytes in agg.iter_house(years[0], years[1], workers, rps):
+        agg.parse_house_vote_xml(xml_bytes, totals, missed)
+    for _cs, _n, xml_bytes in agg.iter_senate(congresses[0], congresses[1], workers, rps):
+        agg.parse_senate_vote_xml(xml_bytes, totals, missed)
+    raw_cache.get_cache().flush()
+    secs = time.perf_counter() - t0
+    return secs, server.hits - hits0, client.stats(), dict(totals), dict(missed)
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--latency", type=float, default=0.05, help="Simulated server latency (s)")
+    ap.add_argument("--house-rolls", type=int, default=60)
+    ap.add_argument("--senate-votes", type=int, default=40)
+    ap.add_argument("--house-years", default="2024-2025")
+    ap.add_argument("--congress", default="119-119")
+    args = ap.parse_args()
+
+    years = agg.parse_range(args.house_years)
+    congresses = agg.parse_range(args.congress)
+    configs = [
+        ("sequential (old pacing)", 1, 1 / 0.12),
+        ("workers=4 rps=8", 4, 8.0),
+        ("workers=8 rps=20", 8, 20.0),
+        ("workers=16 unlimited", 16, 0.0),
+    ]
+
+    with FakeSourceServer(
+        latency=args.latency,
+        house_rolls_per_year=args.house_rolls,
+        senate_votes_per_session=args.senate_votes,
+    ) as server:
+        point_at(server.base_url)
+        baseline = None
+        print(f"{'config':<26}{'seconds':>10}{'requests':>10}{'req/s':>10}{'conns':>8}{'reused':>8}  same-output")
+        for name, workers, rps in configs:
+            # Fresh cache per config so every run really downloads.
+            with tempfile.TemporaryDirectory() as cache_dir:
+                secs, hits, stats, totals, missed = run(server, workers, rps, years, congresses, cache_dir)
+            if baseline is None:
+                baseline = (totals, missed)
+            same = (totals, missed) == baseline
+            print(
+                f"{name:<26}{secs:>10.2f}{hits:>10}{hits / secs:>10.1f}"
+                f"{stats['connectionsOpened']:>8}{stats['connectionsReused']:>8}  {same}"
+            )
+
+        # Warm cache: the second run should not touch the network.
+        with tempfile.TemporaryDirectory() as cache_dir:
+            run(server, 16, 0.0, years, congresses, cache_dir)
+            secs, hits, stats, totals, missed = run(server, 16, 0.0, years, congresses, cache_dir)
+            same = (totals, missed) == baseline
+            print(
+                f"{'warm raw cache':<26}{secs:>10.2f}{hits:>10}{'':>10}"
+                f"{stats['connectionsOpened']:>8}{stats['connectionsReused']:>8}  {same}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""
+Microbenchmark: full-tree (ET.fromstring + findall) vs streaming iterparse
+parsing of roll-call XML.
+
+The corpus is real-shaped House (435 <recorded-vote>) and Senate (100
+<member>) files from scripts/fake_sources.py. Reports per-file parse time and
+peak traced memory, and checks both paths produce the same counts.
+
+Usage:
+    python scripts/bench_rollcall_parse.py --house 300 --senate 300
+"""
+
+import argparse
+import pathlib
+import sys
+import time
+import tracemalloc
+from collections import defaultdict
+from xml.etree import ElementTree as ET
+
+ROOT = pathlib.Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+sys.path.insert(0, str(ROOT / "scripts"))
+
+import capitol_league_rollcall_aggregate as agg  # noqa: E402
+from fake_sources import house_roll_xml, senate_vote_xml  # noqa: E402
+
+
+def tree_house(xml_bytes, totals, missed):
+    """The previous full-tree House parser, kept here as the baseline."""
+    root = ET.fromstring(xml_bytes)
+    recorded_votes = root.findall(".//recorded-vote") or root.findall(".//record-vote")
+    for rv in recorded_votes:
+        gid = agg.extract_bioguide_from_house_recorded_vote(rv)
+        if not gid:
+            continue
+        totals[gid] += 1
+        if agg.normalize_vote_text(agg.extract_vote_from_house_recorded_vote(rv)) in agg.MISS_TOKENS:
+            missed[gid] += 1
+
+
+def tree_senate(xml_bytes, totals, missed):
+    """The previous full-tree Senate parser, kept here as the baseline."""
+    root = ET.fromstring(xml_bytes)
+    for m in root.findall(".//member"):
+        gid = agg.find_text(m, ("./bioguide_id", "./bioguide", "./bioguide-id")) or agg.get_attr_any(
+            m, ("bioguide_id", "bioguide", "bioguide-id")
+        )
+        if not gid:
+            continue
+        v = agg.normalize_vote_text(agg.find_text(m, ("./vote_cast", "./vote", "./position")))
+        totals[gid] += 1
+        if v in agg.MISS_TOKENS or v == "present not voting":
+            missed[gid] += 1
+
+
+def timed(fn, corpus):
+    totals, missed = defaultdict(int), defaultdict(int)
+    t0 = time.perf_counter()
+    for xml_bytes in corpus:
+        fn(xml_bytes, totals, missed)
+    return time.perf_counter() - t0, (dict(totals), dict(missed))
+
+
+def peak_bytes(fn, xml_bytes):
+    totals, missed = defaultdict(int), defaultdict(int)
+    tracemalloc.start()
+    fn(xml_bytes, totals, missed)
+    _cur, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return peak
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--house", type=int, default=300, help="House files in the corpus")
+    ap.add_argument("--senate", type=int, default=300, help="Senate files in the corpus")
+    ap.add_argument("--repeat", type=int, default=3)
+    args = ap.parse_args()
+
+    house = [house_roll_xml(2025, n, args.house) for n in range(1, args.house + 1)]
+    senate = [senate_vote_xml(119, 1, n, args.senate) for n in range(1, args.senate + 1)]
+    mb = (sum(map(len, house)) + sum(map(len, senate))) / 1e6
+    print(f"corpus: {len(house)} House + {len(senate)} Senate files, {mb:.1f} MB")
+
+    print(f"{'parser':<22}{'ms/file':>10}{'peak KB':>10}  same-output")
+    for label, corpus, old, new in (
+        ("House", house, tree_house, agg.parse_house_vote_xml),
+        ("Senate", senate, tree_senate, agg.parse_senate_vote_xml),
+    ):
+        old_t = min(timed(old, corpus)[0] for _ in range(args.repeat))
+        new_t = min(timed(new, corpus)[0] for _ in range(args.repeat))
+        same = timed(old, corpus)[1] == timed(new, corpus)[1]
+        old_peak = peak_bytes(old, corpus[0]) / 1024
+        new_peak = peak_bytes(new, corpus[0]) / 1024
+        print(f"{label + ' tree':<22}{old_t * 1000 / len(corpus):>10.3f}{old_peak:>10.0f}")
+        print(f"{label + ' iterparse':<22}{new_t * 1000 / len(corpus):>10.3f}{new_peak:>10.0f}  {same}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""
+Benchmark: score a season-sized vote matrix with scoring.py.
+
+Builds a synthetic matrix of ~540 members (435 House + 100 Senate + a few
+replacements) by ~1,500 rolls across 30 weeks, then times score_matrix and
+build_scoreboard. The target is well under a second for the whole league.
+
+Usage:
+    python scripts/bench_scoring.py --rolls 1500 --repeat 5
+"""
+
+import argparse
+import datetime as dt
+import pathlib
+import sys
+import time
+
+import numpy as np
+
+ROOT = pathlib.Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+import scoring  # noqa: E402
+from vote_matrix import ABSENT, NAY, NOT_VOTING, PRESENT, YEA, VoteMatrix  # noqa: E402
+
+
+def synthetic_matrix(n_rolls: int, n_house: int = 440, n_senate: int = 100, seed: int = 7) -> VoteMatrix:
+    rng = np.random.default_rng(seed)
+    n_members = n_house + n_senate
+    senate_roll = rng.random(n_rolls) < 0.35
+    start = np.datetime64("2025-01-06")
+    dates = start + np.sort(rng.integers(0, 30 * 7, n_rolls)).astype("timedelta64[D]")
+    parties = np.array(["R" if i % 2 else "D" for i in range(n_members)])
+    parties[::97] = "I"
+
+    # Each roll: party-majority side with a few crossovers, ~3% not voting.
+    party_side = rng.choice([YEA, NAY], size=(n_rolls, 1))
+    flip = np.where(parties == "R", 0, 1)[None, :]
+    pos = np.where(flip, 3 - party_side, party_side).astype(np.int8)
+    noise = rng.random((n_rolls, n_members))
+    pos[noise < 0.05] = 3 - pos[noise < 0.05]
+    pos[noise > 0.97] = NOT_VOTING
+    pos[(noise > 0.965) & (noise <= 0.97)] = PRESENT
+    pos[np.ix_(senate_roll, np.arange(n_house))] = ABSENT
+    pos[np.ix_(~senate_roll, np.arange(n_house, n_members))] = ABSENT
+
+    rolls = np.array(
+        [f"{'senate:119_1' if s else 'house:2025'}:{i + 1}" for i, s in enumerate(senate_roll)]
+    )
+    members = np.array([f"M{i:06d}" for i in range(n_members)])
+    return VoteMatrix(pos, rolls, dates, members, parties)
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--rolls", type=int, default=1500)
+    ap.add_argument("--repeat", type=int, default=5)
+    args = ap.parse_args()
+
+    matrix = synthetic_matrix(args.rolls)
+    key_rolls = matrix.rolls[:: 25].tolist()
+    as_of = dt.date(2025, 7, 30)
+    print(f"matrix: {matrix.shape[1]} members x {matrix.shape[0]} rolls, {len(key_rolls)} key votes")
+
+    best = min(
+        _timed(lambda: scoring.score_matrix(matrix, key_rolls)) for _ in range(args.repeat)
+    )
+    print(f"score_matrix       {best * 1000:8.1f} ms")
+    best = min(
+        _timed(lambda: scoring.build_scoreboard(matrix, as_of, dt.date(2025, 1, 1), key_rolls))
+        for _ in range(args.repeat)
+    )
+    print(f"build_scoreboard   {best * 1000:8.1f} ms")
+
+    board = scoring.build_scoreboard(matrix, as_of, dt.date(2025, 1, 1), key_rolls)
+    top = board["kpis"][:3]
+    print("top 3:", ", ".join(f"{k['id']} {k['season']}" for k in top))
+
+
+def _timed(fn) -> float:
+    t0 = time.perf_counter()
+    fn()
+    return time.perf_counter() - t0
+
+
+if __name__ == "__main__":
+    main()
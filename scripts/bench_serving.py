@@ -0,0 +1,191 @@
+#!/usr/bin/env python3
+"""
+Benchmark: `python app.py` (Flask dev server, debug on) vs serve.py
+(production mode), over real HTTP.
+
+Both servers are started as subprocesses against a temporary data/web with
+--graphs synthetic vote graphs; the load generator then runs each scenario
+from --concurrency keep-alive client threads and reports req/s and p50/p99
+latency.
+
+Usage:
+    python scripts/bench_serving.py --requests 3000 --concurrency 16
+    python scripts/bench_serving.py --workers 4 --threads 8    # serve.py settings
+"""
+
+import argparse
+import http.client
+import os
+import pathlib
+import random
+import signal
+import socket
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+
+ROOT = pathlib.Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+SCENARIOS = (
+    ("api /api/bill-web", None),
+    ("static votes.html", "/votes.html"),
+    ("static js", "/js/votes-live.js"),
+    ("static css", "/css/scoreboard.css"),
+)
+
+
+def _point_app_at(web_dir: str) -> None:
+    import app as web_app
+
+    web = pathlib.Path(web_dir)
+    web_app.WEB_DIR = web
+    web_app.graph_index = web_app.GraphIndex(web / "_index.json")
+
+
+def serve_child(args) -> None:
+    """Runs inside the server subprocess."""
+    _point_app_at(args.web_dir)
+    if args.serve == "dev":
+        import app as web_app
+
+        web_app.app.run(host="127.0.0.1", port=args.port, debug=True)
+    else:
+        import serve
+
+        serve.main([
+            "--host", "127.0.0.1", "--port", str(args.port),
+            "--workers", str(args.workers), "--threads", str(args.threads),
+        ])
+
+
+def build_graphs(web_dir: str, n: int) -> None:
+    import build_vote_web
+    from load_test_bill_web import synthetic_vote
+
+    web = pathlib.Path(web_dir)
+    build_vote_web.WEB_DIR = web
+    build_vote_web.WEB_INDEX_PATH = web / "_index.json"
+    build_vote_web.build_all([synthetic_vote(r) for r in range(1, n + 1)])
+
+
+def free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def wait_for(port: int, timeout: float = 30.0) -> None:
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        try:
+            with socket.create_connection(("127.0.0.1", port), timeout=0.5):
+                return
+        except OSError:
+            time.sleep(0.2)
+    raise RuntimeError(f"server on port {port} did not start")
+
+
+def load(port: int, paths, concurrency: int):
+    latencies = []
+    errors = [0]
+    lock = threading.Lock()
+    chunks = [paths[i::concurrency] for i in range(concurrency)]
+    headers = {"Accept-Encoding": "br, gzip"}
+
+    def worker(chunk):
+        conn = http.client.HTTPConnection("127.0.0.1", port, timeout=30)
+        mine = []
+        bad = 0
+        for path in chunk:
+            t0 = time.perf_counter()
+            try:
+                conn.request("GET", path, headers=headers)
+                resp = conn.getresponse()
+                resp.read()
+                if resp.status != 200:
+                    bad += 1
+                if resp.will_close:
+                    conn.close()
+            except (OSError, http.client.HTTPException):
+                bad += 1
+                conn.close()
+            mine.append(time.perf_counter() - t0)
+        conn.close()
+        with lock:
+            latencies.extend(mine)
+            errors[0] += bad
+
+    threads = [threading.Thread(target=worker, args=(c,)) for c in chunks]
+    t0 = time.perf_counter()
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    secs = time.perf_counter() - t0
+    latencies.sort()
+    pct = lambda q: latencies[min(len(latencies) - 1, int(q * len(latencies)))] * 1000  # noqa: E731
+    return len(paths) / secs, pct(0.50), pct(0.99), errors[0]
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--graphs", type=int, default=2000)
+    ap.add_argument("--requests", type=int, default=3000)
+    ap.add_argument("--concurrency", type=int, default=16)
+    ap.add_argument("--workers", type=int, default=4)
+    ap.add_argument("--threads", type=int, default=8)
+    ap.add_argument("--serve", choices=("dev", "prod"), help=argparse.SUPPRESS)
+    ap.add_argument("--web-dir", help=argparse.SUPPRESS)
+    ap.add_argument("--port", type=int, help=argparse.SUPPRESS)
+    args = ap.parse_args()
+
+    if args.serve:
+        serve_child(args)
+        return
+
+    rng = random.Random(7)
+    with tempfile.TemporaryDirectory() as web_dir:
+        build_graphs(web_dir, args.graphs)
+        results = {}
+        for mode in ("dev", "prod"):
+            port = free_port()
+            cmd = [
+                sys.executable, str(pathlib.Path(__file__).resolve()), "--serve", mode,
+                "--web-dir", web_dir, "--port", str(port),
+                "--workers", str(args.workers), "--threads", str(args.threads),
+            ]
+            proc = subprocess.Popen(
+                cmd, cwd=ROOT, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, start_new_session=True
+            )
+            try:
+                wait_for(port)
+                for name, path in SCENARIOS:
+                    if path is None:
+                        paths = [
+                            f"/api/bill-web?chamber=house&roll={rng.randint(1, min(200, args.graphs))}"
+                            for _ in range(args.requests)
+                        ]
+                    else:
+                        paths = [path] * args.requests
+                    load(port, paths[: args.concurrency * 5], args.concurrency)  # warm up
+                    results[(mode, name)] = load(port, paths, args.concurrency)
+            finally:
+                os.killpg(proc.pid, signal.SIGTERM)
+                proc.wait(timeout=10)
+
+    print(
+        f"{args.requests} requests/scenario, {args.concurrency} clients; "
+        f"serve.py workers={args.workers} threads={args.threads}"
+    )
+    print(f"{'scenario':<22}{'mode':<6}{'req/s':>9}{'p50 ms':>9}{'p99 ms':>9}{'errors':>8}")
+    for name, _ in SCENARIOS:
+        for mode in ("dev", "prod"):
+            rps, p50, p99, errs = results[(mode, name)]
+            print(f"{name:<22}{mode:<6}{rps:>9.0f}{p50:>9.2f}{p99:>9.2f}{errs:>8}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,9 +1,11 @@
 #!/usr/bin/env python3
-import csv, json, os, sys, subprocess, urllib.request, pathlib, traceback
+import csv, os, sys, subprocess, urllib.request, pathlib, traceback
 
 print("::: build_kpis.py start", flush=True)
 
 ROOT = pathlib.Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+import jsonio  # noqa: E402
 AGG  = ROOT / "capitol_league_rollcall_aggregate.py"
 DIST = ROOT / "dist"
 DIST.mkdir(exist_ok=True)
@@ -19,7 +21,12 @@ try:
         sys.executable, str(AGG),
         "--house-years", os.environ.get("HOUSE_YEARS", "2024-2025"),
         "--congress",    os.environ.get("CONGRESSES", "118-119"),
+        "--workers",     os.environ.get("FETCH_WORKERS", "8"),
+        "--rps",         os.environ.get("FETCH_RPS", "10"),
         "-o", str(bioguide_csv),
+        # State lives next to the raw cache so CI restores both; a missing
+        # state just means a full rebuild.
+        "--incremental", "--state", str(ROOT / ".cache" / "bioguide_kpis.state.json"),
     ]
     print("Running aggregator:", " ".join(cmd), flush=True)
     subprocess.check_call(cmd)
@@ -28,7 +35,7 @@ try:
     LEG_URL = "https://unitedstates.github.io/congress-legislators/legislators-current.json"
     print("Downloading legislators:", LEG_URL, flush=True)
     with urllib.request.urlopen(LEG_URL) as r:
-        leg = json.load(r)
+        leg = jsonio.load(r)
     bio2gt = {
         m["id"]["bioguide"]: str(m["id"]["govtrack"])
         for m in leg
@@ -58,8 +65,7 @@ try:
             obj[gt] = {"total_votes": total, "missed_votes": miss}
             w.writerow([gt, total, miss])
 
-    with open(kpis_json, "w", encoding="utf-8") as f:
-        json.dump(obj, f, indent=2)
+    jsonio.dump_file(kpis_json, obj, indent=2)
 
     print(f"Wrote: {kpis_csv} and {kpis_json} records: {len(obj)}", flush=True)
 except Exception as e:
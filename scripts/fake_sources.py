@@ -0,0 +1,504 @@
+#!/usr/bin/env python3
+"""
+fake_sources.py
+
+A local stand-in for the Clerk of the House, Senate LIS and GovTrack vote
+feeds, used by the benchmarks in scripts/. Documents are generated
+deterministically in the same shape as the real feeds:
+
+    /evs/{year}/index.asp
+    /evs/{year}/ROLL_{start}.asp
+    /evs/{year}/roll{num:03d}.xml
+    /legislative/LIS/roll_call_lists/vote_menu_{congress}_{session}.xml
+    /legislative/LIS/roll_call_votes/vote{congress}{session}/vote_{congress}_{session}_{num:05d}.xml
+    /api/v2/vote?chamber={chamber}&order_by=-created&limit={n}
+
+With --fixtures DIR, recorded responses are served instead wherever DIR has
+one: the file for a URL is its path (plus "@<query>" when it has a query
+string), e.g. DIR/evs/2025/roll262.xml or
+DIR/api/v2/vote@chamber=house&order_by=-created&limit=200. --record writes
+the generated documents out in that layout and --from-cache exports real
+downloads from a raw cache (raw_cache.py) into it.
+
+--error-rate answers that fraction of requests 503 (seeded, so runs repeat)
+and --gap-rate turns that fraction of roll-call XML into 404s.
+
+Point the fetchers at it with CAPITOL_HTTP_REMAP (see http_client.py), e.g.
+    CAPITOL_HTTP_REMAP="*=http://127.0.0.1:8765" python build_master_data.py full
+
+Usage:
+    python scripts/fake_sources.py --port 8765 --latency 0.05
+    python scripts/fake_sources.py --fixtures fixtures/ --error-rate 0.02 --gap-rate 0.01
+    python scripts/fake_sources.py --record fixtures/
+"""
+
+import argparse
+import datetime as dt
+import hashlib
+import json
+import pathlib
+import random
+import re
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Iterable, List, Optional, Tuple
+from urllib.parse import parse_qs, urlsplit
+
+ROOT = pathlib.Path(__file__).resolve().parents[1]
+
+HOUSE_SIZE = 435
+SENATE_SIZE = 100
+POSITIONS = ("Yea", "Yea", "Nay", "Nay", "Yea", "Nay", "Present", "Not Voting")
+MONTHS = ("Jan", "Feb", "Mar", "Apr", "May", "Jun", "Jul", "Aug", "Sep", "Oct", "Nov", "Dec")
+
+
+def members(n: int, seed: int = 0) -> List[Tuple[str, str, str]]:
+    """(bioguide, party, state) tuples; ids look like real Bioguide ids."""
+    out = []
+    for i in range(n):
+        bid = f"{chr(ord('A') + (i + seed) % 26)}{(i + seed) * 37 % 1000000:06d}"
+        party = "R" if i % 2 == 0 else ("D" if i % 17 else "I")
+        out.append((bid, party, f"S{i % 50:02d}"))
+    return out
+
+
+HOUSE_MEMBERS = members(HOUSE_SIZE)
+SENATE_MEMBERS = members(SENATE_SIZE, seed=500)
+
+
+def roll_date(year: int, num: int, per_year: int) -> dt.date:
+    return dt.date(year, 1, 3) + dt.timedelta(days=(num - 1) * 350 // max(per_year, 1))
+
+
+def position(num: int, i: int) -> str:
+    return POSITIONS[(num * 7 + i * 13) % len(POSITIONS)]
+
+
+def house_roll_xml(year: int, num: int, per_year: int) -> bytes:
+    d = roll_date(year, num, per_year)
+    congress = (year - 1789) // 2 + 1
+    session = "1st" if year % 2 else "2nd"
+    tallies = {}
+    rows = []
+    for i, (bid, party, state) in enumerate(HOUSE_MEMBERS):
+        pos = position(num, i)
+        tallies.setdefault(party, {}).setdefault(pos, 0)
+        tallies[party][pos] += 1
+        rows.append(
+            f'<recorded-vote><legislator name-id="{bid}" sort-field="Member{i}" '
+            f'unaccented-name="Member{i}" party="{party}" state="{state}" role="legislator">'
+            f"Member{i}</legislator><vote>{pos}</vote></recorded-vote>"
+        )
+    by_party = "".join(
+        f"<totals-by-party><party>{p}</party>"
+        f"<yea-total>{t.get('Yea', 0)}</yea-total><nay-total>{t.get('Nay', 0)}</nay-total>"
+        f"<present-total>{t.get('Present', 0)}</present-total>"
+        f"<not-voting-total>{t.get('Not Voting', 0)}</not-voting-total></totals-by-party>"
+        for p, t in sorted(tallies.items())
+    )
+    overall = {k: sum(t.get(k, 0) for t in tallies.values()) for k in ("Yea", "Nay", "Present", "Not Voting")}
+    return (
+        '<?xml version="1.0" encoding="UTF-8"?>\n<rollcall-vote><vote-metadata>'
+        f"<majority>R</majority><congress>{congress}</congress><session>{session}</session>"
+        f"<chamber>U.S. House of Representatives</chamber><rollcall-num>{num}</rollcall-num>"
+        f"<legis-num>H R {1000 + num}</legis-num><vote-question>On Passage</vote-question>"
+        "<vote-type>YEA-AND-NAY</vote-type><vote-result>Passed</vote-result>"
+        f"<action-date>{d.day}-{MONTHS[d.month - 1]}-{d.year}</action-date>"
+        '<action-time time-etz="14:02">2:02 PM</action-time>'
+        f"<vote-desc>Synthetic roll {num}</vote-desc><vote-totals>{by_party}"
+        f"<totals-by-vote><total-stub>Totals</total-stub><yea-total>{overall['Yea']}</yea-total>"
+        f"<nay-total>{overall['Nay']}</nay-total><present-total>{overall['Present']}</present-total>"
+        f"<not-voting-total>{overall['Not Voting']}</not-voting-total></totals-by-vote>"
+        f"</vote-totals></vote-metadata><vote-data>{''.join(rows)}</vote-data></rollcall-vote>"
+    ).encode("utf-8")
+
+
+def house_index_html(year: int, per_year: int) -> bytes:
+    links = "".join(
+        f'<a href="ROLL_{start}.asp">Roll Calls {max(start, 1)}-{min(start + 99, per_year)}</a>\n'
+        for start in range(0, per_year, 100)
+    )
+    return f"<html><body><h1>{year} Roll Call Votes</h1>\n{links}</body></html>".encode("utf-8")
+
+
+def house_range_html(year: int, start: int, per_year: int) -> bytes:
+    rows = []
+    for num in range(min(start + 99, per_year), max(start, 1) - 1, -1):
+        d = roll_date(year, num, per_year)
+        rows.append(
+            f'<TR><TD><A HREF="http://clerk.house.gov/cgi-bin/vote.asp?year={year}&amp;rollnumber={num}">{num}</A></TD>'
+            f'<TD><FONT FACE="Arial" SIZE="-1">{d.day}-{MONTHS[d.month - 1]}</FONT></TD>'
+            f"<TD>H R {1000 + num}</TD><TD>On Passage</TD><TD>P</TD></TR>\n"
+        )
+    return f"<html><body><TABLE>\n{''.join(rows)}</TABLE></body></html>".encode("utf-8")
+
+
+def senate_session_year(congress: int, session: int) -> int:
+    return 1789 + (congress - 1) * 2 + (session - 1)
+
+
+def senate_menu_xml(congress: int, session: int, per_session: int) -> bytes:
+    year = senate_session_year(congress, session)
+    votes = []
+    for num in range(per_session, 0, -1):
+        d = roll_date(year, num, per_session)
+        votes.append(
+            f"<vote><vote_number>{num:05d}</vote_number><vote_date>{d.day:02d}-{MONTHS[d.month - 1]}</vote_date>"
+            f"<issue>S. {num}</issue><question>On the Motion</question><result>Agreed to</result>"
+            f"<vote_tally><yeas>50</yeas><nays>50</nays></vote_tally><title>Synthetic vote {num}</title></vote>"
+        )
+    return (
+        '<?xml version="1.0" encoding="UTF-8"?>\n<vote_summary>'
+        f"<congress>{congress}</congress><session>{session}</session><congress_year>{year}</congress_year>"
+        f"<votes>{''.join(votes)}</votes></vote_summary>"
+    ).encode("utf-8")
+
+
+def senate_vote_xml(congress: int, session: int, num: int, per_session: int) -> bytes:
+    year = senate_session_year(congress, session)
+    d = roll_date(year, num, per_session)
+    counts = {"Yea": 0, "Nay": 0, "Present": 0, "Not Voting": 0}
+    rows = []
+    for i, (bid, party, state) in enumerate(SENATE_MEMBERS):
+        pos = position(num, i)
+        counts[pos] += 1
+        rows.append(
+            f"<member><member_full>Senator{i} ({party}-{state})</member_full><last_name>Senator{i}</last_name>"
+            f"<first_name>Sam</first_name><party>{party}</party><state>{state}</state>"
+            f"<vote_cast>{pos}</vote_cast><lis_member_id>S{i:03d}</lis_member_id>"
+            f"<bioguide_id>{bid}</bioguide_id></member>"
+        )
+    return (
+        '<?xml version="1.0" encoding="UTF-8"?>\n<roll_call_vote>'
+        f"<congress>{congress}</congress><session>{session}</session><congress_year>{year}</congress_year>"
+        f"<vote_number>{num}</vote_number>"
+        f"<vote_date>{d.strftime('%B')} {d.day}, {d.year},  11:43 AM</vote_date>"
+        f"<question>On the Motion</question><vote_title>Synthetic vote {num}</vote_title>"
+        "<vote_result>Agreed to</vote_result>"
+        f"<document><document_congress>{congress}</document_congress><document_type>S.</document_type>"
+        f"<document_number>{num}</document_number><document_name>S. {num}</document_name></document>"
+        f"<count><yeas>{counts['Yea']}</yeas><nays>{counts['Nay']}</nays>"
+        f"<present>{counts['Present']}</present><absent>{counts['Not Voting']}</absent></count>"
+        f"<members>{''.join(rows)}</members></roll_call_vote>"
+    ).encode("utf-8")
+
+
+def govtrack_votes_json(
+    chamber: str, limit: int, years: Iterable[int], house_per_year: int, senate_per_session: int
+) -> bytes:
+    """
+    A GovTrack /api/v2/vote page (newest first) describing the same synthetic
+    rolls as the Clerk/LIS documents, so the two sources reconcile.
+    """
+    per = house_per_year if chamber == "house" else senate_per_session
+    letter = chamber[0]
+    objects = []
+    for year in years:
+        congress = (year - 1789) // 2 + 1
+        for num in range(1, per + 1):
+            d = roll_date(year, num, per)
+            objects.append({
+                "id": (1 if chamber == "house" else 2) * 100_000_000 + year * 10_000 + num,
+                "chamber": chamber,
+                "congress": congress,
+                "session": str(year),
+                "number": num,
+                "created": f"{d.isoformat()}T14:02:00",
+                "question": "On Passage" if chamber == "house" else "On the Motion",
+                "description": f"Synthetic {'roll' if chamber == 'house' else 'vote'} {num}",
+                "result": "Passed" if chamber == "house" else "Agreed to",
+                "link": f"https://www.govtrack.us/congress/votes/{congress}-{year}/{letter}{num}",
+            })
+    objects.sort(key=lambda o: o["created"], reverse=True)
+    page = {"meta": {"limit": limit, "offset": 0, "total_count": len(objects)}, "objects": objects[:limit]}
+    return json.dumps(page).encode("utf-8")
+
+
+GOVTRACK_QUERY = "chamber={chamber}&order_by=-created&limit=200"  # what build_master_data asks for
+ROLL_XML_RE = re.compile(r"/(roll\d+|vote_\d+_\d_\d+)\.xml$")
+
+
+def fixture_name(path: str, query: str = "") -> str:
+    """Fixture file for a request, relative to the fixture directory."""
+    name = path.lstrip("/")
+    return f"{name}@{query}" if query else name
+
+
+def write_fixture(root: pathlib.Path, path: str, query: str, body: bytes) -> None:
+    target = root / fixture_name(path, query)
+    target.parent.mkdir(parents=True, exist_ok=True)
+    target.write_bytes(body)
+
+
+def export_cache(cache_dir: str, dest: pathlib.Path) -> int:
+    """Write every body in a raw cache (raw_cache.py) out as a fixture; returns the count."""
+    sys.path.insert(0, str(ROOT))
+    import raw_cache
+
+    cache = raw_cache.RawCache(pathlib.Path(cache_dir))
+    written = 0
+    for url in list(cache.entries):
+        body = cache.get(url)
+        if body is None:
+            continue
+        parts = urlsplit(url)
+        write_fixture(dest, parts.path, parts.query, body)
+        written += 1
+    return written
+
+
+class FakeSourceServer:
+    """
+    Threaded HTTP server answering Clerk/LIS/GovTrack paths. `latency` is
+    added to every response. Counters: `hits` requests served,
+    `not_modified` answered 304 (every body carries a strong ETag),
+    `errors` injected 503s, `gaps` injected 404s, `bytes_sent` body bytes.
+
+    `fixtures` is a directory of recorded responses served in preference to
+    the generated ones (only those with `fixtures_only`). `error_rate` is the
+    fraction of requests answered 503 with Retry-After: 0, drawn from a
+    random stream seeded with `seed`; `gap_rate` the fraction of roll-call
+    XML URLs that always 404, picked by a hash of the path.
+    """
+
+    def __init__(
+        self,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        latency: float = 0.0,
+        house_rolls_per_year: int = 60,
+        senate_votes_per_session: int = 40,
+        fixtures: Optional[str] = None,
+        fixtures_only: bool = False,
+        error_rate: float = 0.0,
+        gap_rate: float = 0.0,
+        seed: int = 0,
+        first_year: int = 2023,
+        last_year: Optional[int] = None,
+    ):
+        self.latency = latency
+        self.house_rolls_per_year = house_rolls_per_year
+        self.senate_votes_per_session = senate_votes_per_session
+        self.fixtures = pathlib.Path(fixtures) if fixtures else None
+        self.fixtures_only = fixtures_only
+        self.error_rate = error_rate
+        self.gap_rate = gap_rate
+        self.years = range(first_year, (last_year or dt.date.today().year) + 1)
+        self.hits = 0
+        self.not_modified = 0
+        self.errors = 0
+        self.gaps = 0
+        self.bytes_sent = 0
+        self._rng = random.Random(seed)
+        self._lock = threading.Lock()
+        outer = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def send_empty(self, status: int, **headers: str) -> None:
+                self.send_response(status)
+                for name, value in headers.items():
+                    self.send_header(name.replace("_", "-"), value)
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+
+            def do_GET(self):
+                with outer._lock:
+                    outer.hits += 1
+                    fail = outer.error_rate > 0 and outer._rng.random() < outer.error_rate
+                if outer.latency:
+                    time.sleep(outer.latency)
+                if fail:
+                    with outer._lock:
+                        outer.errors += 1
+                    self.send_empty(503, Retry_After="0")
+                    return
+                path, _, query = self.path.partition("?")
+                body = outer.lookup(path, query)
+                if body is None:
+                    self.send_empty(404)
+                    return
+                etag = '"%s"' % hashlib.sha1(body).hexdigest()
+                if self.headers.get("If-None-Match") == etag:
+                    with outer._lock:
+                        outer.not_modified += 1
+                    self.send_empty(304, ETag=etag)
+                    return
+                if path.startswith("/api/"):
+                    ctype = "application/json"
+                else:
+                    ctype = "text/xml" if path.endswith(".xml") else "text/html"
+                self.send_response(200)
+                self.send_header("ETag", etag)
+                self.send_header("Content-Type", ctype)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+                with outer._lock:
+                    outer.bytes_sent += len(body)
+
+            def log_message(self, *args):
+                pass
+
+        self.httpd = ThreadingHTTPServer((host, port), Handler)
+        self.httpd.daemon_threads = True
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def base_url(self) -> str:
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def counters(self) -> dict:
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "notModified": self.not_modified,
+                "errors": self.errors,
+                "gaps": self.gaps,
+                "bytesSent": self.bytes_sent,
+            }
+
+    def is_gap(self, path: str) -> bool:
+        if self.gap_rate <= 0 or not ROLL_XML_RE.search(path):
+            return False
+        return int(hashlib.sha1(path.encode("utf-8")).hexdigest()[:8], 16) / 2**32 < self.gap_rate
+
+    def lookup(self, path: str, query: str = "") -> Optional[bytes]:
+        """The body for a request: a recorded fixture, else a generated document."""
+        if self.is_gap(path):
+            with self._lock:
+                self.gaps += 1
+            return None
+        if self.fixtures is not None and ".." not in path:
+            for name in (fixture_name(path, query), fixture_name(path)):
+                try:
+                    return (self.fixtures / name).read_bytes()
+                except OSError:
+                    continue
+            if self.fixtures_only:
+                return None
+        return self.render(path, query)
+
+    def render(self, path: str, query: str = "") -> Optional[bytes]:
+        per_year = self.house_rolls_per_year
+        per_session = self.senate_votes_per_session
+        m = re.fullmatch(r"/evs/(\d{4})/roll(\d+)\.xml", path)
+        if m:
+            year, num = int(m.group(1)), int(m.group(2))
+            return house_roll_xml(year, num, per_year) if 1 <= num <= per_year else None
+        m = re.fullmatch(r"/evs/(\d{4})/index\.asp", path)
+        if m:
+            return house_index_html(int(m.group(1)), per_year)
+        m = re.fullmatch(r"/evs/(\d{4})/ROLL_(\d+)\.asp", path)
+        if m:
+            start = int(m.group(2))
+            return house_range_html(int(m.group(1)), start, per_year) if start < per_year else None
+        m = re.fullmatch(r"/legislative/LIS/roll_call_lists/vote_menu_(\d+)_([12])\.xml", path)
+        if m:
+            return senate_menu_xml(int(m.group(1)), int(m.group(2)), per_session)
+        m = re.fullmatch(r"/legislative/LIS/roll_call_votes/vote(\d+)([12])/vote_\d+_\d_(\d+)\.xml", path)
+        if m:
+            c, s, num = int(m.group(1)), int(m.group(2)), int(m.group(3))
+            return senate_vote_xml(c, s, num, per_session) if 1 <= num <= per_session else None
+        if path.rstrip("/") == "/api/v2/vote":
+            params = parse_qs(query)
+            chamber = (params.get("chamber") or [""])[0]
+            if chamber not in ("house", "senate"):
+                return None
+            try:
+                limit = int((params.get("limit") or ["100"])[0])
+            except ValueError:
+                limit = 100
+            return govtrack_votes_json(chamber, limit, self.years, per_year, per_session)
+        return None
+
+    def documents(self) -> Iterable[Tuple[str, str]]:
+        """(path, query) of every generated document for the configured years."""
+        for year in self.years:
+            yield f"/evs/{year}/index.asp", ""
+            for start in range(0, self.house_rolls_per_year, 100):
+                yield f"/evs/{year}/ROLL_{start}.asp", ""
+            for num in range(1, self.house_rolls_per_year + 1):
+                yield f"/evs/{year}/roll{num:03d}.xml", ""
+            congress, session = (year - 1789) // 2 + 1, 1 if year % 2 else 2
+            yield f"/legislative/LIS/roll_call_lists/vote_menu_{congress}_{session}.xml", ""
+            for num in range(1, self.senate_votes_per_session + 1):
+                yield (
+                    f"/legislative/LIS/roll_call_votes/vote{congress}{session}/"
+                    f"vote_{congress}_{session}_{num:05d}.xml"
+                ), ""
+        for chamber in ("house", "senate"):
+            yield "/api/v2/vote", GOVTRACK_QUERY.format(chamber=chamber)
+
+    def record(self, dest: pathlib.Path) -> int:
+        """Write the generated documents to `dest` as fixtures; returns the count."""
+        written = 0
+        for path, query in self.documents():
+            body = self.render(path, query)
+            if body is not None:
+                write_fixture(dest, path, query, body)
+                written += 1
+        return written
+
+    def start(self) -> "FakeSourceServer":
+        self._thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+    def __enter__(self) -> "FakeSourceServer":
+        return self.start()
+
+    def __exit__(self, *exc) -> None:
+        self.stop()
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description="Serve fake Clerk/LIS/GovTrack vote feeds locally.")
+    ap.add_argument("--host", default="127.0.0.1")
+    ap.add_argument("--port", type=int, default=8765)
+    ap.add_argument("--latency", type=float, default=0.0, help="Seconds added to every response")
+    ap.add_argument("--house-rolls", type=int, default=60, help="Roll calls per House year")
+    ap.add_argument("--senate-votes", type=int, default=40, help="Votes per Senate session")
+    ap.add_argument("--first-year", type=int, default=2023, help="First year listed by GovTrack / --record")
+    ap.add_argument("--last-year", type=int, default=None, help="Last year (default: this year)")
+    ap.add_argument("--fixtures", default=None, help="Directory of recorded responses to serve")
+    ap.add_argument("--fixtures-only", action="store_true", help="404 anything not in --fixtures")
+    ap.add_argument("--error-rate", type=float, default=0.0, help="Fraction of requests answered 503")
+    ap.add_argument("--gap-rate", type=float, default=0.0, help="Fraction of roll-call XML answered 404")
+    ap.add_argument("--seed", type=int, default=0, help="Seed for --error-rate")
+    ap.add_argument("--record", default=None, metavar="DIR", help="Write fixtures to DIR and exit")
+    ap.add_argument("--from-cache", default=None, metavar="CACHE_DIR",
+                    help="With --record: export a raw cache's downloads instead of generated documents")
+    args = ap.parse_args()
+
+    server = FakeSourceServer(
+        args.host, 0 if args.record else args.port, args.latency, args.house_rolls, args.senate_votes,
+        fixtures=args.fixtures, fixtures_only=args.fixtures_only, error_rate=args.error_rate,
+        gap_rate=args.gap_rate, seed=args.seed, first_year=args.first_year, last_year=args.last_year,
+    )
+    if args.record:
+        dest = pathlib.Path(args.record)
+        if args.from_cache:
+            written = export_cache(args.from_cache, dest)
+        else:
+            written = server.record(dest)
+        server.httpd.server_close()
+        print(f"Wrote {written} fixtures to {dest}")
+        return
+    print(f"Serving fake Clerk/LIS/GovTrack feeds on {server.base_url}", flush=True)
+    try:
+        server.httpd.serve_forever()
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+"""
+Load test for /api/bill-web: uncached (parse + re-serialize per request, the
+old behaviour) vs the in-process body cache, plus revalidation with
+If-None-Match.
+
+Builds --graphs vote graphs into a temporary data/web, then replays a skewed
+request mix (a few hot votes get most traffic, as during floor action)
+through Flask's test client from --threads threads.
+
+Usage:
+    python scripts/load_test_bill_web.py --graphs 2000 --requests 5000 --threads 4
+"""
+
+import argparse
+import json
+import pathlib
+import random
+import sys
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+ROOT = pathlib.Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+import app as web_app  # noqa: E402
+import build_vote_web  # noqa: E402
+
+
+def synthetic_vote(roll: int) -> dict:
+    return {
+        "id": f"H-119-1st-{roll}",
+        "chamber": "house",
+        "congress": 119,
+        "session": "1st",
+        "rollNumber": roll,
+        "date": "2025-07-17T14:02:00",
+        "bill": {"code": f"H R {1000 + roll}"},
+        "question": "On Passage",
+        "description": "Synthetic roll " * 20,
+        "result": "Passed",
+        "totals": {"yea": 218, "nay": 210, "present": 1, "notVoting": 6},
+        "totalsByParty": [
+            {"party": p, "yea": 100, "nay": 100, "present": 0, "notVoting": 2}
+            for p in ("Republican", "Democratic", "Independent")
+        ],
+        "sources": {"houseXml": f"https://clerk.house.gov/evs/2025/roll{roll:03d}.xml"},
+    }
+
+
+def run(client_factory, rolls, threads, headers_for):
+    def worker(chunk):
+        client = client_factory()
+        codes = {}
+        for roll in chunk:
+            r = client.get(f"/api/bill-web?chamber=house&roll={roll}", headers=headers_for(roll))
+            codes[r.status_code] = codes.get(r.status_code, 0) + 1
+        return codes
+
+    chunks = [rolls[i::threads] for i in range(threads)]
+    t0 = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=threads) as pool:
+        results = list(pool.map(worker, chunks))
+    secs = time.perf_counter() - t0
+    codes = {}
+    for c in results:
+        for k, v in c.items():
+            codes[k] = codes.get(k, 0) + v
+    return secs, codes
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--graphs", type=int, default=2000)
+    ap.add_argument("--requests", type=int, default=5000)
+    ap.add_argument("--threads", type=int, default=4)
+    args = ap.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        web = pathlib.Path(tmp)
+        build_vote_web.WEB_DIR = web
+        build_vote_web.WEB_INDEX_PATH = web / "_index.json"
+        web_app.WEB_DIR = web
+        web_app.graph_index = web_app.GraphIndex(web / "_index.json")
+        build_vote_web.build_all([synthetic_vote(r) for r in range(1, args.graphs + 1)])
+
+        rng = random.Random(3)
+        hot = list(range(1, 21))
+        rolls = [rng.choice(hot) if rng.random() < 0.8 else rng.randint(1, args.graphs) for _ in range(args.requests)]
+        client = web_app.app.test_client
+        gzip_headers = lambda roll: {"Accept-Encoding": "gzip"}  # noqa: E731
+
+        print(f"{args.requests} requests over {args.graphs} graphs, {args.threads} threads")
+        print(f"{'mode':<22}{'req/s':>10}{'ms/req':>10}  status")
+
+        web_app.body_cache = web_app.BodyCache(max_entries=0)
+        secs, codes = run(client, rolls, args.threads, gzip_headers)
+        print(f"{'uncached':<22}{args.requests / secs:>10.0f}{secs * 1000 / args.requests:>10.3f}  {codes}")
+
+        web_app.body_cache = web_app.BodyCache()
+        secs, codes = run(client, rolls, args.threads, gzip_headers)
+        print(f"{'cached (gzip)':<22}{args.requests / secs:>10.0f}{secs * 1000 / args.requests:>10.3f}  {codes}")
+
+        etags = {}
+        for roll in set(rolls):
+            r = web_app.app.test_client().get(f"/api/bill-web?chamber=house&roll={roll}", headers=gzip_headers(roll))
+            etags[roll] = r.headers["ETag"]
+        revalidate = lambda roll: {"Accept-Encoding": "gzip", "If-None-Match": etags[roll]}  # noqa: E731
+        secs, codes = run(client, rolls, args.threads, revalidate)
+        print(f"{'cached + If-None-Match':<22}{args.requests / secs:>10.0f}{secs * 1000 / args.requests:>10.3f}  {codes}")
+
+        c = web_app.body_cache
+        print(f"cache: {c.hits} hits, {c.misses} misses, {len(c._items)} entries")
+        sample = json.loads(web_app.app.test_client().get("/api/bill-web?chamber=house&roll=1").data)
+        print("sample id:", sample["id"])
+
+
+if __name__ == "__main__":
+    main()
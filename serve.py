@@ -0,0 +1,313 @@
+#!/usr/bin/env python3
+"""
+serve.py
+
+Production entry point for app.py. `python app.py` is the Flask dev server
+(one process, reloader and debugger on, whole repo served as static files);
+this runs the same app with debug off on a multi-worker WSGI server:
+
+    python serve.py                          # gunicorn if installed, else waitress
+    python serve.py --workers 4 --threads 8 --port 8000
+    gunicorn -w 4 --threads 8 -k gthread serve:application
+
+Static files are answered by StaticFiles before they reach Flask. Only the
+site's own assets are served (html/js/css/json/images/fonts under the repo
+root, assets/, css/, js/, config/, data/, dist/); Python sources, scripts and
+dotfiles 404. css/js/images/fonts get a long max-age, html and json are
+revalidated with ETags. When a fresh `.br` / `.gz` variant exists under
+.cache/static/ and the client accepts it (q > 0), that is sent instead; they
+are written at startup (or with --precompress-only after a deploy).
+
+Settings come from flags or the environment: PORT, CAPITOL_HOST,
+CAPITOL_WORKERS, CAPITOL_THREADS, CAPITOL_STATIC_MAX_AGE,
+CAPITOL_PRECOMPRESS_DIR.
+"""
+
+from __future__ import annotations
+
+import argparse
+import gzip
+import mimetypes
+import os
+import sys
+from pathlib import Path
+from typing import Iterable, Optional
+
+from werkzeug.http import parse_accept_header
+
+from app import ROOT, app
+
+DEFAULT_HOST = os.environ.get("CAPITOL_HOST") or "0.0.0.0"
+DEFAULT_PORT = int(os.environ.get("PORT") or 5000)
+DEFAULT_WORKERS = int(os.environ.get("CAPITOL_WORKERS") or min(8, (os.cpu_count() or 1) * 2 + 1))
+DEFAULT_THREADS = int(os.environ.get("CAPITOL_THREADS") or 4)
+
+# One week; assets aren't fingerprinted, so keep this well short of "immutable".
+STATIC_MAX_AGE = int(os.environ.get("CAPITOL_STATIC_MAX_AGE") or 7 * 24 * 3600)
+
+STATIC_DIRS = {"", "assets", "css", "js", "config", "data", "dist"}
+STATIC_EXCLUDE = {"package.json", "package-lock.json"}
+LONG_CACHE_EXTENSIONS = {
+    ".js", ".mjs", ".css", ".map", ".ico", ".png", ".jpg", ".jpeg", ".gif",
+    ".svg", ".webp", ".woff", ".woff2",
+}
+REVALIDATE_EXTENSIONS = {".html", ".json", ".csv", ".txt"}
+STATIC_EXTENSIONS = LONG_CACHE_EXTENSIONS | REVALIDATE_EXTENSIONS
+COMPRESSIBLE_EXTENSIONS = STATIC_EXTENSIONS - {".ico", ".png", ".jpg", ".jpeg", ".gif", ".webp", ".woff", ".woff2"}
+PRECOMPRESS_MIN_BYTES = 1024
+# Precompressed variants live outside the source tree, mirroring its layout.
+PRECOMPRESS_DIR = Path(os.environ.get("CAPITOL_PRECOMPRESS_DIR") or ROOT / ".cache" / "static")
+# Vote graphs (thousands of files, rewritten on every build) are gzipped in
+# memory by app.py's body cache; don't litter data/web with siblings.
+PRECOMPRESS_EXCLUDE_DIRS = ("data/web",)
+
+# Served for GET /, as app.index does on the dev server.
+INDEX_FILE = "votes.html"
+
+# (suffix, Content-Encoding), best first
+ENCODINGS = (("br", ".br"), ("gzip", ".gz"))
+
+
+def is_static_path(rel: str) -> bool:
+    """True for repo-relative paths StaticFiles may serve."""
+    parts = rel.split("/")
+    if any(not p or p.startswith(".") or p == ".." for p in parts):
+        return False
+    if parts[-1] in STATIC_EXCLUDE:
+        return False
+    top = parts[0] if len(parts) > 1 else ""
+    return top in STATIC_DIRS and Path(parts[-1]).suffix.lower() in STATIC_EXTENSIONS
+
+
+def variant_path(cache_dir: Path, rel: str, suffix: str) -> Path:
+    return cache_dir / f"{rel}{suffix}"
+
+
+def _fresh_variant(variant: Path, mtime_ns: int) -> Optional[os.stat_result]:
+    try:
+        st = variant.stat()
+    except OSError:
+        return None
+    return st if st.st_mtime_ns >= mtime_ns else None
+
+
+class StaticFiles:
+    """
+    WSGI middleware: GET/HEAD for anything outside /api/ is a static file
+    under `root` (or 404); everything else goes to the wrapped app.
+    """
+
+    def __init__(self, wsgi_app, root: Path, max_age: int = STATIC_MAX_AGE, cache_dir: Path = PRECOMPRESS_DIR):
+        self.wsgi_app = wsgi_app
+        self.root = Path(root).resolve()
+        self.max_age = max_age
+        self.cache_dir = Path(cache_dir)
+
+    def __call__(self, environ, start_response):
+        path = environ.get("PATH_INFO") or "/"
+        method = environ.get("REQUEST_METHOD", "GET")
+        if path.startswith("/api/") or method not in ("GET", "HEAD"):
+            return self.wsgi_app(environ, start_response)
+
+        rel = path.lstrip("/") or INDEX_FILE
+        target = self.root / rel
+        if not is_static_path(rel) or not target.is_file():
+            return self._send(start_response, "404 Not Found", [("Content-Type", "text/plain")], b"Not Found", method)
+        return self._serve_file(environ, start_response, target, rel, method)
+
+    def cache_control(self, path: Path) -> str:
+        if path.suffix.lower() in LONG_CACHE_EXTENSIONS:
+            return f"public, max-age={self.max_age}"
+        return "no-cache"
+
+    def _serve_file(self, environ, start_response, path: Path, rel: str, method: str):
+        st = path.stat()
+        send_path, encoding, send_st = path, None, st
+        if path.suffix.lower() in COMPRESSIBLE_EXTENSIONS:
+            # Parsed like app.py's request.accept_encodings, so "br;q=0" opts out.
+            accept = parse_accept_header(environ.get("HTTP_ACCEPT_ENCODING"))
+            for name, suffix in ENCODINGS:
+                if accept[name] > 0:
+                    variant = variant_path(self.cache_dir, rel, suffix)
+                    variant_st = _fresh_variant(variant, st.st_mtime_ns)
+                    if variant_st is not None:
+                        send_path, encoding, send_st = variant, name, variant_st
+                        break
+
+        etag = f'"{st.st_mtime_ns:x}-{st.st_size:x}{"-" + encoding if encoding else ""}"'
+        content_type = mimetypes.guess_type(path.name)[0] or "application/octet-stream"
+        if content_type.startswith("text/") or content_type in ("application/javascript", "application/json"):
+            content_type += "; charset=utf-8"
+        headers = [
+            ("Cache-Control", self.cache_control(path)),
+            ("ETag", etag),
+            ("Vary", "Accept-Encoding"),
+        ]
+
+        if etag in (environ.get("HTTP_IF_NONE_MATCH") or ""):
+            return self._send(start_response, "304 Not Modified", headers, b"", "HEAD")
+
+        headers += [("Content-Type", content_type), ("Content-Length", str(send_st.st_size))]
+        if encoding:
+            headers.append(("Content-Encoding", encoding))
+        start_response("200 OK", headers)
+        if method == "HEAD":
+            return [b""]
+        f = send_path.open("rb")
+        wrapper = environ.get("wsgi.file_wrapper")
+        if wrapper is not None:
+            return wrapper(f, 64 * 1024)
+        with f:
+            return [f.read()]
+
+    @staticmethod
+    def _send(start_response, status: str, headers, body: bytes, method: str):
+        if status.startswith("404"):
+            headers = headers + [("Content-Length", str(len(body)))]
+        start_response(status, headers)
+        return [b""] if method == "HEAD" else [body]
+
+
+def iter_static_files(root: Path) -> Iterable[Path]:
+    root = Path(root)
+    for top in sorted(STATIC_DIRS):
+        base = root / top if top else root
+        if not base.is_dir():
+            continue
+        paths = base.glob("*") if not top else base.rglob("*")
+        for p in sorted(paths):
+            if p.is_file() and is_static_path(p.relative_to(root).as_posix()):
+                yield p
+
+
+def precompress(root: Path = ROOT, min_bytes: int = PRECOMPRESS_MIN_BYTES, cache_dir: Path = PRECOMPRESS_DIR) -> int:
+    """
+    Write `.gz` (and `.br` when the brotli package is installed) under
+    cache_dir for every compressible static file outside
+    PRECOMPRESS_EXCLUDE_DIRS that lacks a fresh one. Returns files written.
+    """
+    try:
+        import brotli  # type: ignore
+    except Exception:
+        brotli = None
+        print("serve: 'brotli' not installed, writing .gz variants only (pip install brotli)", file=sys.stderr)
+
+    written = 0
+    excluded = [Path(root) / d for d in PRECOMPRESS_EXCLUDE_DIRS]
+    for path in iter_static_files(root):
+        if path.suffix.lower() not in COMPRESSIBLE_EXTENSIONS:
+            continue
+        if any(path.is_relative_to(d) for d in excluded):
+            continue
+        st = path.stat()
+        if st.st_size < min_bytes:
+            continue
+        data = None
+        for name, suffix in ENCODINGS:
+            if name == "br" and brotli is None:
+                continue
+            out = variant_path(Path(cache_dir), path.relative_to(root).as_posix(), suffix)
+            if _fresh_variant(out, st.st_mtime_ns) is not None:
+                continue
+            if data is None:
+                data = path.read_bytes()
+            packed = brotli.compress(data, quality=11) if name == "br" else gzip.compress(data, 9, mtime=0)
+            if len(packed) >= len(data):
+                continue
+            out.parent.mkdir(parents=True, exist_ok=True)
+            tmp = out.with_name(f".{out.name}.tmp")
+            tmp.write_bytes(packed)
+            os.utime(tmp, ns=(st.st_atime_ns, st.st_mtime_ns))
+            tmp.replace(out)
+            written += 1
+    return written
+
+
+app.debug = False
+application = StaticFiles(app.wsgi_app, ROOT)
+
+
+def run_gunicorn(host: str, port: int, workers: int, threads: int) -> None:
+    try:
+        from gunicorn.app.base import BaseApplication  # type: ignore
+    except Exception:
+        print("serve --server gunicorn requires the 'gunicorn' package. Install with: pip install gunicorn", file=sys.stderr)
+        raise
+
+    class _App(BaseApplication):
+        def load_config(self):
+            self.cfg.set("bind", f"{host}:{port}")
+            self.cfg.set("workers", workers)
+            self.cfg.set("threads", threads)
+            self.cfg.set("worker_class", "gthread")
+            self.cfg.set("keepalive", 5)
+
+        def load(self):
+            return application
+
+    _App().run()
+
+
+def run_waitress(host: str, port: int, threads: int) -> None:
+    try:
+        import waitress  # type: ignore
+    except Exception:
+        print("serve --server waitress requires the 'waitress' package. Install with: pip install waitress", file=sys.stderr)
+        raise
+    waitress.serve(application, host=host, port=port, threads=threads)
+
+
+def run_werkzeug(host: str, port: int) -> None:
+    from werkzeug.serving import run_simple
+
+    run_simple(host, port, application, threaded=True, use_reloader=False, use_debugger=False)
+
+
+def pick_server() -> str:
+    for name in ("gunicorn", "waitress"):
+        try:
+            __import__(name)
+            return name
+        except Exception:
+            continue
+    return "werkzeug"
+
+
+def main(argv=None) -> None:
+    ap = argparse.ArgumentParser(description="Serve the Capitol League site and API in production mode")
+    ap.add_argument("--host", default=DEFAULT_HOST)
+    ap.add_argument("--port", type=int, default=DEFAULT_PORT)
+    ap.add_argument("--workers", type=int, default=DEFAULT_WORKERS, help="worker processes (gunicorn)")
+    ap.add_argument("--threads", type=int, default=DEFAULT_THREADS, help="threads per worker")
+    ap.add_argument("--server", choices=("auto", "gunicorn", "waitress", "werkzeug"), default="auto")
+    ap.add_argument("--no-precompress", action="store_true", help="skip writing .gz/.br variants at startup")
+    ap.add_argument("--precompress-only", action="store_true", help="write .gz/.br variants and exit")
+    args = ap.parse_args(argv)
+
+    if not args.no_precompress or args.precompress_only:
+        n = precompress(ROOT)
+        print(f"serve: precompressed {n} file(s)")
+        if args.precompress_only:
+            return
+
+    server = pick_server() if args.server == "auto" else args.server
+    if server == "werkzeug":
+        print(
+            "serve: neither gunicorn nor waitress is installed; falling back to a single-process "
+            "threaded werkzeug server (pip install gunicorn)",
+            file=sys.stderr,
+        )
+    elif server == "waitress" and args.workers > 1:
+        print(f"serve: waitress is single-process; using {args.threads} threads, ignoring --workers", file=sys.stderr)
+    print(f"serve: {server} on http://{args.host}:{args.port} workers={args.workers} threads={args.threads}")
+
+    if server == "gunicorn":
+        run_gunicorn(args.host, args.port, args.workers, args.threads)
+    elif server == "waitress":
+        run_waitress(args.host, args.port, args.threads)
+    else:
+        run_werkzeug(args.host, args.port)
+
+
+if __name__ == "__main__":
+    main()
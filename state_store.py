@@ -0,0 +1,465 @@
+"""
+state_store.py
+
+SQLite-backed store for the master state (data/master_state.db).
+
+build_master_data.py upserts rows here instead of rewriting one big JSON
+document, and build_vote_web.py / build_bill_web.py look single votes and
+bills up by primary key instead of loading and scanning everything.
+export_state() still produces the master_state.json document the static site
+reads; export_document() is the same document with vote lists left as lazy
+iterators, for streaming it out with json_stream.write_json.
+
+Tables:
+  votes         one row per vote (id primary key), the vote dict as JSON plus
+                indexed chamber / congress / session / roll / date columns
+  party_totals  (vote_id, party) -> yea / nay / present / notVoting
+  source_status one row per source key ("house.clerk", "govtrack.senate", ...)
+  raw_payloads  side store for source payloads (GovTrack's API object, the
+                vote's "raw" key): zlib-compressed JSON keyed by vote id, only
+                read by get_raw() and never exported to master_state.json
+  bills         one row per bill id ("hr1808-117"), the bill dict as JSON
+  windows       per-chamber fromDate / toDate of the last refresh
+  meta          everything else in master_state.json (params, league, cards);
+                keys starting with "_" are the store's own bookkeeping and
+                are not exported
+  vote_keys     reconciliation map: roll key ("house/119/1/262") or source id
+                alias ("id:<GovTrack id>") -> the stored vote id for that roll
+"""
+
+from __future__ import annotations
+
+import sqlite3
+import zlib
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+import jsonio
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS votes (
+    id       TEXT PRIMARY KEY,
+    chamber  TEXT NOT NULL,
+    congress INTEGER,
+    session  TEXT,
+    roll     INTEGER,
+    date     TEXT,
+    source   TEXT,
+    data     TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS votes_chamber_date ON votes (chamber, date);
+CREATE INDEX IF NOT EXISTS votes_roll ON votes (chamber, congress, session, roll);
+
+CREATE TABLE IF NOT EXISTS party_totals (
+    vote_id    TEXT NOT NULL REFERENCES votes (id) ON DELETE CASCADE,
+    party      TEXT NOT NULL,
+    yea        INTEGER NOT NULL DEFAULT 0,
+    nay        INTEGER NOT NULL DEFAULT 0,
+    present    INTEGER NOT NULL DEFAULT 0,
+    not_voting INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (vote_id, party)
+);
+
+CREATE TABLE IF NOT EXISTS raw_payloads (
+    vote_id TEXT PRIMARY KEY,
+    source  TEXT,
+    data    BLOB NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS source_status (
+    key          TEXT PRIMARY KEY,
+    name         TEXT,
+    domain       TEXT,
+    url          TEXT,
+    priority     INTEGER,
+    last_attempt TEXT,
+    last_status  TEXT,
+    last_success TEXT
+);
+
+CREATE TABLE IF NOT EXISTS bills (
+    id       TEXT PRIMARY KEY,
+    congress INTEGER,
+    chamber  TEXT,
+    data     TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS bills_congress ON bills (congress, chamber);
+
+CREATE TABLE IF NOT EXISTS windows (
+    chamber   TEXT PRIMARY KEY,
+    from_date TEXT,
+    to_date   TEXT
+);
+
+CREATE TABLE IF NOT EXISTS meta (
+    key   TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS vote_keys (
+    key     TEXT PRIMARY KEY,
+    vote_id TEXT NOT NULL
+);
+"""
+
+CHAMBERS = ("house", "senate")
+
+RAW_KEY = "raw"  # vote key holding the untouched source payload
+
+_STATUS_FIELDS = (
+    ("name", "name"),
+    ("domain", "domain"),
+    ("url", "url"),
+    ("priority", "priority"),
+    ("lastAttempt", "last_attempt"),
+    ("lastStatus", "last_status"),
+    ("lastSuccess", "last_success"),
+)
+
+
+def vote_sort_date(vote: Dict[str, Any]) -> str:
+    """
+    The timestamp votes are ordered by (newest first) in master_state.json,
+    normalized so the official "date" and GovTrack's "created" compare
+    consistently: "YYYY-MM-DDTHH:MM:SS", date-only values at midnight, zone
+    suffixes and fractions dropped.
+    """
+    text = vote.get("date") or vote.get("created") or ""
+    if len(text) == 19 and text[10] == "T":
+        return text
+    text = str(text).strip().replace(" ", "T", 1)
+    if len(text) == 10:
+        return text + "T00:00:00"
+    return text[:19]
+
+
+def _int_or_none(value: Any) -> Optional[int]:
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return None
+
+
+class StateStore:
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.conn = sqlite3.connect(str(self.path))
+        self.conn.execute("PRAGMA foreign_keys = ON")
+        self.conn.execute("PRAGMA journal_mode = WAL")
+        self.conn.executescript(SCHEMA)
+
+    def close(self) -> None:
+        self.conn.commit()
+        self.conn.close()
+
+    def __enter__(self) -> "StateStore":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def is_empty(self) -> bool:
+        row = self.conn.execute(
+            "SELECT (SELECT COUNT(*) FROM votes) + (SELECT COUNT(*) FROM meta)"
+        ).fetchone()
+        return not row[0]
+
+    # --- votes ------------------------------------------------------------
+
+    def upsert_votes(self, votes: Iterable[Dict[str, Any]]) -> int:
+        """Insert or replace votes by id (new wins over old). Returns rows written."""
+        n = 0
+        with self.conn:
+            for v in votes:
+                vid = v.get("id")
+                if vid is None:
+                    continue
+                vid = str(vid)
+                body = {k: val for k, val in v.items() if k not in ("totalsByParty", RAW_KEY)}
+                if v.get(RAW_KEY) is not None:
+                    self.conn.execute(
+                        "INSERT OR REPLACE INTO raw_payloads (vote_id, source, data) VALUES (?, ?, ?)",
+                        (vid, v.get("source"), zlib.compress(jsonio.dumpb(v[RAW_KEY]), 6)),
+                    )
+                self.conn.execute(
+                    "INSERT INTO votes (id, chamber, congress, session, roll, date, source, data) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?, ?) "
+                    "ON CONFLICT (id) DO UPDATE SET chamber = excluded.chamber, "
+                    "congress = excluded.congress, session = excluded.session, roll = excluded.roll, "
+                    "date = excluded.date, source = excluded.source, data = excluded.data",
+                    (
+                        vid,
+                        str(v.get("chamber") or ""),
+                        _int_or_none(v.get("congress")),
+                        v.get("session"),
+                        _int_or_none(v.get("rollNumber") or v.get("roll") or v.get("number")),
+                        vote_sort_date(v),
+                        v.get("source"),
+                        jsonio.dumps(body),
+                    ),
+                )
+                self.conn.execute("DELETE FROM party_totals WHERE vote_id = ?", (vid,))
+                self.conn.executemany(
+                    "INSERT OR REPLACE INTO party_totals (vote_id, party, yea, nay, present, not_voting) "
+                    "VALUES (?, ?, ?, ?, ?, ?)",
+                    [
+                        (
+                            vid,
+                            p.get("party") or "Unknown",
+                            p.get("yea") or 0,
+                            p.get("nay") or 0,
+                            p.get("present") or 0,
+                            p.get("notVoting") or 0,
+                        )
+                        for p in v.get("totalsByParty") or []
+                    ],
+                )
+                n += 1
+        return n
+
+    def _party_totals(self, vote_ids: List[str]) -> Dict[str, List[Dict[str, Any]]]:
+        out: Dict[str, List[Dict[str, Any]]] = {}
+        for i in range(0, len(vote_ids), 500):
+            chunk = vote_ids[i : i + 500]
+            rows = self.conn.execute(
+                "SELECT vote_id, party, yea, nay, present, not_voting FROM party_totals "
+                f"WHERE vote_id IN ({','.join('?' * len(chunk))}) ORDER BY vote_id, rowid",
+                chunk,
+            )
+            for vid, party, yea, nay, present, nv in rows:
+                out.setdefault(vid, []).append(
+                    {"party": party, "yea": yea, "nay": nay, "present": present, "notVoting": nv}
+                )
+        return out
+
+    def _rows_to_votes(self, rows: List[Tuple[str, str]]) -> List[Dict[str, Any]]:
+        totals = self._party_totals([vid for vid, _ in rows])
+        votes = []
+        for vid, data in rows:
+            v = jsonio.loads(data)
+            if vid in totals:
+                v["totalsByParty"] = totals[vid]
+            votes.append(v)
+        return votes
+
+    def get_vote(self, vote_id: Any) -> Optional[Dict[str, Any]]:
+        """Primary-key lookup (B-tree, O(log n))."""
+        rows = self.conn.execute("SELECT id, data FROM votes WHERE id = ?", (str(vote_id),)).fetchall()
+        return self._rows_to_votes(rows)[0] if rows else None
+
+    def get_raw(self, vote_id: Any) -> Optional[Any]:
+        """The source payload stored for a vote (e.g. GovTrack's API object), or None."""
+        row = self.conn.execute("SELECT data FROM raw_payloads WHERE vote_id = ?", (str(vote_id),)).fetchone()
+        return jsonio.loads(zlib.decompress(row[0])) if row else None
+
+    def find_roll(
+        self, chamber: str, congress: int, roll: int, session: Optional[str] = None
+    ) -> Optional[Dict[str, Any]]:
+        """Indexed lookup by roll number; the newest session wins when `session` is None."""
+        sql = "SELECT id, data FROM votes WHERE chamber = ? AND congress = ? AND roll = ?"
+        params: Tuple[Any, ...] = (chamber, congress, roll)
+        if session is not None:
+            sql += " AND session = ?"
+            params += (session,)
+        rows = self.conn.execute(sql + " ORDER BY date DESC LIMIT 1", params).fetchall()
+        return self._rows_to_votes(rows)[0] if rows else None
+
+    def stream_votes(self, chamber: str, limit: Optional[int] = None, batch: int = 500) -> Iterator[Dict[str, Any]]:
+        """Votes for one chamber, newest first, decoded `batch` rows at a time."""
+        sql = "SELECT id, data FROM votes WHERE chamber = ? ORDER BY date DESC, id"
+        params: Tuple[Any, ...] = (chamber,)
+        if limit is not None:
+            sql += " LIMIT ?"
+            params += (limit,)
+        cur = self.conn.execute(sql, params)
+        while True:
+            rows = cur.fetchmany(batch)
+            if not rows:
+                return
+            yield from self._rows_to_votes(rows)
+
+    def votes_for_chamber(self, chamber: str, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        """Votes for one chamber, newest first."""
+        return list(self.stream_votes(chamber, limit))
+
+    def iter_votes(self) -> Iterator[Dict[str, Any]]:
+        for chamber in CHAMBERS:
+            yield from self.stream_votes(chamber)
+
+    def count_votes(self, chamber: str) -> int:
+        return self.conn.execute("SELECT COUNT(*) FROM votes WHERE chamber = ?", (chamber,)).fetchone()[0]
+
+    # --- cross-source reconciliation ---------------------------------------
+
+    def get_vote_keys(self, keys: Iterable[str]) -> Dict[str, str]:
+        """{key: vote id} for the given roll keys / aliases that are mapped."""
+        keys = list(dict.fromkeys(keys))
+        out: Dict[str, str] = {}
+        for i in range(0, len(keys), 500):
+            chunk = keys[i : i + 500]
+            out.update(
+                self.conn.execute(
+                    f"SELECT key, vote_id FROM vote_keys WHERE key IN ({','.join('?' * len(chunk))})", chunk
+                ).fetchall()
+            )
+        return out
+
+    def set_vote_keys(self, mapping: Dict[str, str]) -> None:
+        with self.conn:
+            self.conn.executemany(
+                "INSERT OR REPLACE INTO vote_keys (key, vote_id) VALUES (?, ?)", list(mapping.items())
+            )
+
+    def retired_vote_ids(self) -> List[str]:
+        """Ids retire_votes() merged into another record and that aren't stored again."""
+        return [
+            row[0]
+            for row in self.conn.execute(
+                "SELECT substr(key, 4) AS old FROM vote_keys WHERE key LIKE 'id:%' AND old != vote_id "
+                "AND old NOT IN (SELECT id FROM votes)"
+            )
+        ]
+
+    def retire_votes(self, replaced: Dict[str, str]) -> int:
+        """
+        Drop votes that were merged into another record ({old id: new id}):
+        the old row and its party totals go, its raw payload moves to the new
+        id unless that already has one, and "id:<old>" maps to the new id.
+        """
+        n = 0
+        with self.conn:
+            for old, new in replaced.items():
+                if old == new:
+                    continue
+                self.conn.execute("UPDATE OR IGNORE raw_payloads SET vote_id = ? WHERE vote_id = ?", (new, old))
+                self.conn.execute("DELETE FROM raw_payloads WHERE vote_id = ?", (old,))
+                n += self.conn.execute("DELETE FROM votes WHERE id = ?", (old,)).rowcount
+                self.conn.execute(
+                    "INSERT OR REPLACE INTO vote_keys (key, vote_id) VALUES (?, ?)", (f"id:{old}", new)
+                )
+                self.conn.execute("UPDATE vote_keys SET vote_id = ? WHERE vote_id = ?", (new, old))
+        return n
+
+    # --- per-chamber refresh window ----------------------------------------
+
+    def set_window(self, chamber: str, from_date: Optional[str], to_date: Optional[str]) -> None:
+        with self.conn:
+            self.conn.execute(
+                "INSERT OR REPLACE INTO windows (chamber, from_date, to_date) VALUES (?, ?, ?)",
+                (chamber, from_date, to_date),
+            )
+
+    def get_window(self, chamber: str) -> Tuple[Optional[str], Optional[str]]:
+        row = self.conn.execute("SELECT from_date, to_date FROM windows WHERE chamber = ?", (chamber,)).fetchone()
+        return (row[0], row[1]) if row else (None, None)
+
+    # --- source status ------------------------------------------------------
+
+    def get_source_status(self, key: str) -> Optional[Dict[str, Any]]:
+        cols = ", ".join(col for _, col in _STATUS_FIELDS)
+        row = self.conn.execute(f"SELECT {cols} FROM source_status WHERE key = ?", (key,)).fetchone()
+        if row is None:
+            return None
+        return {field: value for (field, _), value in zip(_STATUS_FIELDS, row)}
+
+    def put_source_status(self, key: str, status: Dict[str, Any]) -> None:
+        cols = ", ".join(col for _, col in _STATUS_FIELDS)
+        with self.conn:
+            self.conn.execute(
+                f"INSERT OR REPLACE INTO source_status (key, {cols}) VALUES (?{', ?' * len(_STATUS_FIELDS)})",
+                (key, *(status.get(field) for field, _ in _STATUS_FIELDS)),
+            )
+
+    def source_statuses(self) -> Dict[str, Dict[str, Any]]:
+        keys = [r[0] for r in self.conn.execute("SELECT key FROM source_status ORDER BY key")]
+        return {k: self.get_source_status(k) for k in keys}  # type: ignore[misc]
+
+    # --- bills --------------------------------------------------------------
+
+    def upsert_bills(self, bills: Dict[str, Dict[str, Any]]) -> None:
+        with self.conn:
+            self.conn.executemany(
+                "INSERT OR REPLACE INTO bills (id, congress, chamber, data) VALUES (?, ?, ?, ?)",
+                [
+                    (bid, _int_or_none(b.get("congress")), b.get("chamber"), jsonio.dumps(b))
+                    for bid, b in bills.items()
+                ],
+            )
+
+    def get_bill(self, bill_id: str) -> Optional[Dict[str, Any]]:
+        row = self.conn.execute("SELECT data FROM bills WHERE id = ?", (bill_id,)).fetchone()
+        return jsonio.loads(row[0]) if row else None
+
+    def all_bills(self) -> Dict[str, Dict[str, Any]]:
+        return {bid: jsonio.loads(data) for bid, data in self.conn.execute("SELECT id, data FROM bills ORDER BY id")}
+
+    # --- everything else ----------------------------------------------------
+
+    def set_meta(self, key: str, value: Any) -> None:
+        with self.conn:
+            self.conn.execute(
+                "INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)", (key, jsonio.dumps(value))
+            )
+
+    def get_meta(self, key: str, default: Any = None) -> Any:
+        row = self.conn.execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+        return jsonio.loads(row[0]) if row else default
+
+    # --- master_state.json import / export ---------------------------------
+
+    def import_state(self, state: Dict[str, Any]) -> None:
+        """Load an existing master_state.json document (one-time migration)."""
+        for chamber, section in (state.get("votes") or {}).items():
+            if not isinstance(section, dict):
+                continue
+            self.upsert_votes(section.get("votes") or [])
+            self.set_window(chamber, section.get("fromDate"), section.get("toDate"))
+        for key, status in ((state.get("sourceMeta") or {}).get("votes") or {}).items():
+            self.put_source_status(key, status)
+        if isinstance(state.get("bills"), dict):
+            self.upsert_bills(state["bills"])
+        for key, value in state.items():
+            if key not in ("votes", "sourceMeta", "bills"):
+                self.set_meta(key, value)
+
+    def export_document(self, vote_limit: Optional[int] = None) -> Dict[str, Any]:
+        """
+        The master_state.json document with each chamber's "votes" left as a
+        lazy iterator over the database, for json_stream.write_json.
+        """
+        state: Dict[str, Any] = {"generatedAt": self.get_meta("generatedAt")}
+        state["params"] = self.get_meta("params", {})
+        votes: Dict[str, Any] = {}
+        for chamber in CHAMBERS:
+            from_d, to_d = self.get_window(chamber)
+            count = self.count_votes(chamber)
+            if vote_limit is not None:
+                count = min(count, vote_limit)
+            votes[chamber] = {
+                "fromDate": from_d,
+                "toDate": to_d,
+                "count": count,
+                "votes": self.stream_votes(chamber, vote_limit),
+            }
+        state["votes"] = votes
+        state["sourceMeta"] = {"votes": self.source_statuses()}
+        bills = self.all_bills()
+        if bills:
+            state["bills"] = bills
+        for (key,) in self.conn.execute("SELECT key FROM meta ORDER BY rowid"):
+            if key not in state and not key.startswith("_"):
+                state[key] = self.get_meta(key)
+        state.setdefault("league", {})
+        state.setdefault("cards", {})
+        return state
+
+    def export_state(self, vote_limit: Optional[int] = None) -> Dict[str, Any]:
+        """
+        Rebuild the master_state.json document: newest `vote_limit` votes per
+        chamber, source status, bills and the remaining top-level sections.
+        """
+        state = self.export_document(vote_limit)
+        for section in state["votes"].values():
+            section["votes"] = list(section["votes"])
+        return state
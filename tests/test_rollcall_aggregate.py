@@ -0,0 +1,47 @@
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+sys.path.insert(0, str(ROOT / "scripts"))
+
+import capitol_league_rollcall_aggregate as agg  # noqa: E402
+import jsonio  # noqa: E402
+from fake_sources import house_roll_xml  # noqa: E402
+
+YEAR = 2020
+ROLLS = 5
+
+
+def fake_get(down=()):
+    def http_get(url, timeout=15.0, limiter=None):
+        for num in range(1, ROLLS + 1):
+            if url == agg.HOUSE_URL.format(year=YEAR, num=num):
+                return None if num in down else house_roll_xml(YEAR, num, ROLLS)
+        return None  # past the last roll, and no Senate menus
+
+    return http_get
+
+
+def run(monkeypatch, tmp_path, out, *extra, down=()):
+    monkeypatch.setattr(agg, "http_get", fake_get(down))
+    monkeypatch.setattr(sys, "argv", [
+        "agg", "--house-years", str(YEAR), "--congress", "116", "--workers", "1",
+        "--cache-dir", str(tmp_path / "cache"), "--state", str(tmp_path / "state.json"),
+        "-o", str(out), *extra,
+    ])
+    agg.main()
+    return out.read_text()
+
+
+def test_incremental_retries_a_roll_that_failed_before_a_later_success(monkeypatch, tmp_path):
+    full = run(monkeypatch, tmp_path, tmp_path / "full.csv")
+
+    run(monkeypatch, tmp_path, tmp_path / "gap.csv", down={3})
+    state = jsonio.load_file(tmp_path / "state.json")["partitions"][f"house:{YEAR}"]
+    assert state["mark"] == ROLLS
+    assert state["failed"] == [3]
+
+    assert run(monkeypatch, tmp_path, tmp_path / "incremental.csv", "--incremental") == full
+    state = jsonio.load_file(tmp_path / "state.json")["partitions"][f"house:{YEAR}"]
+    assert state["failed"] == []
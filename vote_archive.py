@@ -0,0 +1,197 @@
+"""
+vote_archive.py
+
+Partitioned vote history on disk, so the full history build_master_data.py
+collects (not just the newest VOTE_CAP_PER_CHAMBER in master_state.json) is
+published without one ever-growing file:
+
+  data/votes/house/119-1.json    one file per chamber / congress / session
+  data/votes/senate/119-1.json
+  data/votes/hot.json            newest votes per chamber, for the live UI
+  data/votes/manifest.json       partitions with counts, date range, sha256
+
+Clients read the manifest and fetch only the partitions they need. A rebuild
+merges the store's votes into the partitions already on disk (the store may
+be a fresh one seeded from the capped master_state.json), so history is only
+dropped for votes the store retired. Every partition is serialized but only
+files whose checksum changed are rewritten.
+"""
+
+from __future__ import annotations
+
+import hashlib
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+import jsonio
+from state_store import vote_sort_date
+
+MANIFEST_VERSION = 1
+HOT_VOTES_PER_CHAMBER = 50
+
+PartitionKey = Tuple[str, int, int]  # (chamber, congress, session)
+
+
+def _year_of(vote: Dict[str, Any]) -> Optional[int]:
+    text = str(vote.get("date") or vote.get("created") or "")[:4]
+    return int(text) if text.isdigit() else None
+
+
+def partition_key(vote: Dict[str, Any]) -> Optional[PartitionKey]:
+    """
+    (chamber, congress, session number) for a vote. Session labels like
+    "1st" / "1" are used as given; anything else (GovTrack's "2025") falls
+    back to the congress/session the vote's year belongs to.
+    """
+    chamber = str(vote.get("chamber") or "").lower()
+    if not chamber:
+        return None
+    year = _year_of(vote)
+    congress = vote.get("congress")
+    try:
+        congress = int(congress)
+    except (TypeError, ValueError):
+        congress = (year - 1789) // 2 + 1 if year else None
+    digits = "".join(ch for ch in str(vote.get("session") or "")[:2] if ch.isdigit())
+    if digits in ("1", "2", "3"):
+        session = int(digits)
+    elif year:
+        session = (year - 1789) % 2 + 1
+    else:
+        return None
+    if congress is None:
+        return None
+    return chamber, congress, session
+
+
+def partition_path(key: PartitionKey) -> str:
+    chamber, congress, session = key
+    return f"{chamber}/{congress}-{session}.json"
+
+
+def _newest_first(votes: Iterable[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Newest first by vote_sort_date, ties by id, like the store's own order."""
+    rows = sorted(votes, key=lambda v: str(v.get("id")))
+    rows.sort(key=vote_sort_date, reverse=True)
+    return rows
+
+
+def _encode(doc: Dict[str, Any]) -> bytes:
+    return jsonio.dumpb(doc)
+
+
+def _write_if_changed(path: Path, data: bytes, old_sha: Optional[str]) -> Tuple[str, bool]:
+    sha = hashlib.sha256(data).hexdigest()
+    if sha == old_sha and path.exists():
+        return sha, False
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_suffix(".tmp")
+    tmp.write_bytes(data)
+    tmp.replace(path)
+    return sha, True
+
+
+def load_manifest(root: Path) -> Dict[str, Any]:
+    try:
+        return jsonio.load_file(Path(root) / "manifest.json")
+    except (OSError, ValueError):
+        return {"version": MANIFEST_VERSION, "partitions": []}
+
+
+def load_partition(root: Path, chamber: str, congress: int, session: int) -> List[Dict[str, Any]]:
+    path = Path(root) / partition_path((chamber, congress, session))
+    if not path.exists():
+        return []
+    return jsonio.load_file(path).get("votes", [])
+
+
+def write_archive(
+    votes: Iterable[Dict[str, Any]],
+    root: Path,
+    generated_at: Optional[str] = None,
+    hot_per_chamber: int = HOT_VOTES_PER_CHAMBER,
+    retired: Iterable[str] = (),
+) -> Dict[str, int]:
+    """
+    Merge votes into the partition files already on disk and write them, the
+    hot window file and the manifest. Archived votes are kept unless the
+    same id is in `votes` (which wins, wherever it is partitioned now) or in
+    `retired` (ids the store merged into another record). Returns
+    {"written", "unchanged", "removed", "votes", "skipped"} counts
+    (partitions, except votes / skipped votes without a partition).
+    """
+    root = Path(root)
+    old_manifest = load_manifest(root)
+    old = {p["path"]: p for p in old_manifest.get("partitions", [])}
+
+    parts: Dict[PartitionKey, List[Dict[str, Any]]] = {}
+    seen = set(retired)
+    skipped = 0
+    for v in votes:
+        key = partition_key(v)
+        if key is None:
+            skipped += 1
+            continue
+        parts.setdefault(key, []).append(v)
+        seen.add(v.get("id"))
+
+    for p in old.values():
+        key = (p["chamber"], p["congress"], p["session"])
+        try:
+            archived = load_partition(root, *key)
+        except (OSError, ValueError):
+            continue
+        kept = [v for v in archived if v.get("id") not in seen]
+        if kept:
+            parts.setdefault(key, []).extend(kept)
+
+    stats = {"written": 0, "unchanged": 0, "removed": 0, "votes": 0, "skipped": skipped}
+    entries: List[Dict[str, Any]] = []
+    newest: Dict[str, List[Dict[str, Any]]] = {}
+    for key in sorted(parts):
+        chamber, congress, session = key
+        rows = _newest_first(parts[key])
+        rel = partition_path(key)
+        data = _encode({"chamber": chamber, "congress": congress, "session": session, "count": len(rows), "votes": rows})
+        sha, wrote = _write_if_changed(root / rel, data, old.get(rel, {}).get("sha256"))
+        stats["written" if wrote else "unchanged"] += 1
+        stats["votes"] += len(rows)
+        dates = [str(v.get("date") or v.get("created") or "")[:10] for v in rows]
+        dates = [d for d in dates if d]
+        entries.append(
+            {
+                "chamber": chamber,
+                "congress": congress,
+                "session": session,
+                "path": rel,
+                "count": len(rows),
+                "fromDate": min(dates) if dates else None,
+                "toDate": max(dates) if dates else None,
+                "bytes": len(data),
+                "sha256": sha,
+            }
+        )
+        newest.setdefault(chamber, []).extend(rows[:hot_per_chamber])
+
+    for rel in set(old) - {e["path"] for e in entries}:
+        try:
+            (root / rel).unlink()
+            stats["removed"] += 1
+        except OSError:
+            pass
+
+    hot = {
+        chamber: _newest_first(rows)[:hot_per_chamber]
+        for chamber, rows in sorted(newest.items())
+    }
+    hot_data = _encode({"generatedAt": generated_at, "votes": hot})
+    hot_sha, _ = _write_if_changed(root / "hot.json", hot_data, old_manifest.get("hot", {}).get("sha256"))
+
+    manifest = {
+        "version": MANIFEST_VERSION,
+        "generatedAt": generated_at,
+        "hot": {"path": "hot.json", "count": sum(len(r) for r in hot.values()), "sha256": hot_sha},
+        "partitions": entries,
+    }
+    _write_if_changed(root / "manifest.json", _encode(manifest), None)
+    return stats
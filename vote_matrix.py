@@ -0,0 +1,166 @@
+"""
+vote_matrix.py
+
+Compact per-member position matrix built by capitol_league_rollcall_aggregate
+(--matrix-dir). Rows are roll calls, columns are members, cells are int8
+position codes, so new KPIs are column/row reductions instead of another
+download + parse of every roll.
+
+Files in the matrix directory:
+  positions.npy      int8 [rolls x members]  (memory-mapped on load)
+  rolls.npy          str  [rolls]    "house:2025:262", "senate:119_1:15"
+  roll_dates.npy     datetime64[D] [rolls]
+  members.npy        str  [members]  Bioguide ids
+  member_party.npy   str  [members]  last party seen ("R", "D", "I", ...)
+
+Requires numpy (pip install numpy).
+"""
+
+from __future__ import annotations
+
+import datetime as dt
+import sys
+from pathlib import Path
+from typing import Dict, Iterable, List, NamedTuple, Optional, Tuple
+
+try:
+    import numpy as np  # type: ignore
+except Exception:
+    print("vote_matrix requires the 'numpy' package. Install with: pip install numpy", file=sys.stderr)
+    raise
+
+ABSENT = 0  # not on this roll (not serving / other chamber)
+YEA = 1
+NAY = 2
+PRESENT = 3
+NOT_VOTING = 4
+OTHER = 5  # e.g. a name in a Speaker election
+
+POSITION_CODES = {
+    "yea": YEA,
+    "aye": YEA,
+    "yes": YEA,
+    "guilty": YEA,
+    "nay": NAY,
+    "no": NAY,
+    "not guilty": NAY,
+    "present": PRESENT,
+    "not voting": NOT_VOTING,
+    "absent": NOT_VOTING,
+    "present not voting": NOT_VOTING,
+}
+
+FILES = ("positions", "rolls", "roll_dates", "members", "member_party")
+
+
+def position_code(text: Optional[str]) -> int:
+    if not text:
+        return OTHER
+    return POSITION_CODES.get(text.strip().lower(), OTHER)
+
+
+class RollRow(NamedTuple):
+    roll_id: str
+    date: Optional[str]  # ISO yyyy-mm-dd
+    positions: List[Tuple[str, Optional[str]]]  # (bioguide, position text)
+    parties: Dict[str, str]
+
+
+class VoteMatrix:
+    def __init__(self, positions, rolls, roll_dates, members, member_party):
+        self.positions = positions
+        self.rolls = rolls
+        self.roll_dates = roll_dates
+        self.members = members
+        self.member_party = member_party
+        self._col: Dict[str, int] = {m: i for i, m in enumerate(members.tolist())}
+
+    @classmethod
+    def empty(cls) -> "VoteMatrix":
+        return cls(
+            np.zeros((0, 0), dtype=np.int8),
+            np.array([], dtype=str),
+            np.array([], dtype="datetime64[D]"),
+            np.array([], dtype=str),
+            np.array([], dtype=str),
+        )
+
+    @classmethod
+    def load(cls, directory: Path, mmap: bool = True) -> "VoteMatrix":
+        directory = Path(directory)
+        if not (directory / "positions.npy").exists():
+            return cls.empty()
+        arrays = {
+            name: np.load(directory / f"{name}.npy", mmap_mode="r" if mmap and name == "positions" else None)
+            for name in FILES
+        }
+        return cls(**arrays)
+
+    def save(self, directory: Path) -> None:
+        directory = Path(directory)
+        directory.mkdir(parents=True, exist_ok=True)
+        for name in FILES:
+            tmp = directory / f"{name}.tmp.npy"
+            np.save(tmp, np.asarray(getattr(self, name)))
+            tmp.replace(directory / f"{name}.npy")
+
+    @property
+    def shape(self) -> Tuple[int, int]:
+        return tuple(self.positions.shape)  # type: ignore[return-value]
+
+    def column(self, bioguide: str) -> Optional[int]:
+        return self._col.get(bioguide)
+
+    def append(self, rows: Iterable[RollRow]) -> "VoteMatrix":
+        """Return a new matrix with rows added (rolls already present are replaced)."""
+        rows = list(rows)
+        if not rows:
+            return self
+        members = self.members.tolist()
+        col = dict(self._col)
+        party = self.member_party.tolist()
+        for row in rows:
+            for gid, _pos in row.positions:
+                if gid not in col:
+                    col[gid] = len(members)
+                    members.append(gid)
+                    party.append("")
+            for gid, p in row.parties.items():
+                if gid in col and p:
+                    party[col[gid]] = p
+
+        keep = np.ones(len(self.rolls), dtype=bool)
+        new_ids = {r.roll_id for r in rows}
+        if new_ids and len(self.rolls):
+            keep = ~np.isin(self.rolls, list(new_ids))
+
+        n_old = int(keep.sum())
+        out = np.zeros((n_old + len(rows), len(members)), dtype=np.int8)
+        out[:n_old, : self.positions.shape[1]] = np.asarray(self.positions)[keep]
+        for i, row in enumerate(rows, start=n_old):
+            for gid, pos in row.positions:
+                out[i, col[gid]] = position_code(pos)
+
+        dates = [np.datetime64(r.date) if r.date else np.datetime64("NaT") for r in rows]
+        return VoteMatrix(
+            out,
+            np.concatenate([self.rolls[keep].astype(str), np.array([r.roll_id for r in rows], dtype=str)]),
+            np.concatenate([self.roll_dates[keep], np.array(dates, dtype="datetime64[D]")]),
+            np.array(members, dtype=str),
+            np.array(party, dtype=str),
+        )
+
+    # --- reductions -------------------------------------------------------
+
+    def chamber_mask(self, chamber: str):
+        return np.char.startswith(self.rolls.astype(str), f"{chamber}:")
+
+    def member_totals(self, row_mask=None):
+        """(total_votes, missed_votes) per member column, over the selected rows."""
+        pos = np.asarray(self.positions if row_mask is None else self.positions[row_mask])
+        on_roll = pos != ABSENT
+        return on_roll.sum(axis=0), (pos == NOT_VOTING).sum(axis=0)
+
+    def rows_between(self, start: dt.date, end: dt.date):
+        lo, hi = np.datetime64(start), np.datetime64(end)
+        return (self.roll_dates >= lo) & (self.roll_dates <= hi)